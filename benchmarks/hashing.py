@@ -0,0 +1,80 @@
+"""
+Benchmark of the Current Ids Hashers
+===========================================
+
+This measures the per-step overhead of rehashing the current ids of a :class:`~neuraxle.data_container.DataContainer`
+with :class:`~neuraxle.base.HashlibMd5Hasher`, and with the vectorized :class:`~neuraxle.base.NumpySplitMix64Hasher`.
+
+Run it with ``python -m benchmarks.hashing``.
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+..
+    Thanks to Umaneo Technologies Inc. for their contributions to this Machine Learning
+    project, visit https://www.umaneo.com/ for more information on Umaneo Technologies Inc.
+
+"""
+import timeit
+
+import numpy as np
+
+from neuraxle.base import HashlibMd5Hasher, NumpySplitMix64Hasher
+from neuraxle.data_container import LazyCurrentIds
+from neuraxle.hyperparams.space import HyperparameterSamples
+
+DEFAULT_SIZES = (10000, 1000000, 10000000)
+HYPERPARAMS = HyperparameterSamples({'learning_rate': 0.01, 'n_components': 4})
+N_REPEATS = 3
+
+
+def time_one_step(hasher, current_ids, data_inputs) -> float:
+    """
+    Time one rehash of the current ids, like the one done in :func:`~neuraxle.base.BaseStep._did_process`.
+    The lazy current ids of :class:`~neuraxle.base.HashlibMd5Hasher` are materialized, since they are only hashed then.
+    It returns the best of a few runs, so that the first run warms up the caches.
+
+    :param hasher: hasher to benchmark
+    :param current_ids: current ids already hashed by a previous step
+    :param data_inputs: data inputs
+    :return: best duration in seconds
+    """
+    def rehash():
+        hashed_ids = hasher.hash(current_ids, HYPERPARAMS, data_inputs)
+        if isinstance(hashed_ids, LazyCurrentIds):
+            hashed_ids.materialize()
+
+    return min(timeit.repeat(rehash, number=1, repeat=N_REPEATS))
+
+
+def main(sizes=DEFAULT_SIZES):
+    print('{0:>10} | {1:>20} | {2:>20} | {3:>8}'.format('rows', 'HashlibMd5Hasher (s)', 'NumpySplitMix64 (s)', 'speedup'))
+    for size in sizes:
+        data_inputs = np.zeros((size, 1), dtype=np.float32)
+
+        md5_hasher = HashlibMd5Hasher()
+        md5_ids = md5_hasher.hash(None, HYPERPARAMS, data_inputs)
+        md5_duration = time_one_step(md5_hasher, md5_ids, data_inputs)
+
+        vectorized_hasher = NumpySplitMix64Hasher()
+        vectorized_ids = vectorized_hasher.hash(None, HYPERPARAMS, data_inputs)
+        vectorized_duration = time_one_step(vectorized_hasher, vectorized_ids, data_inputs)
+
+        print('{0:>10} | {1:>20.4f} | {2:>20.4f} | {3:>7.1f}x'.format(
+            size, md5_duration, vectorized_duration, md5_duration / vectorized_duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of the Hash-Free Pipeline Execution
+=============================================
+
+This measures a 10-step numpy :class:`~neuraxle.pipeline.Pipeline` transform with ``hashing=True``,
+where every step rehashes the current ids and the summary id, and with ``hashing=False``, where no step hashes anything.
+
+Run it with ``python -m benchmarks.pipeline_hashing``.
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+..
+    Thanks to Umaneo Technologies Inc. for their contributions to this Machine Learning
+    project, visit https://www.umaneo.com/ for more information on Umaneo Technologies Inc.
+
+"""
+import time
+
+import numpy as np
+
+from neuraxle.pipeline import Pipeline
+from neuraxle.steps.numpy import MultiplyByN, AddN
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+N_STEPS = 10
+N_REPEATS = 3
+
+
+def create_pipeline(hashing: bool) -> Pipeline:
+    """
+    Create a pipeline of cheap numpy steps, so that the hashing overhead dominates.
+
+    :param hashing: hashing mode of the pipeline
+    :return: pipeline
+    """
+    steps = [('step_{}'.format(i), MultiplyByN(2) if i % 2 == 0 else AddN(1)) for i in range(N_STEPS)]
+    return Pipeline(steps, hashing=hashing)
+
+
+def time_transform(p: Pipeline, data_inputs) -> float:
+    """
+    Time the best of a few pipeline transforms.
+
+    :param p: pipeline to benchmark
+    :param data_inputs: data inputs
+    :return: duration in seconds
+    """
+    durations = []
+    for _ in range(N_REPEATS):
+        start = time.perf_counter()
+        p.transform(data_inputs)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(sizes=DEFAULT_SIZES):
+    print('{0:>10} | {1:>16} | {2:>17} | {3:>8}'.format('rows', 'hashing=True (s)', 'hashing=False (s)', 'speedup'))
+    for size in sizes:
+        data_inputs = np.ones((size, 1), dtype=np.float32)
+
+        hashing_duration = time_transform(create_pipeline(hashing=True), data_inputs)
+        hash_free_duration = time_transform(create_pipeline(hashing=False), data_inputs)
+
+        print('{0:>10} | {1:>16.4f} | {2:>17.4f} | {3:>7.1f}x'.format(
+            size, hashing_duration, hash_free_duration, hashing_duration / hash_free_duration))
+
+
+if __name__ == "__main__":
+    main()
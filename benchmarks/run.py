@@ -0,0 +1,207 @@
+"""
+Benchmark Suite Runner
+===========================================
+
+Run the benchmarks of :mod:`benchmarks.suite`, and compare them to the recorded baselines :
+
+.. code-block:: bash
+
+    python -m benchmarks.run                          # compare to benchmarks/baselines.json
+    python -m benchmarks.run --save                   # record new baselines
+    python -m benchmarks.run --filter checkpoint      # only run the checkpoint benchmarks
+
+The runner exits with a non-zero status when a benchmark is slower than its baseline times the tolerance,
+and by more than a millisecond, so that the noise of the sub millisecond benchmarks isn't reported as a regression.
+The baselines are machine dependent: they are only compared to the results of the same environment
+(Python and numpy versions, machine and number of CPUs). Record them again on the machine that runs the comparison.
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+..
+    Thanks to Umaneo Technologies Inc. for their contributions to this Machine Learning
+    project, visit https://www.umaneo.com/ for more information on Umaneo Technologies Inc.
+
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+from benchmarks.suite import BENCHMARKS
+
+DEFAULT_BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+DEFAULT_TOLERANCE = 1.5
+DEFAULT_MIN_REGRESSION_SECONDS = 0.001
+
+
+def time_benchmark(benchmark: Callable, n_repeats: int) -> float:
+    """
+    Setup the benchmark in a temporary folder, and return the best duration of a few repeats.
+    The timed function is called once before timing it when it is repeated, to warm up the caches.
+
+    :param benchmark: benchmark function of :mod:`benchmarks.suite`
+    :param n_repeats: number of timed repeats
+    :return: best duration in seconds
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        timed_function = benchmark(tmpdir)
+        if n_repeats > 1:
+            timed_function()
+
+        durations = []
+        for _ in range(n_repeats):
+            start = time.perf_counter()
+            timed_function()
+            durations.append(time.perf_counter() - start)
+        return min(durations)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def run(name_filter: str = None) -> Dict[str, float]:
+    """
+    Run the benchmarks.
+
+    :param name_filter: only run the benchmarks containing this string
+    :return: duration in seconds of each benchmark
+    """
+    results = OrderedDict()
+    for name, (benchmark, n_repeats) in BENCHMARKS.items():
+        if name_filter is not None and name_filter not in name:
+            continue
+        results[name] = time_benchmark(benchmark, n_repeats)
+    return results
+
+
+def get_environment() -> Dict[str, Any]:
+    return OrderedDict([
+        ('python', platform.python_version()),
+        ('numpy', np.__version__),
+        ('machine', platform.machine()),
+        ('processor', platform.processor()),
+        ('cpu_count', os.cpu_count())
+    ])
+
+
+def _is_same_environment(environment: Dict[str, Any], other_environment: Dict[str, Any]) -> bool:
+    def comparable(env):
+        return (
+            env.get('python', '').split('.')[:2],
+            env.get('numpy', '').split('.')[:2],
+            env.get('machine'),
+            env.get('cpu_count')
+        )
+
+    return comparable(environment) == comparable(other_environment)
+
+
+def load_baselines(path: str) -> Dict[str, float]:
+    """
+    Load the baselines recorded in the current environment.
+    The baselines recorded in another environment are ignored, since their durations can't be compared.
+
+    :param path: path of the baselines json file
+    :return: baseline duration of each benchmark
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        baselines = json.load(file)
+
+    if not _is_same_environment(baselines.get('environment', {}), get_environment()):
+        print('Ignoring the baselines of {0}, recorded in another environment: {1}'.format(
+            path, json.dumps(baselines.get('environment'))))
+        return {}
+    return baselines['benchmarks']
+
+
+def save_baselines(path: str, results: Dict[str, float]):
+    baselines = OrderedDict([
+        ('environment', get_environment()),
+        ('benchmarks', OrderedDict((name, round(duration, 6)) for name, duration in results.items()))
+    ])
+    with open(path, 'w') as file:
+        json.dump(baselines, file, indent=4)
+        file.write('\n')
+
+
+def compare(
+        results: Dict[str, float],
+        baselines: Dict[str, float],
+        tolerance: float,
+        min_regression_seconds: float = DEFAULT_MIN_REGRESSION_SECONDS
+) -> bool:
+    """
+    Print the results next to the baselines.
+
+    :param results: duration of each benchmark
+    :param baselines: baseline duration of each benchmark
+    :param tolerance: maximum ratio of the duration over the baseline duration
+    :param min_regression_seconds: minimum difference in seconds between the duration and the baseline duration to report a regression
+    :return: True if no benchmark regressed
+    """
+    no_regression = True
+    print('{0:<45} | {1:>12} | {2:>12} | {3:>7}'.format('benchmark', 'duration (s)', 'baseline (s)', 'ratio'))
+    for name, duration in results.items():
+        if name not in baselines:
+            print('{0:<45} | {1:>12.4f} | {2:>12} | {3:>7}'.format(name, duration, '-', '-'))
+            continue
+
+        ratio = duration / baselines[name]
+        regressed = ratio > tolerance and duration - baselines[name] > min_regression_seconds
+        no_regression = no_regression and not regressed
+        print('{0:<45} | {1:>12.4f} | {2:>12.4f} | {3:>6.2f}x{4}'.format(
+            name, duration, baselines[name], ratio, '  REGRESSION' if regressed else ''))
+
+    return no_regression
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the Neuraxle benchmark suite.')
+    parser.add_argument('--baselines', default=DEFAULT_BASELINES_PATH, help='path of the baselines json file')
+    parser.add_argument('--save', action='store_true', help='record the results as the new baselines')
+    parser.add_argument('--filter', default=None, help='only run the benchmarks containing this string')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='maximum ratio of a duration over its baseline before it is reported as a regression')
+    parser.add_argument('--min-regression-seconds', type=float, default=DEFAULT_MIN_REGRESSION_SECONDS,
+                        help='minimum difference in seconds between a duration and its baseline to report a regression')
+    args = parser.parse_args(argv)
+
+    results = run(name_filter=args.filter)
+
+    if args.save:
+        # the baselines of another environment are dropped, so that the saved environment describes all of them.
+        baselines = load_baselines(args.baselines)
+        baselines.update(results)
+        save_baselines(args.baselines, baselines)
+        print('Saved {0} baselines to {1}'.format(len(results), args.baselines))
+        return 0
+
+    no_regression = compare(results, load_baselines(args.baselines), args.tolerance, args.min_regression_seconds)
+    return 0 if no_regression else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""
+Benchmark Suite of the Core Execution Paths
+============================================
+
+Reproducible synthetic workloads for the core execution paths of Neuraxle.
+Each benchmark is a function that does its setup in the given temporary folder,
+and returns the function to time. The variants of a benchmark are the same function with other parameters. Run them with ``python -m benchmarks.run``.
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+..
+    Thanks to Umaneo Technologies Inc. for their contributions to this Machine Learning
+    project, visit https://www.umaneo.com/ for more information on Umaneo Technologies Inc.
+
+"""
+import copy
+import os
+import tempfile
+from collections import OrderedDict
+from functools import partial
+from typing import Callable
+
+import numpy as np
+
+from neuraxle.base import BaseStep, NonFittableMixin, ExecutionContext
+from neuraxle.checkpoints import DefaultCheckpoint
+from neuraxle.data_container import DataContainer
+from neuraxle.hyperparams.distributions import RandInt
+from neuraxle.hyperparams.space import HyperparameterSpace
+from neuraxle.metaopt.auto_ml import RandomSearch, HyperparamsJSONRepository
+from neuraxle.metaopt.random import ValidationSplitWrapper
+from neuraxle.pipeline import Pipeline, MiniBatchSequentialPipeline, Joiner, ResumablePipeline
+from neuraxle.steps.caching import PickleValueCachingWrapper
+from neuraxle.steps.flow import ChooseOneStepOf
+from neuraxle.steps.loop import ForEachDataInput, StepClonerForEachDataInput
+from neuraxle.steps.numpy import MultiplyByN, AddN, fuse_elementwise_steps
+from neuraxle.union import FeatureUnion
+
+SEED = 42
+N_STEPS = 10
+N_SINGLE_ROW_CALLS = 1000
+N_SMALL_BATCHES = 100
+
+
+class SlowSquare(NonFittableMixin, BaseStep):
+    """
+    Step doing a bit of numpy work on each data input, so that the caching paths have something to save.
+    """
+
+    def __init__(self):
+        BaseStep.__init__(self)
+        NonFittableMixin.__init__(self)
+
+    def transform(self, data_inputs):
+        return [np.square(np.asarray(data_input)).sum() for data_input in data_inputs]
+
+
+def create_data(n_rows: int, n_features: int = 10) -> np.ndarray:
+    return np.random.RandomState(SEED).rand(n_rows, n_features)
+
+
+def _create_numpy_steps(n_steps: int = N_STEPS):
+    return [('step_{}'.format(i), MultiplyByN(2) if i % 2 == 0 else AddN(1)) for i in range(n_steps)]
+
+
+def pipeline_transform(tmpdir: str, n_rows: int, hashing: bool = False, fused: bool = False) -> Callable:
+    p = Pipeline(_create_numpy_steps(), cache_folder=tmpdir, hashing=hashing)
+    if fused:
+        p = fuse_elementwise_steps(p)
+    data_inputs = create_data(n_rows)
+    return lambda: p.transform(data_inputs)
+
+
+def pipeline_transform_single_row(tmpdir: str, frozen: bool = False) -> Callable:
+    p = Pipeline(_create_numpy_steps(), cache_folder=tmpdir)
+    transform = p.freeze() if frozen else p.transform
+    data_input = create_data(1)
+
+    def run():
+        for _ in range(N_SINGLE_ROW_CALLS):
+            transform(data_input)
+
+    return run
+
+
+def minibatch_joiner(tmpdir: str, n_rows: int, as_list: bool = False) -> Callable:
+    p = MiniBatchSequentialPipeline(_create_numpy_steps(4) + [Joiner(batch_size=1000)])
+    data_inputs = create_data(n_rows)
+    if as_list:
+        data_inputs = list(data_inputs)
+    return lambda: p.transform(data_inputs)
+
+
+def feature_union(tmpdir: str, backend: str) -> Callable:
+    p = Pipeline([
+        FeatureUnion([
+            ('branch_{}'.format(i), Pipeline(_create_numpy_steps(3))) for i in range(4)
+        ], n_jobs=2, backend=backend)
+    ])
+    data_inputs = create_data(100000)
+    return lambda: p.transform(data_inputs)
+
+
+def feature_union_small_batches(tmpdir: str, tear_down_after_each_call: bool) -> Callable:
+    union = FeatureUnion([
+        ('branch_{}'.format(i), Pipeline(_create_numpy_steps(2))) for i in range(4)
+    ], n_jobs=2, backend='threading')
+    p = Pipeline([union])
+    data_inputs = create_data(10)
+
+    def run():
+        for _ in range(N_SMALL_BATCHES):
+            p.transform(data_inputs)
+            if tear_down_after_each_call:
+                union.teardown()
+
+    return run
+
+
+def feature_union_minibatch_fit_transform(tmpdir: str) -> Callable:
+    p = MiniBatchSequentialPipeline([
+        FeatureUnion([
+            ('branch_{}'.format(i), Pipeline(_create_numpy_steps(2))) for i in range(4)
+        ], n_jobs=2, backend='threading'),
+        Joiner(batch_size=10)
+    ])
+    data_inputs = create_data(10 * N_SMALL_BATCHES)
+    return lambda: p.fit_transform(data_inputs, data_inputs)
+
+
+def choose_one_step_of_8_choices(tmpdir: str) -> Callable:
+    p = Pipeline([
+        ChooseOneStepOf([
+            ('choice_{}'.format(i), Pipeline(_create_numpy_steps(2))) for i in range(8)
+        ])
+    ])
+    data_inputs = create_data(10)
+
+    def run():
+        for _ in range(N_SMALL_BATCHES):
+            p.transform(data_inputs)
+
+    return run
+
+
+def for_each_data_input(tmpdir: str, n_jobs: int = 1, backend: str = 'threading') -> Callable:
+    p = Pipeline([
+        ForEachDataInput(Pipeline(_create_numpy_steps(2)), n_jobs=n_jobs, backend=backend, batch_size=25)
+    ], cache_folder=tmpdir)
+    data_inputs = [create_data(100) for _ in range(100)]
+    return lambda: p.transform(data_inputs)
+
+
+def step_cloner_fit(tmpdir: str, copy_op: Callable = None) -> Callable:
+    p = Pipeline([StepClonerForEachDataInput(Pipeline(_create_numpy_steps(N_STEPS)), copy_op=copy_op)])
+    data_inputs = [create_data(10) for _ in range(1000)]
+    return lambda: p.fit(data_inputs)
+
+
+def value_caching(tmpdir: str, hit: bool) -> Callable:
+    p = Pipeline([PickleValueCachingWrapper(SlowSquare(), os.path.join(tmpdir, 'value_caching'))], cache_folder=tmpdir)
+    data_inputs = list(create_data(200))
+    if hit:
+        p.fit_transform(data_inputs, data_inputs)
+        return lambda: p.transform(data_inputs)
+    # fit_transform flushes the cache, so every data input is a miss.
+    return lambda: p.fit_transform(data_inputs, data_inputs)
+
+
+def _checkpoint_pipeline(tmpdir: str) -> ResumablePipeline:
+    return ResumablePipeline([
+        ('multiply', MultiplyByN(2)),
+        ('checkpoint', DefaultCheckpoint()),
+        ('add', AddN(1))
+    ], cache_folder=os.path.join(tmpdir, 'checkpoints'))
+
+
+def checkpoint(tmpdir: str, read: bool) -> Callable:
+    p = _checkpoint_pipeline(tmpdir)
+    data_inputs = create_data(1000)
+    if read:
+        p.fit_transform(data_inputs, data_inputs)
+        return lambda: p.transform(data_inputs)
+    return lambda: p.fit_transform(data_inputs, data_inputs)
+
+
+def checkpoint_should_resume(tmpdir: str) -> Callable:
+    p = _checkpoint_pipeline(tmpdir)
+    data_inputs = create_data(1000)
+    p.fit_transform(data_inputs, data_inputs)
+    context = ExecutionContext(root=p.cache_folder)
+
+    def should_resume():
+        data_container = p.hash_data_container(DataContainer(current_ids=None, data_inputs=data_inputs))
+        return p.should_resume(data_container, context)
+
+    return should_resume
+
+
+def automl_json_repository(tmpdir: str, n_trials: int) -> Callable:
+    data_inputs = np.array(range(100))
+    expected_outputs = np.array(range(100, 200))
+    hyperparameter_space = HyperparameterSpace({
+        'multiplication_1__multiply_by': RandInt(1, 3),
+        'multiplication_2__multiply_by': RandInt(1, 3)
+    })
+
+    def fit():
+        np.random.seed(SEED)
+        repository_folder = tempfile.mkdtemp(dir=tmpdir)
+        pipeline = Pipeline([
+            ('multiplication_1', MultiplyByN()),
+            ('multiplication_2', MultiplyByN())
+        ], cache_folder=tmpdir).set_hyperparams_space(hyperparameter_space)
+        auto_ml = RandomSearch(
+            pipeline,
+            validation_technique=ValidationSplitWrapper(test_size=0.2),
+            hyperparams_repository=HyperparamsJSONRepository(repository_folder),
+            n_iter=n_trials
+        )
+        return auto_ml.fit(data_inputs, expected_outputs)
+
+    return fit
+
+
+# name: (benchmark called with the temporary folder, number of timed repeats)
+BENCHMARKS = OrderedDict([
+    ('pipeline_transform_per_step', (partial(pipeline_transform, n_rows=1000), 20)),
+    ('pipeline_transform_per_step_with_hashing', (partial(pipeline_transform, n_rows=1000, hashing=True), 20)),
+    ('pipeline_transform_elementwise_steps', (partial(pipeline_transform, n_rows=100000), 5)),
+    ('pipeline_transform_fused_elementwise_steps', (partial(pipeline_transform, n_rows=100000, fused=True), 5)),
+    ('pipeline_transform_single_row', (pipeline_transform_single_row, 5)),
+    ('frozen_pipeline_transform_single_row', (partial(pipeline_transform_single_row, frozen=True), 5)),
+    ('minibatch_joiner_numpy', (partial(minibatch_joiner, n_rows=100000), 5)),
+    ('minibatch_joiner_list', (partial(minibatch_joiner, n_rows=10000, as_list=True), 5)),
+    ('feature_union_threading', (partial(feature_union, backend='threading'), 5)),
+    ('feature_union_loky', (partial(feature_union, backend='loky'), 3)),
+    ('feature_union_small_batches_persistent_pool',
+     (partial(feature_union_small_batches, tear_down_after_each_call=False), 3)),
+    ('feature_union_small_batches_pool_per_call',
+     (partial(feature_union_small_batches, tear_down_after_each_call=True), 3)),
+    ('feature_union_minibatch_fit_transform', (feature_union_minibatch_fit_transform, 3)),
+    ('choose_one_step_of_8_choices', (choose_one_step_of_8_choices, 3)),
+    ('for_each_data_input', (for_each_data_input, 5)),
+    ('for_each_data_input_threading', (partial(for_each_data_input, n_jobs=2, backend='threading'), 5)),
+    ('step_cloner_fit_pickled_template', (step_cloner_fit, 3)),
+    ('step_cloner_fit_deepcopy', (partial(step_cloner_fit, copy_op=copy.deepcopy), 3)),
+    ('value_caching_miss', (partial(value_caching, hit=False), 3)),
+    ('value_caching_hit', (partial(value_caching, hit=True), 3)),
+    ('checkpoint_save', (partial(checkpoint, read=False), 3)),
+    ('checkpoint_read', (partial(checkpoint, read=True), 3)),
+    ('checkpoint_should_resume', (checkpoint_should_resume, 20)),
+    ('automl_json_repository_10_trials', (partial(automl_json_repository, n_trials=10), 1)),
+    ('automl_json_repository_100_trials', (partial(automl_json_repository, n_trials=100), 1)),
+    ('automl_json_repository_1000_trials', (partial(automl_json_repository, n_trials=1000), 1)),
+])
@@ -28,6 +28,8 @@ import hashlib
 import inspect
 import os
 import pprint
+import sys
+import time
 import warnings
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -35,11 +37,11 @@ from copy import copy
 from enum import Enum
 from typing import Tuple, List, Union, Any, Iterable, KeysView, ItemsView, ValuesView, Callable
 
-from joblib import dump, load
-from sklearn.base import BaseEstimator
+import numpy as np
 
-from neuraxle.data_container import DataContainer
+from neuraxle.data_container import DataContainer, LazyCurrentIds
 from neuraxle.hyperparams.space import HyperparameterSpace, HyperparameterSamples
+from neuraxle.profiling import Profiler, ProfilingToken
 
 DEFAULT_CACHE_FOLDER = os.path.join(os.getcwd(), 'cache')
 
@@ -127,6 +129,10 @@ class HashlibMd5Hasher(BaseHasher):
         Hash :class:`DataContainer`.current_ids, data inputs, and hyperparameters together
         using  `hashlib.md5 <https://docs.python.org/3/library/hashlib.html>`_
 
+        The hashing is lazy : only the hyperparameters digest is computed here, and appended to the
+        :class:`~neuraxle.data_container.LazyCurrentIds` chain. The md5 of each current id is computed
+        the first time the current ids are read.
+
         :param current_ids: current hashed ids (can be None if this function has not been called yet)
         :type current_ids: List[str]
         :param hyperparameters: step hyperparameters to hash with current ids
@@ -134,13 +140,13 @@ class HashlibMd5Hasher(BaseHasher):
         :param data_inputs: data inputs to hash current ids for
         :type data_inputs: Iterable
         :return: the new hashed current ids
-        :rtype: List[str]
+        :rtype: LazyCurrentIds
         """
         if current_ids is None:
             if isinstance(data_inputs, Iterable):
-                current_ids = [str(i) for i in range(len(data_inputs))]
+                current_ids = LazyCurrentIds(range(len(data_inputs)))
             else:
-                current_ids = [str(0)]
+                current_ids = LazyCurrentIds(range(1))
 
         if len(hyperparameters) == 0:
             return current_ids
@@ -148,14 +154,142 @@ class HashlibMd5Hasher(BaseHasher):
         hyperperams_dict = hyperparameters.to_flat_as_dict_primitive()
         current_hyperparameters_hash = hashlib.md5(str.encode(str(hyperperams_dict))).hexdigest()
 
-        new_current_ids = []
-        for current_id in current_ids:
-            m = hashlib.md5()
-            m.update(str.encode(current_id))
-            m.update(str.encode(current_hyperparameters_hash))
-            new_current_ids.append(m.hexdigest())
+        if not isinstance(current_ids, LazyCurrentIds):
+            current_ids = LazyCurrentIds(current_ids)
+
+        return current_ids.rehash(current_hyperparameters_hash)
+
+
+class NumpySplitMix64Hasher(BaseHasher):
+    """
+    Class to hash hyperparamters, and data input ids together in a single vectorized pass with numpy.
+
+    Each current id is represented as a fixed-width ``np.uint64`` digest. The hyperparameters are hashed once per call
+    with md5 into a 64 bits key, and the key is mixed into all of the current ids at once with the
+    `splitmix64 <http://prng.di.unimi.it/splitmix64.c>`_ finalizer. This avoids creating one ``hashlib.md5`` object per
+    data input for every step, which is what :class:`HashlibMd5Hasher` does.
+
+    The hashed current ids are returned as a ``np.ndarray`` of ``np.uint64``. They can still be used as checkpoint
+    file names because ``str(current_id)`` is a stable decimal representation.
+
+    Example usage :
+
+    .. code-block:: python
+
+        p = Pipeline([
+            SomeStep(),
+            SomeStep()
+        ])
+        p.apply('set_hashers', [NumpySplitMix64Hasher()])
+
+    .. seealso::
+        :class`BaseHasher`,
+        :class`HashlibMd5Hasher`,
+        :class:`DataContainer`
+
+    """
+
+    def single_hash(self, current_id: str, hyperparameters: HyperparameterSamples) -> str:
+        """
+        Hash summary id, and hyperparameters together.
+
+        :param current_id: current hashed id
+        :param hyperparameters: step hyperparameters to hash with current ids
+        :type hyperparameters: HyperparameterSamples
+        :return: the new hashed current id
+        :rtype: str
+        """
+        current_ids = self._to_uint64_ids([current_id], data_inputs=None)
+        new_current_ids = self._mix(current_ids, self._hash_hyperparameters(hyperparameters))
+
+        return '{0:016x}'.format(int(new_current_ids[0]))
+
+    def hash(self, current_ids, hyperparameters: HyperparameterSamples, data_inputs: Any = None) -> np.ndarray:
+        """
+        Hash :class:`DataContainer`.current_ids, data inputs, and hyperparameters together in one vectorized pass.
+
+        :param current_ids: current hashed ids (can be None if this function has not been called yet)
+        :type current_ids: Iterable
+        :param hyperparameters: step hyperparameters to hash with current ids
+        :type hyperparameters: HyperparameterSamples
+        :param data_inputs: data inputs to hash current ids for
+        :type data_inputs: Iterable
+        :return: the new hashed current ids
+        :rtype: np.ndarray
+        """
+        current_ids = self._to_uint64_ids(current_ids, data_inputs)
+
+        if len(hyperparameters) == 0:
+            return current_ids
+
+        return self._mix(current_ids, self._hash_hyperparameters(hyperparameters))
+
+    def _hash_hyperparameters(self, hyperparameters: HyperparameterSamples) -> np.uint64:
+        """
+        Hash the hyperparameters into a 64 bits key using the first 8 bytes of their md5 digest.
+
+        :param hyperparameters: step hyperparameters
+        :type hyperparameters: HyperparameterSamples
+        :return: 64 bits key
+        :rtype: np.uint64
+        """
+        digest = hashlib.md5(str.encode(str(hyperparameters.to_flat_as_dict_primitive()))).digest()
+        return np.uint64(int.from_bytes(digest[:8], byteorder='little'))
+
+    def _to_uint64_ids(self, current_ids, data_inputs) -> np.ndarray:
+        """
+        Convert current ids to an array of fixed-width ``np.uint64`` digests.
+        Integer arrays are converted without copying when possible,
+        and any other id is folded into 64 bits with the first 8 bytes of the md5 digest of ``str(current_id)``.
+
+        :param current_ids: current ids (can be None if no step has hashed them yet)
+        :param data_inputs: data inputs used to count the number of ids to create
+        :return: current ids as uint64 digests
+        :rtype: np.ndarray
+        """
+        if current_ids is None:
+            if isinstance(data_inputs, Iterable):
+                return np.arange(len(data_inputs), dtype=np.uint64)
+            return np.zeros(1, dtype=np.uint64)
+
+        if isinstance(current_ids, LazyCurrentIds) and len(current_ids.digests) == 0 \
+                and isinstance(current_ids.base_ids, range):
+            return np.asarray(current_ids.base_ids, dtype=np.uint64)
+
+        if isinstance(current_ids, np.ndarray) and np.issubdtype(current_ids.dtype, np.integer):
+            return current_ids.astype(np.uint64, copy=False)
+
+        return np.fromiter(
+            (
+                int.from_bytes(hashlib.md5(str.encode(str(current_id))).digest()[:8], byteorder='little')
+                for current_id in current_ids
+            ),
+            dtype=np.uint64,
+            count=len(current_ids)
+        )
+
+    def _mix(self, current_ids: np.ndarray, key: np.uint64) -> np.ndarray:
+        """
+        Mix the key into every current id with the splitmix64 finalizer. All operations wrap around modulo 2**64.
+
+        :param current_ids: current ids as uint64 digests
+        :param key: hyperparameters key
+        :return: new current ids as uint64 digests
+        :rtype: np.ndarray
+        """
+        x = np.bitwise_xor(current_ids, key)
+        x += _SPLITMIX64_GAMMA
+        x ^= x >> np.uint64(30)
+        x *= _SPLITMIX64_MUL_1
+        x ^= x >> np.uint64(27)
+        x *= _SPLITMIX64_MUL_2
+        x ^= x >> np.uint64(31)
+        return x
+
 
-        return new_current_ids
+_SPLITMIX64_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX64_MUL_1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX64_MUL_2 = np.uint64(0x94D049BB133111EB)
 
 
 class BaseSaver(ABC):
@@ -261,6 +395,8 @@ class JoblibStepSaver(BaseSaver):
         :type context: ExecutionContext
         :return:
         """
+        from joblib import dump
+
         context.mkdir()
 
         path = self._create_step_path(context, step)
@@ -278,6 +414,8 @@ class JoblibStepSaver(BaseSaver):
         :type context: ExecutionContext
         :return:
         """
+        from joblib import load
+
         loaded_step = load(self._create_step_path(context, step))
 
         # we need to keep the current steps in memory because they have been deleted before saving...
@@ -307,6 +445,11 @@ class ExecutionContext:
         * :func:`~neuraxle.steps.caching.ValueCachingWrapper.handle_transform`
         * :func:`~neuraxle.steps.caching.ValueCachingWrapper.handle_fit_transform`
 
+    When ``hashing`` is False, the steps don't rehash the current ids, and the summary id in :func:`~neuraxle.base.BaseStep._did_process`.
+    This is only safe when no step reads the current ids (e.g.: no :class:`~neuraxle.checkpoints.Checkpoint`).
+
+    When a :class:`~neuraxle.profiling.Profiler` is given, the handler methods of each step record their measures in it.
+
     .. seealso::
         :class:`BaseStep`,
         :class:`ValueCachingWrapper`
@@ -317,7 +460,9 @@ class ExecutionContext:
             root: str = DEFAULT_CACHE_FOLDER,
             execution_mode: ExecutionMode = None,
             stripped_saver: BaseSaver = None,
-            parents=None
+            parents=None,
+            hashing: bool = True,
+            profiler: Profiler = None
     ):
         if execution_mode is None:
             execution_mode = ExecutionMode.FIT_OR_FIT_TRANSFORM_OR_TRANSFORM
@@ -331,6 +476,8 @@ class ExecutionContext:
         if parents is None:
             parents = []
         self.parents: List[BaseStep] = parents
+        self.hashing: bool = hashing
+        self.profiler: Profiler = profiler
 
     def get_execution_mode(self) -> ExecutionMode:
         return self.execution_mode
@@ -390,10 +537,86 @@ class ExecutionContext:
         :return: self
         :rtype: ExecutionContext
         """
-        return ExecutionContext(root=self.root, execution_mode=self.execution_mode, parents=self.parents + [step])
+        return ExecutionContext(
+            root=self.root,
+            execution_mode=self.execution_mode,
+            parents=self.parents + [step],
+            hashing=self.hashing,
+            profiler=self.profiler
+        )
 
     def copy(self):
-        return ExecutionContext(root=self.root, execution_mode=self.execution_mode, parents=copy(self.parents))
+        return ExecutionContext(
+            root=self.root,
+            execution_mode=self.execution_mode,
+            parents=copy(self.parents),
+            hashing=self.hashing,
+            profiler=self.profiler
+        )
+
+    def strip(self) -> 'ExecutionContext':
+        """
+        Copy the execution context for another process: the parent steps are replaced by empty steps
+        of the same names, so that :func:`get_path` is unchanged, without pickling the parents with every call.
+        The profiler is dropped, since the measures of another process would be recorded in a copy of it.
+
+        :return: stripped execution context
+        :rtype: ExecutionContext
+        """
+        return ExecutionContext(
+            root=self.root,
+            execution_mode=self.execution_mode,
+            parents=[Identity(name=parent.name) for parent in self.parents],
+            hashing=self.hashing
+        )
+
+    def start_profiling(self, step: 'BaseStep', data_container: DataContainer) -> ProfilingToken:
+        """
+        Start profiling a handler method of the given step, if a profiler is set.
+
+        :param step: step that is about to be executed in this context
+        :type step: BaseStep
+        :param data_container: data container received by the step
+        :type data_container: DataContainer
+        :return: profiling token, or None if there is no profiler
+        :rtype: ProfilingToken
+        """
+        if self.profiler is None:
+            return None
+        return self.profiler.start(self._get_step_path(step), data_container)
+
+    def stop_profiling(self, token: ProfilingToken, data_container: DataContainer = None):
+        """
+        Stop profiling a handler method started with :func:`~neuraxle.base.ExecutionContext.start_profiling`.
+        Call it in a ``finally`` block, so that the step is popped from the profiler even if it raises.
+
+        :param token: profiling token
+        :type token: ProfilingToken
+        :param data_container: data container returned by the step
+        :type data_container: DataContainer
+        :return:
+        """
+        if token is not None:
+            self.profiler.stop(token, data_container)
+
+    def add_hashing_time(self, step: 'BaseStep', seconds: float):
+        """
+        Record the time spent hashing the data container of the given step, if a profiler is set.
+
+        :param step: step that hashed the data container
+        :type step: BaseStep
+        :param seconds: hashing duration
+        :type seconds: float
+        :return:
+        """
+        if self.profiler is not None:
+            self.profiler.add_hashing_time(self._get_step_path(step), seconds)
+
+    def _get_step_path(self, step: 'BaseStep') -> str:
+        names = self.get_names()
+        if len(self.parents) == 0 or self.peek() is not step:
+            names.append(step.name)
+        return os.path.join(*names)
 
     def peek(self) -> 'BaseStep':
         """
@@ -677,6 +900,27 @@ class BaseStep(ABC):
         self.savers: List[BaseSaver] = savers
         return self
 
+    def set_hashers(self, hashers: List[BaseHasher]) -> 'BaseStep':
+        """
+        Set the hashers used to rehash the current ids, and the summary id of a pipeline step.
+
+        Example :
+
+        .. code-block:: python
+
+            pipeline.apply('set_hashers', [NumpySplitMix64Hasher()])
+
+        :param hashers: step hashers
+        :type hashers: List[BaseHasher]
+        :return: self
+        :rtype: BaseStep
+
+        .. seealso::
+            :class:`BaseHasher`
+        """
+        self.hashers: List[BaseHasher] = hashers
+        return self
+
     def set_hyperparams(self, hyperparams: HyperparameterSamples) -> 'BaseStep':
         """
         Set the step hyperparameters.
@@ -894,10 +1138,14 @@ class BaseStep(ABC):
             :class:`DataContainer`,
             :class:`neuraxle.pipeline.Pipeline`
         """
-        data_container, context = self._will_process(data_container, context)
-        data_container, context = self._will_fit(data_container, context)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            data_container, context = self._will_process(data_container, context)
+            data_container, context = self._will_fit(data_container, context)
 
-        new_self = self._fit_data_container(data_container, context)
+            new_self = self._fit_data_container(data_container, context)
+        finally:
+            context.stop_profiling(profiling_token)
 
         return new_self
 
@@ -910,13 +1158,17 @@ class BaseStep(ABC):
         :param context: execution context
         :return: tuple(fitted pipeline, data_container)
         """
-        data_container, context = self._will_process(data_container, context)
-        data_container, context = self._will_fit_transform(data_container, context)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            data_container, context = self._will_process(data_container, context)
+            data_container, context = self._will_fit_transform(data_container, context)
 
-        new_self, data_container = self._fit_transform_data_container(data_container, context)
+            new_self, data_container = self._fit_transform_data_container(data_container, context)
 
-        data_container = self._did_fit_transform(data_container, context)
-        data_container = self._did_process(data_container, context)
+            data_container = self._did_fit_transform(data_container, context)
+            data_container = self._did_process(data_container, context)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return new_self, data_container
 
@@ -929,13 +1181,17 @@ class BaseStep(ABC):
         :param context: execution context
         :return: transformed data container
         """
-        data_container, context = self._will_process(data_container, context)
-        data_container, context = self._will_transform_data_container(data_container, context)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            data_container, context = self._will_process(data_container, context)
+            data_container, context = self._will_transform_data_container(data_container, context)
 
-        data_container = self._transform_data_container(data_container, context)
+            data_container = self._transform_data_container(data_container, context)
 
-        data_container = self._did_transform(data_container, context)
-        data_container = self._did_process(data_container, context)
+            data_container = self._did_transform(data_container, context)
+            data_container = self._did_process(data_container, context)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return data_container
 
@@ -1035,13 +1291,17 @@ class BaseStep(ABC):
     def _did_process(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
         """
         Apply side effects after any step method.
+        Rehash the data container, unless hashing is disabled in the execution context.
 
         :param data_container: data container
         :param context: execution context
         :return: (data container, execution context)
         :rtype: (DataContainer, ExecutionContext)
         """
-        data_container = self.hash_data_container(data_container)
+        if context.hashing:
+            start = time.perf_counter()
+            data_container = self.hash_data_container(data_container)
+            context.add_hashing_time(self, time.perf_counter() - start)
         return data_container
 
     def _did_transform(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
@@ -1376,7 +1636,39 @@ class BaseStep(ABC):
 
         return self
 
+    def freeze(self) -> Callable:
+        """
+        Compile the fitted step into a plain transform callable for inference.
+        The callable takes the data inputs, and returns the transformed data inputs:
+        it doesn't create any execution context, data container, or hash the current ids.
+
+        .. code-block:: python
+
+            p = Pipeline([MultiplyByN(2), AddN(1)])
+            p = p.fit(data_inputs, expected_outputs)
+            frozen = p.freeze()
+            outputs = frozen(data_inputs)
+
+        The frozen callable holds references to the fitted steps, so refit a step and freeze it again to update it.
+        Steps that override their transform handler methods (e.g.: ``_transform_data_container``) are frozen
+        in a :class:`FrozenStep` that calls :func:`~BaseStep.handle_transform`, because their ``transform``
+        method can behave differently.
+
+        :return: transform callable
+        :rtype: Callable
+
+        .. seealso::
+            :class:`FrozenStep`,
+            :class:`~neuraxle.pipeline.FrozenPipeline`,
+            :class:`~neuraxle.union.FrozenFeatureUnion`
+        """
+        if _has_default_transform_handlers(self):
+            return self.transform
+        return FrozenStep(self)
+
     def tosklearn(self):
+        from sklearn.base import BaseEstimator
+
         class NeuraxleToSKLearnPipelineWrapper(BaseEstimator):
             def __init__(self, neuraxle_step):
                 self.p: Union[BaseStep, TruncableSteps] = neuraxle_step
@@ -1795,6 +2087,52 @@ class MetaStepMixin:
 NamedTupleList = List[Union[Tuple[str, 'BaseStep'], 'BaseStep']]
 
 
+def _has_default_transform_handlers(step: BaseStep) -> bool:
+    """
+    Returns True if the step transforms with the transform handler methods of :class:`BaseStep`,
+    which only call its ``transform`` method.
+
+    :param step: step
+    :return: if the handler methods of the step are the ones of :class:`BaseStep`
+    """
+    step_class = step.__class__
+    return all(
+        getattr(step_class, method_name) is getattr(BaseStep, method_name)
+        for method_name in (
+            'handle_transform',
+            '_will_transform_data_container',
+            '_transform_data_container',
+            '_did_transform'
+        )
+    )
+
+
+class FrozenStep:
+    """
+    Frozen transform callable of a step that can only be transformed with its handler methods
+    (e.g.: :class:`ForceAlwaysHandleMixin`, or :class:`~neuraxle.steps.flow.ForceMustHandleMixin`).
+    Each call transforms the data inputs with :func:`~BaseStep.handle_transform` in a transform execution context,
+    without hashing the current ids.
+
+    .. seealso::
+        :func:`~BaseStep.freeze`
+    """
+
+    def __init__(self, step: 'BaseStep', root: str = DEFAULT_CACHE_FOLDER):
+        self.step: BaseStep = step
+        self.root: str = root
+
+    def __call__(self, data_inputs) -> Any:
+        data_container = DataContainer(current_ids=None, data_inputs=data_inputs)
+        if isinstance(data_inputs, Iterable):
+            data_container.set_current_ids(LazyCurrentIds(range(len(data_inputs))))
+
+        context = ExecutionContext(root=self.root, execution_mode=ExecutionMode.TRANSFORM, hashing=False)
+        data_container = self.step.handle_transform(data_container, context.push(self.step))
+
+        return data_container.data_inputs
+
+
 class ForceAlwaysHandleMixin:
     """
     A pipeline step that requires the implementation only of handler methods :
@@ -1819,6 +2157,9 @@ class ForceAlwaysHandleMixin:
     def handle_fit_transform(self, data_container: DataContainer, context: ExecutionContext):
         raise NotImplementedError('Must implement handle_fit_transform in {0}'.format(self.name))
 
+    def freeze(self) -> Callable:
+        return FrozenStep(self)
+
     def transform(self, data_inputs) -> 'ForceAlwaysHandleMixin':
         raise Exception('Transform method is not supported for {0}, because it inherits from ForceHandleMixin. Please use handle_transform instead.'.format(self.name))
 
@@ -2113,7 +2454,7 @@ class TruncableSteps(BaseStep, ABC):
                 class_name = step[0]
                 step = step[1]
 
-            if isinstance(step, BaseEstimator):
+            if _is_sklearn_estimator(step):
                 import neuraxle.steps.sklearn
                 step = neuraxle.steps.sklearn.SKLearnWrapper(step)
                 step.set_name(step.get_wrapped_sklearn_predictor().__class__.__name__)
@@ -2744,6 +3085,16 @@ class ResumableStepMixin:
         return self.__repr__()
 
 
+class NeedsCurrentIdsMixin:
+    """
+    Mixin to mark a step that reads the hashed current ids, or the summary id of its data container,
+    for example a checkpoint, or a cache.
+    A :class:`~neuraxle.pipeline.Pipeline` created without an explicit ``hashing`` mode only hashes the current ids
+    when one of its steps has this mixin.
+    """
+    pass
+
+
 class Identity(NonTransformableMixin, NonFittableMixin, BaseStep):
     """
     A pipeline step that has no effect at all but to return the same data without changes.
@@ -2763,3 +3114,17 @@ class Identity(NonTransformableMixin, NonFittableMixin, BaseStep):
         NonTransformableMixin.__init__(self)
         NonFittableMixin.__init__(self)
         BaseStep.__init__(self, name=name, savers=savers)
+
+
+def _is_sklearn_estimator(step) -> bool:
+    """
+    Check if the step is a scikit-learn estimator without importing scikit-learn:
+    a step can't be an instance of ``BaseEstimator`` if scikit-learn was never imported.
+
+    :param step: step to check
+    :return: True if the step is a scikit-learn ``BaseEstimator``
+    """
+    if 'sklearn' not in sys.modules:
+        return False
+    from sklearn.base import BaseEstimator
+    return isinstance(step, BaseEstimator)
@@ -31,7 +31,7 @@ from enum import Enum
 from typing import List, Tuple, Any
 
 from neuraxle.base import ResumableStepMixin, BaseStep, ExecutionContext, \
-    ExecutionMode, NonTransformableMixin, NonFittableMixin, Identity
+    ExecutionMode, NonTransformableMixin, NonFittableMixin, Identity, NeedsCurrentIdsMixin
 from neuraxle.data_container import DataContainer, ListDataContainer
 
 
@@ -166,7 +166,7 @@ class StepSavingCheckpointer(BaseCheckpointer):
         return True
 
 
-class Checkpoint(NonFittableMixin, NonTransformableMixin, ResumableStepMixin, BaseStep):
+class Checkpoint(NonFittableMixin, NonTransformableMixin, ResumableStepMixin, NeedsCurrentIdsMixin, BaseStep):
     """
     Resumable Checkpoint Step to load, and save both data checkpoints, and step checkpoints.
     Checkpoint uses a list of step checkpointers(List[StepCheckpointer]), and data checkpointers(List[BaseCheckpointer]).
@@ -24,9 +24,132 @@ Classes for containing the data that flows throught the pipeline steps.
 
 """
 import hashlib
-from typing import Any, Iterable, List
+from itertools import chain
+from typing import Any, Iterable, List, Tuple
 
-from conv import convolved_1d
+import numpy as np
+
+
+class LazyCurrentIds:
+    """
+    Lazy, symbolic representation of the current ids of a :class:`DataContainer`.
+
+    Instead of rewriting one hex string per data input after every step, it only stores the base ids
+    (most of the time ``range(len(data_inputs))``), and the chain of hyperparameter digests that were applied to them.
+    Rehashing is O(1), and the per data input md5 strings are only computed when a consumer reads them
+    (e.g.: a :class:`~neuraxle.checkpoints.Checkpoint`, or a :class:`~neuraxle.steps.caching.ValueCachingWrapper`).
+
+    The materialized ids are exactly the same as the ones computed eagerly by :class:`~neuraxle.base.HashlibMd5Hasher`.
+    The summary id is the same as the one of the materialized ids, so checkpoints created before still resume.
+
+    Example usage :
+
+    .. code-block:: python
+
+        current_ids = LazyCurrentIds(range(3))
+        current_ids = current_ids.rehash(hyperparams_digest)  # O(1)
+
+        list(current_ids)  # ['c4ca4238a0b...', ...] materialized only here
+
+    .. seealso::
+        :class:`DataContainer`,
+        :class:`~neuraxle.base.HashlibMd5Hasher`
+    """
+
+    def __init__(self, base_ids: Iterable, digests: Tuple[str, ...] = ()):
+        self.base_ids = base_ids
+        self.digests: Tuple[str, ...] = tuple(digests)
+        self._materialized_ids: List[str] = None
+
+    def rehash(self, digest: str) -> 'LazyCurrentIds':
+        """
+        Rehash the current ids with the given hyperparameters digest without computing anything.
+
+        :param digest: hyperparameters digest
+        :type digest: str
+        :return: new lazy current ids
+        :rtype: LazyCurrentIds
+        """
+        return LazyCurrentIds(base_ids=self.base_ids, digests=self.digests + (digest,))
+
+    def materialize(self) -> List[str]:
+        """
+        Compute the hashed current id of every data input. The result is cached.
+
+        :return: current ids
+        :rtype: List[str]
+        """
+        if self._materialized_ids is None:
+            self._materialized_ids = [self._hash_base_id(base_id) for base_id in self.base_ids]
+        return self._materialized_ids
+
+    def is_materialized(self) -> bool:
+        """
+        Returns True if the per data input current ids have already been computed.
+
+        :return: if the current ids are materialized
+        :rtype: bool
+        """
+        return self._materialized_ids is not None
+
+    def hash_summary(self) -> str:
+        """
+        Hash the current ids into one id, like :func:`DataContainer.hash_summary` does for a list of current ids.
+        When the current ids aren't materialized yet, each one is hashed through the digest chain,
+        and fed to the summary hash one at a time, without keeping the list of current ids in memory.
+
+        :return: single hashed id for all of the current ids
+        :rtype: str
+        """
+        if self._materialized_ids is not None:
+            current_ids = self._materialized_ids
+        else:
+            current_ids = (self._hash_base_id(base_id) for base_id in self.base_ids)
+
+        m = hashlib.md5()
+        for current_id in current_ids:
+            m.update(str.encode(current_id))
+        return m.hexdigest()
+
+    def _hash_base_id(self, base_id) -> str:
+        current_id = str(base_id)
+        for digest in self.digests:
+            m = hashlib.md5()
+            m.update(str.encode(current_id))
+            m.update(str.encode(digest))
+            current_id = m.hexdigest()
+        return current_id
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            sliced = LazyCurrentIds(base_ids=self.base_ids[key], digests=self.digests)
+            if self._materialized_ids is not None:
+                sliced._materialized_ids = self._materialized_ids[key]
+            return sliced
+
+        if self._materialized_ids is not None:
+            return self._materialized_ids[key]
+        return self._hash_base_id(self.base_ids[key])
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.base_ids)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyCurrentIds) and self.digests == other.digests and self.base_ids is other.base_ids:
+            return True
+        if other is None:
+            return False
+        return list(self) == list(other)
+
+    def __hash__(self):
+        # equal current ids have the same summary, whether they are lazy or not.
+        return hash(self.hash_summary())
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(base_ids=" + repr(self.base_ids) + ", digests=" + repr(self.digests) + ")"
 
 
 class DataContainer:
@@ -105,10 +228,14 @@ class DataContainer:
     def hash_summary(self):
         """
         Hash :class:`DataContainer`.current_ids, data inputs, and hyperparameters together into one id.
+        :class:`LazyCurrentIds` are hashed without keeping their materialized current ids in memory.
 
         :return: single hashed current id for all of the current ids
         :rtype: str
         """
+        if isinstance(self.current_ids, LazyCurrentIds):
+            return self.current_ids.hash_summary()
+
         m = hashlib.md5()
         for current_id in self.current_ids:
             m.update(str.encode(str(current_id)))
@@ -117,6 +244,8 @@ class DataContainer:
     def convolved_1d(self, stride, kernel_size) -> Iterable['DataContainer']:
         """
         Returns an iterator that iterates through batches of the DataContainer.
+        Numpy data inputs are batched with slices (views), and other data inputs with the conv library.
+        The last incomplete batch is truncated using the length of the data container.
 
         :param stride: step size for the convolution operation
         :param kernel_size:
@@ -126,6 +255,17 @@ class DataContainer:
         .. seealso::
             `<https://github.com/guillaume-chevalier/python-conv-lib>`_
         """
+        if isinstance(self.data_inputs, np.ndarray):
+            return self._convolved_1d_slices(stride=stride, kernel_size=kernel_size)
+        return self._convolved_1d_conv(stride=stride, kernel_size=kernel_size)
+
+    def _convolved_1d_slices(self, stride, kernel_size) -> Iterable['DataContainer']:
+        for start in _convolved_1d_starts(len(self), stride=stride, kernel_size=kernel_size):
+            yield self[start:start + kernel_size]
+
+    def _convolved_1d_conv(self, stride, kernel_size) -> Iterable['DataContainer']:
+        from conv import convolved_1d
+
         conv_current_ids = convolved_1d(stride=stride, iterable=self.current_ids, kernel_size=kernel_size,
                                         include_incomplete_pass=True)
         conv_data_inputs = convolved_1d(stride=stride, iterable=self.data_inputs, kernel_size=kernel_size,
@@ -133,14 +273,14 @@ class DataContainer:
         conv_expected_outputs = convolved_1d(stride=stride, iterable=self.expected_outputs, kernel_size=kernel_size,
                                              include_incomplete_pass=True)
 
-        for current_ids, data_inputs, expected_outputs in zip(conv_current_ids, conv_data_inputs,
-                                                              conv_expected_outputs):
-            for i, (ci, di, eo) in enumerate(zip(current_ids, data_inputs, expected_outputs)):
-                if di is None:
-                    current_ids = current_ids[:i]
-                    data_inputs = data_inputs[:i]
-                    expected_outputs = expected_outputs[:i]
-                    break
+        n_data_inputs = len(self)
+        for start, (current_ids, data_inputs, expected_outputs) in zip(
+                range(0, n_data_inputs, stride), zip(conv_current_ids, conv_data_inputs, conv_expected_outputs)):
+            n_batch = min(kernel_size, n_data_inputs - start)
+            if n_batch < kernel_size:
+                current_ids = current_ids[:n_batch]
+                data_inputs = data_inputs[:n_batch]
+                expected_outputs = expected_outputs[:n_batch]
 
             yield DataContainer(
                 summary_id=self.summary_id,
@@ -149,6 +289,22 @@ class DataContainer:
                 expected_outputs=expected_outputs
             )
 
+    def __getitem__(self, key: slice) -> 'DataContainer':
+        """
+        Slice the current ids, data inputs, and expected outputs together.
+
+        :param key: slice
+        :type key: slice
+        :return: sliced data container
+        :rtype: DataContainer
+        """
+        return DataContainer(
+            summary_id=self.summary_id,
+            current_ids=self.current_ids[key] if self.current_ids is not None else None,
+            data_inputs=self.data_inputs[key],
+            expected_outputs=self.expected_outputs[key] if self.expected_outputs is not None else None
+        )
+
     def copy(self):
         return DataContainer(
             summary_id=self.summary_id,
@@ -272,6 +428,199 @@ class ListDataContainer(DataContainer):
         :type data_container: DataContainer
         :return:
         """
+        expected_outputs = data_container.expected_outputs
+        if expected_outputs is None:
+            expected_outputs = [None] * len(data_container.data_inputs)
+
         self.current_ids.extend(data_container.current_ids)
         self.data_inputs.extend(data_container.data_inputs)
-        self.expected_outputs.extend(data_container.expected_outputs)
+        self.expected_outputs.extend(expected_outputs)
+
+
+class NumpyDataContainer(DataContainer):
+    """
+    Sub class of DataContainer that keeps the data inputs, and the expected outputs as numpy arrays.
+
+    Batching returns views of the arrays instead of new lists, and the batches are joined back together
+    with a single ``np.concatenate`` in :func:`~neuraxle.data_container.NumpyDataContainer.concat`.
+    The expected outputs stay None when there are none, instead of a list of None for each data input.
+
+    .. code-block:: python
+
+        data_container = NumpyDataContainer(current_ids=None, data_inputs=np.ones((1000, 10)))
+        batches = list(data_container.convolved_1d(stride=100, kernel_size=100))  # views, no copy
+        joined = NumpyDataContainer.concat(batches)  # one np.concatenate
+
+    .. seealso::
+        :class:`DataContainer`,
+        :class:`~neuraxle.pipeline.Joiner`
+    """
+
+    def __init__(
+            self,
+            current_ids,
+            data_inputs: Any,
+            summary_id=None,
+            expected_outputs: Any = None
+    ):
+        self.current_ids = current_ids
+        self.summary_id = summary_id
+        self.data_inputs = np.asanyarray(data_inputs)
+        self.expected_outputs = np.asanyarray(expected_outputs) if expected_outputs is not None else None
+
+    def __getitem__(self, key: slice) -> 'NumpyDataContainer':
+        """
+        Slice the data container without copying the data inputs, and expected outputs.
+
+        :param key: slice
+        :type key: slice
+        :return: sliced data container
+        :rtype: NumpyDataContainer
+        """
+        return NumpyDataContainer(
+            summary_id=self.summary_id,
+            current_ids=self.current_ids[key] if self.current_ids is not None else None,
+            data_inputs=self.data_inputs[key],
+            expected_outputs=self.expected_outputs[key] if self.expected_outputs is not None else None
+        )
+
+    def copy(self):
+        return NumpyDataContainer(
+            summary_id=self.summary_id,
+            current_ids=self.current_ids,
+            data_inputs=self.data_inputs,
+            expected_outputs=self.expected_outputs,
+        )
+
+    @staticmethod
+    def concat(data_containers: List[DataContainer]) -> 'NumpyDataContainer':
+        """
+        Concatenate the given data containers with one ``np.concatenate`` for the data inputs,
+        and one for the expected outputs.
+
+        :param data_containers: data containers to concatenate, in order
+        :type data_containers: List[DataContainer]
+        :return: concatenated data container
+        :rtype: NumpyDataContainer
+        """
+        expected_outputs = [dc.expected_outputs for dc in data_containers]
+        if any(eo is None for eo in expected_outputs):
+            expected_outputs = None
+        else:
+            expected_outputs = np.concatenate(expected_outputs)
+
+        return NumpyDataContainer(
+            summary_id=data_containers[0].summary_id if len(data_containers) > 0 else None,
+            current_ids=_concat_current_ids([dc.current_ids for dc in data_containers]),
+            data_inputs=np.concatenate([dc.data_inputs for dc in data_containers]),
+            expected_outputs=expected_outputs
+        )
+
+
+class MemmapDataContainer(NumpyDataContainer):
+    """
+    Sub class of NumpyDataContainer for datasets that don't fit in memory.
+    The data inputs, and expected outputs are memory-mapped ``.npy`` files (or ``np.memmap`` arrays),
+    so each batch yielded by :func:`~neuraxle.data_container.DataContainer.convolved_1d`
+    only reads its own slice from disk when a step uses it.
+
+    .. code-block:: python
+
+        data_container = MemmapDataContainer.from_npy('data_inputs.npy', 'expected_outputs.npy')
+
+        p = MiniBatchSequentialPipeline([
+            SomeStep(),
+            Joiner(batch_size=1000)
+        ])
+        p, data_container = p.handle_fit_transform(data_container, ExecutionContext())
+
+    .. seealso::
+        :class:`NumpyDataContainer`,
+        :class:`~neuraxle.pipeline.MiniBatchSequentialPipeline`,
+        :class:`~neuraxle.pipeline.Joiner`
+    """
+
+    @staticmethod
+    def from_npy(
+            data_inputs_path: str,
+            expected_outputs_path: str = None,
+            mmap_mode: str = 'r',
+            current_ids=None,
+            summary_id=None
+    ) -> 'MemmapDataContainer':
+        """
+        Memory-map ``.npy`` files saved with ``np.save``, without reading them.
+
+        :param data_inputs_path: path of the data inputs ``.npy`` file
+        :type data_inputs_path: str
+        :param expected_outputs_path: path of the expected outputs ``.npy`` file (optional)
+        :type expected_outputs_path: str
+        :param mmap_mode: memory map mode passed to ``np.load`` (default: read-only)
+        :type mmap_mode: str
+        :param current_ids: current ids
+        :param summary_id: summary id
+        :return: memory-mapped data container
+        :rtype: MemmapDataContainer
+        """
+        expected_outputs = None
+        if expected_outputs_path is not None:
+            expected_outputs = np.load(expected_outputs_path, mmap_mode=mmap_mode)
+
+        return MemmapDataContainer(
+            current_ids=current_ids,
+            data_inputs=np.load(data_inputs_path, mmap_mode=mmap_mode),
+            summary_id=summary_id,
+            expected_outputs=expected_outputs
+        )
+
+
+def _concat_current_ids(current_ids_batches: List[Any]):
+    """
+    Concatenate the current ids of many batches.
+    Contiguous :class:`LazyCurrentIds` ranges that share the same digests are merged without being materialized.
+
+    :param current_ids_batches: current ids of each batch, in order
+    :return: concatenated current ids
+    """
+    if len(current_ids_batches) == 0 or any(ids is None for ids in current_ids_batches):
+        return None
+
+    if all(isinstance(ids, np.ndarray) for ids in current_ids_batches):
+        return np.concatenate(current_ids_batches)
+
+    first = current_ids_batches[0]
+    if all(isinstance(ids, LazyCurrentIds) and isinstance(ids.base_ids, range) and ids.base_ids.step == 1
+           and ids.digests == first.digests for ids in current_ids_batches):
+        are_contiguous = all(
+            previous.base_ids.stop == current.base_ids.start
+            for previous, current in zip(current_ids_batches, current_ids_batches[1:])
+        )
+        if are_contiguous:
+            return LazyCurrentIds(
+                base_ids=range(first.base_ids.start, current_ids_batches[-1].base_ids.stop),
+                digests=first.digests
+            )
+
+    return list(chain.from_iterable(current_ids_batches))
+
+
+def _convolved_1d_starts(n_data_inputs: int, stride: int, kernel_size: int) -> Iterable[int]:
+    """
+    Get the start index of each batch yielded by ``conv.convolved_1d`` with ``include_incomplete_pass=True``,
+    so that the batches sliced from numpy arrays are the same as the ones of the other data inputs.
+    The conv library pads the data inputs up to a multiple of the stride, yields every complete window,
+    and then a single incomplete one. The batches starting after the data inputs are skipped.
+
+    :param n_data_inputs: number of data inputs
+    :param stride: step size for the convolution operation
+    :param kernel_size: batch size
+    :return: start index of each batch
+    """
+    n_padded = n_data_inputs + (kernel_size - n_data_inputs) % stride
+    start = 0
+    while start <= n_padded - kernel_size and start < n_data_inputs:
+        yield start
+        start += stride
+
+    if start < min(n_padded, n_data_inputs):
+        yield start
@@ -31,11 +31,8 @@ import random
 import sys
 from abc import abstractmethod, ABCMeta
 from typing import List
-from scipy.stats import norm
-from scipy.integrate import quad
 import math
 import numpy as np
-from scipy.stats import truncnorm
 
 
 class HyperparameterDistribution(metaclass=ABCMeta):
@@ -487,6 +484,8 @@ class Quantized(WrappedHyperparameterDistributions):
         :param x: value where the probability mass function is evaluated.
         :return: value of the probability mass function.
         """
+        from scipy.integrate import quad
+
         # In order to calculate the pdf for any quantized distribution,
         # we have to perform the integral from x-0.5 to x+0.5 (because of round).
         if isinstance(x, int) or (isinstance(x, float) and x.is_integer()):
@@ -788,6 +787,8 @@ class Normal(HyperparameterDistribution):
 
         :return: a float.
         """
+        from scipy.stats import truncnorm
+
         if self.hard_clip_min is None and self.hard_clip_max is None:
             result = float(np.random.normal(self.mean, self.std))
         else:
@@ -812,6 +813,7 @@ class Normal(HyperparameterDistribution):
         :param x: value where the probability distribution function is evaluated.
         :return: value of the probability distribution function.
         """
+        from scipy.stats import norm, truncnorm
 
         if self.hard_clip_min is not None and (x < self.hard_clip_min):
             return 0.
@@ -839,6 +841,8 @@ class Normal(HyperparameterDistribution):
         :param x: value where the cumulative distribution function is evaluated.
         :return: value of the cumulative distribution function.
         """
+        from scipy.stats import norm, truncnorm
+
         if self.hard_clip_min is not None and (x < self.hard_clip_min):
             return 0.
 
@@ -913,6 +917,8 @@ class LogNormal(HyperparameterDistribution):
 
         :return: a float.
         """
+        from scipy.stats import truncnorm
+
         if self.hard_clip_min is None and self.hard_clip_max is None:
             result = 2 ** float(np.random.normal(self.log2_space_mean, self.log2_space_std))
         else:
@@ -938,6 +944,7 @@ class LogNormal(HyperparameterDistribution):
         :param x: value where the probability distribution function is evaluated.
         :return: value of the probability distribution function.
         """
+        from scipy.stats import norm
 
         if self.hard_clip_min is not None and (x < self.hard_clip_min):
             return 0.
@@ -967,6 +974,8 @@ class LogNormal(HyperparameterDistribution):
         :param x: value where the cumulative distribution function is evaluated.
         :return: value of the cumulative distribution function.
         """
+        from scipy.stats import norm
+
         if self.hard_clip_min is not None and (x < self.hard_clip_min):
             return 0.
 
@@ -29,7 +29,6 @@ from abc import ABC, abstractmethod
 from typing import List, Callable, Tuple, Iterable
 
 import numpy as np
-from sklearn.metrics import r2_score
 
 from neuraxle.base import MetaStepMixin, BaseStep, ExecutionContext
 from neuraxle.data_container import DataContainer
@@ -37,6 +36,16 @@ from neuraxle.steps.loop import StepClonerForEachDataInput
 from neuraxle.steps.numpy import NumpyConcatenateOuterBatch, NumpyConcatenateOnCustomAxis
 
 
+def r2_score(y_true, y_pred, **kwargs) -> float:
+    """
+    Default scoring function of the validation techniques.
+    Delegates to `sklearn.metrics.r2_score <https://scikit-learn.org/stable/modules/generated/sklearn.metrics.r2_score.html>`_,
+    which is only imported the first time a score is computed.
+    """
+    from sklearn.metrics import r2_score as sklearn_r2_score
+    return sklearn_r2_score(y_true, y_pred, **kwargs)
+
+
 class BaseValidation(MetaStepMixin, BaseStep, ABC):
     """
     Base class For validation wrappers.
@@ -24,14 +24,20 @@ This is the core of Neuraxle's pipelines. You can chain steps to call them one a
 
 """
 import shutil
+import time
 from abc import ABC, abstractmethod
 from copy import copy
-from typing import Any, Tuple, List
+from queue import Queue
+from threading import Thread
+from typing import Any, Tuple, List, Iterable, Callable
+
+import numpy as np
 
 from neuraxle.base import BaseStep, TruncableSteps, NamedTupleList, ResumableStepMixin, NonFittableMixin, \
-    ExecutionContext, ExecutionMode, NonTransformableMixin
+    ExecutionContext, ExecutionMode, NonTransformableMixin, NeedsCurrentIdsMixin, MetaStepMixin
 from neuraxle.checkpoints import Checkpoint
-from neuraxle.data_container import DataContainer, ListDataContainer
+from neuraxle.data_container import DataContainer, ListDataContainer, LazyCurrentIds, NumpyDataContainer
+from neuraxle.profiling import Profiler
 
 DEFAULT_CACHE_FOLDER = 'cache'
 
@@ -56,11 +62,96 @@ class BasePipeline(TruncableSteps, ABC):
 class Pipeline(BasePipeline):
     """
     Fits and transform steps
+
+    By default, the pipeline only hashes the current ids, and the summary id when a step of the pipeline reads them
+    (a :class:`~neuraxle.base.NeedsCurrentIdsMixin`, such as a :class:`~neuraxle.checkpoints.Checkpoint`,
+    or a :class:`~neuraxle.steps.caching.ValueCachingWrapper`), or when a nested pipeline forces the hashing on.
+    Pass ``hashing=True``, or ``hashing=False`` to force the hashing on, or off.
+
+    .. code-block:: python
+
+        p = Pipeline([
+            MultiplyByN(2),
+            AddN(1)
+        ], hashing=False)
     """
 
-    def __init__(self, steps: NamedTupleList, cache_folder=DEFAULT_CACHE_FOLDER):
+    def __init__(self, steps: NamedTupleList, cache_folder=DEFAULT_CACHE_FOLDER, hashing: bool = None):
         BasePipeline.__init__(self, steps=steps)
         self.cache_folder = cache_folder
+        self.hashing: bool = hashing
+        self.profiler: Profiler = None
+
+    def set_profiler(self, profiler: Profiler) -> 'Pipeline':
+        """
+        Profile the next fit, and transform calls of the pipeline with the given profiler.
+        Pass None to stop profiling. The memory tracing started by the previous profiler is stopped.
+
+        :param profiler: profiler to record the measures of each step in
+        :type profiler: Profiler
+        :return: self
+        :rtype: Pipeline
+
+        .. seealso::
+            :class:`~neuraxle.profiling.Profiler`
+        """
+        if self.profiler is not None and self.profiler is not profiler:
+            self.profiler.stop_tracing_memory()
+        self.profiler = profiler
+        return self
+
+    def _create_context(self, execution_mode: ExecutionMode) -> ExecutionContext:
+        """
+        Create the root execution context of a fit, or transform call.
+
+        :param execution_mode: execution mode
+        :type execution_mode: ExecutionMode
+        :return: execution context
+        :rtype: ExecutionContext
+        """
+        return ExecutionContext(
+            root=self.cache_folder,
+            execution_mode=execution_mode,
+            hashing=self.is_hashing_enabled(),
+            profiler=self.profiler
+        )
+
+    def is_hashing_enabled(self) -> bool:
+        """
+        Returns True if the current ids need to be hashed by the steps.
+        When the hashing mode hasn't been set in the constructor, it is only enabled if a step of the pipeline
+        is a :class:`~neuraxle.base.NeedsCurrentIdsMixin`, or a nested pipeline has its hashing enabled.
+        The steps are only searched when the pipeline is created, and when its steps are edited.
+
+        :return: if hashing is enabled
+        :rtype: bool
+        """
+        if self.hashing is not None:
+            return self.hashing
+
+        if getattr(self, '_steps_need_current_ids', None) is None:
+            self._steps_need_current_ids = any(_needs_current_ids(step) for step in self.values())
+        return self._steps_need_current_ids
+
+    def _refresh_steps(self):
+        BasePipeline._refresh_steps(self)
+        self._steps_need_current_ids = any(_needs_current_ids(step) for step in self.values())
+
+    def _initialize_current_ids(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Hash the data container before the first step. If hashing is disabled,
+        the current ids are only set to the index of each data input.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: data container
+        """
+        if context.hashing:
+            return self.hash_data_container(data_container)
+
+        if data_container.current_ids is None and isinstance(data_container.data_inputs, Iterable):
+            data_container.set_current_ids(LazyCurrentIds(range(len(data_container.data_inputs))))
+        return data_container
 
     def transform(self, data_inputs: Any):
         """
@@ -71,13 +162,105 @@ class Pipeline(BasePipeline):
         """
         data_container = DataContainer(current_ids=None, data_inputs=data_inputs)
 
-        data_container = self.hash_data_container(data_container)
-        context = ExecutionContext(root=self.cache_folder, execution_mode=ExecutionMode.TRANSFORM)
-        context = context.push(self)
-        data_container = self._transform_data_container(data_container, context)
+        context = self._create_context(ExecutionMode.TRANSFORM)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            data_container = self._initialize_current_ids(data_container, context)
+            context = context.push(self)
+            data_container = self._transform_data_container(data_container, context)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return data_container.data_inputs
 
+    def freeze(self) -> 'FrozenPipeline':
+        """
+        Compile the fitted pipeline into a flat, read-only sequence of transform callables for inference.
+        Nested pipelines are flattened, and the steps that don't transform the data inputs
+        (e.g.: :class:`~neuraxle.base.Identity`, or a :class:`~neuraxle.checkpoints.Checkpoint`) are removed.
+
+        .. code-block:: python
+
+            p = Pipeline([
+                MultiplyByN(2),
+                Pipeline([AddN(1), Checkpoint()]),
+            ]).fit(data_inputs, expected_outputs)
+
+            frozen = p.freeze()  # FrozenPipeline(MultiplyByN, Pipeline__AddN)
+            outputs = frozen(data_inputs)
+
+        :return: frozen pipeline
+        :rtype: FrozenPipeline
+
+        .. seealso::
+            :func:`~neuraxle.base.BaseStep.freeze`
+        """
+        frozen_steps = []
+        for step_name, step in self.items():
+            if _is_identity_on_transform(step):
+                continue
+
+            frozen_step = step.freeze()
+            if isinstance(frozen_step, FrozenPipeline):
+                frozen_steps.extend(
+                    (step_name + '__' + sub_step_name, frozen_sub_step)
+                    for sub_step_name, frozen_sub_step in frozen_step.steps
+                )
+            else:
+                frozen_steps.append((step_name, frozen_step))
+
+        return FrozenPipeline(frozen_steps)
+
+    def transform_stream(self, data_inputs_batches: Iterable) -> Iterable:
+        """
+        Lazily transform an iterator of data inputs batches, and yield each transformed batch.
+        Only one batch is held in memory at a time, so the stream can be unbounded.
+
+        The current ids of each batch continue where the previous batch ended,
+        so that they are the same as if all of the data inputs had been transformed at once.
+
+        .. code-block:: python
+
+            for outputs in p.transform_stream(read_batches_from_disk()):
+                write(outputs)
+
+        :param data_inputs_batches: iterator of data inputs batches
+        :return: iterator of transformed data inputs batches
+        """
+        context = self._create_context(ExecutionMode.TRANSFORM)
+
+        offset = 0
+        for data_inputs in data_inputs_batches:
+            data_container = self._create_data_container(data_inputs)
+            data_container.set_current_ids(LazyCurrentIds(range(offset, offset + len(data_container))))
+            offset += len(data_container)
+
+            data_container = self._initialize_current_ids(data_container, context)
+            data_container = self._transform_stream_batch(data_container, context)
+
+            yield data_container.data_inputs
+
+    def _create_data_container(self, data_inputs, expected_outputs=None) -> DataContainer:
+        """
+        Create the data container to transform.
+
+        :param data_inputs: data inputs
+        :param expected_outputs: expected outputs
+        :return: data container
+        :rtype: DataContainer
+        """
+        return DataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=expected_outputs)
+
+    def _transform_stream_batch(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Transform one batch of :func:`~neuraxle.pipeline.Pipeline.transform_stream`.
+
+        :param data_container: data container of the batch
+        :param context: execution context
+        :return: transformed data container
+        """
+        return self._transform_data_container(data_container, context.push(self))
+
     def fit_transform(self, data_inputs, expected_outputs=None) -> ('Pipeline', Any):
         """
         After loading the last checkpoint, fit transform each pipeline steps
@@ -92,10 +275,14 @@ class Pipeline(BasePipeline):
             expected_outputs=expected_outputs
         )
 
-        data_container = self.hash_data_container(data_container)
-        context = ExecutionContext(root=self.cache_folder, execution_mode=ExecutionMode.FIT_TRANSFORM)
-        context = context.push(self)
-        new_self, data_container = self._fit_transform_data_container(data_container, context)
+        context = self._create_context(ExecutionMode.FIT_TRANSFORM)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            data_container = self._initialize_current_ids(data_container, context)
+            context = context.push(self)
+            new_self, data_container = self._fit_transform_data_container(data_container, context)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return new_self, data_container.data_inputs
 
@@ -113,10 +300,14 @@ class Pipeline(BasePipeline):
             expected_outputs=expected_outputs
         )
 
-        data_container = self.hash_data_container(data_container)
-        context = ExecutionContext(self.cache_folder, ExecutionMode.FIT)
-        context = context.push(self)
-        new_self = self._fit_data_container(data_container, context)
+        context = self._create_context(ExecutionMode.FIT)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            data_container = self._initialize_current_ids(data_container, context)
+            context = context.push(self)
+            new_self = self._fit_data_container(data_container, context)
+        finally:
+            context.stop_profiling(profiling_token)
 
         return new_self
 
@@ -299,24 +490,111 @@ class ResumablePipeline(ResumableStepMixin, Pipeline):
         return False
 
 
+def _needs_current_ids(step: BaseStep) -> bool:
+    """
+    Returns True if the step, or one of its sub steps reads the hashed current ids.
+    A nested pipeline answers with its own hashing mode, so that an explicit ``hashing`` flag on it is respected.
+
+    :param step: step
+    :return: if the current ids need to be hashed for the step
+    """
+    if isinstance(step, NeedsCurrentIdsMixin):
+        return True
+    if isinstance(step, Pipeline):
+        return step.is_hashing_enabled()
+    if isinstance(step, TruncableSteps):
+        return any(_needs_current_ids(sub_step) for sub_step in step.values())
+    if isinstance(step, MetaStepMixin):
+        return _needs_current_ids(step.wrapped)
+    return False
+
+
+def _is_identity_on_transform(step: BaseStep) -> bool:
+    """
+    Returns True if the step returns its data inputs unchanged on transform,
+    because it only has the transform method of the :class:`~neuraxle.base.NonTransformableMixin`.
+
+    :param step: step
+    :return: if the transform of the step has no effect
+    """
+    step_class = step.__class__
+    return step_class.transform is NonTransformableMixin.transform and step_class.freeze is BaseStep.freeze
+
+
+class FrozenPipeline:
+    """
+    Flat, read-only sequence of transform callables compiled from a fitted :class:`Pipeline` with
+    :func:`~Pipeline.freeze`. Calling it sends the data inputs through each callable,
+    without creating any execution context, data container, or hashing the current ids.
+
+    .. code-block:: python
+
+        frozen = p.freeze()
+        outputs = frozen(data_inputs)  # same as p.transform(data_inputs)
+
+    .. seealso::
+        :func:`~neuraxle.base.BaseStep.freeze`
+    """
+
+    __slots__ = ('steps',)
+
+    def __init__(self, steps: List[Tuple[str, Callable]]):
+        object.__setattr__(self, 'steps', tuple(steps))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{0} is read-only: freeze the pipeline again instead.'.format(self.__class__.__name__))
+
+    def __call__(self, data_inputs: Any) -> Any:
+        for _, transform in self.steps:
+            data_inputs = transform(data_inputs)
+        return data_inputs
+
+    def transform(self, data_inputs: Any) -> Any:
+        return self(data_inputs)
+
+    def keys(self) -> List[str]:
+        return [step_name for step_name, _ in self.steps]
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getstate__(self):
+        return {'steps': self.steps}
+
+    def __setstate__(self, state):
+        object.__setattr__(self, 'steps', state['steps'])
+
+    def __repr__(self):
+        return '{0}({1})'.format(self.__class__.__name__, ', '.join(self.keys()))
+
+
 class MiniBatchSequentialPipeline(Pipeline):
     """
     Mini Batch Sequential Pipeline class to create a pipeline processing data inputs in batch.
     """
 
-    def __init__(self, steps: NamedTupleList):
-        Pipeline.__init__(self, steps)
+    def __init__(self, steps: NamedTupleList, hashing: bool = None):
+        Pipeline.__init__(self, steps, hashing=hashing)
+
+    def freeze(self) -> Callable:
+        """
+        The mini batches are kept when the pipeline is frozen: the frozen callable is the transform method.
+
+        :return: transform callable
+        :rtype: Callable
+        """
+        return self.transform
 
     def transform(self, data_inputs: Any):
         """
         :param data_inputs: the data input to transform
         :return: transformed data inputs
         """
-        data_container = DataContainer(current_ids=None, data_inputs=data_inputs)
+        data_container = self._create_data_container(data_inputs)
 
-        self.hash_data_container(data_container)
+        context = self._create_context(ExecutionMode.TRANSFORM)
+        data_container = self._initialize_current_ids(data_container, context)
 
-        context = ExecutionContext(self.cache_folder, ExecutionMode.TRANSFORM)
         data_container = self.handle_transform(data_container, context)
 
         return data_container.data_inputs
@@ -329,11 +607,11 @@ class MiniBatchSequentialPipeline(Pipeline):
         """
         self.setup()
 
-        data_container = DataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=expected_outputs)
-        current_ids = self.hash(data_container)
-        data_container.set_current_ids(current_ids)
+        data_container = self._create_data_container(data_inputs, expected_outputs)
+
+        context = self._create_context(ExecutionMode.FIT_TRANSFORM)
+        data_container = self._initialize_current_ids(data_container, context)
 
-        context = ExecutionContext(self.cache_folder, ExecutionMode.FIT_TRANSFORM)
         new_self = self.handle_fit(data_container, context)
 
         return new_self
@@ -346,15 +624,41 @@ class MiniBatchSequentialPipeline(Pipeline):
         """
         self.setup()
 
-        data_container = DataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=expected_outputs)
+        data_container = self._create_data_container(data_inputs, expected_outputs)
 
-        data_container = self.hash_data_container(data_container)
+        context = self._create_context(ExecutionMode.FIT_TRANSFORM)
+        data_container = self._initialize_current_ids(data_container, context)
 
-        context = ExecutionContext(self.cache_folder, ExecutionMode.FIT_TRANSFORM)
         new_self, data_container = self.handle_fit_transform(data_container, context)
 
         return new_self, data_container.data_inputs
 
+    def _create_data_container(self, data_inputs, expected_outputs=None) -> DataContainer:
+        """
+        Create the data container to stream through the barriers.
+        Numpy data inputs are kept in a :class:`~neuraxle.data_container.NumpyDataContainer`,
+        so that the batches are views, and the joined outputs stay contiguous arrays.
+
+        :param data_inputs: data inputs
+        :param expected_outputs: expected outputs
+        :return: data container
+        :rtype: DataContainer
+        """
+        if isinstance(data_inputs, np.ndarray):
+            return NumpyDataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=expected_outputs)
+        return DataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=expected_outputs)
+
+    def _transform_stream_batch(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Transform one batch of :func:`~neuraxle.pipeline.Pipeline.transform_stream` through all of the barriers.
+        The batch is split again in mini batches by each :class:`Joiner`.
+
+        :param data_container: data container of the batch
+        :param context: execution context
+        :return: transformed data container
+        """
+        return self.handle_transform(data_container, context)
+
     def handle_transform(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
         """
         Transform all sub pipelines splitted by the Barrier steps.
@@ -363,17 +667,22 @@ class MiniBatchSequentialPipeline(Pipeline):
         :param context: execution context
         :return: data container
         """
-        sub_pipelines = self._create_sub_pipelines()
-
-        for sub_pipeline in sub_pipelines:
-            barrier = sub_pipeline[-1]
-            data_container = barrier.join_transform(
-                step=sub_pipeline,
-                data_container=data_container,
-                context=context
-            )
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            sub_pipelines = self._create_sub_pipelines()
+
+            for sub_pipeline in sub_pipelines:
+                barrier = sub_pipeline[-1]
+                data_container = barrier.join_transform(
+                    step=sub_pipeline,
+                    data_container=data_container,
+                    context=context
+                )
 
-            data_container = self.hash_data_container(data_container)
+                if context.hashing:
+                    data_container = self.hash_data_container(data_container)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return data_container
 
@@ -385,27 +694,32 @@ class MiniBatchSequentialPipeline(Pipeline):
         :param context: execution context
         :return: data container
         """
-        sub_pipelines = self._create_sub_pipelines()
-        index_start = 0
-
-        for sub_pipeline in sub_pipelines:
-            sub_pipeline.setup()
-
-            barrier = sub_pipeline[-1]
-            sub_pipeline, data_container = barrier.join_fit_transform(
-                step=sub_pipeline,
-                data_container=data_container,
-                context=context
-            )
-            current_ids = self.hash(data_container)
-            data_container.set_current_ids(current_ids)
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            sub_pipelines = self._create_sub_pipelines()
+            index_start = 0
+
+            for sub_pipeline in sub_pipelines:
+                sub_pipeline.setup()
+
+                barrier = sub_pipeline[-1]
+                sub_pipeline, data_container = barrier.join_fit_transform(
+                    step=sub_pipeline,
+                    data_container=data_container,
+                    context=context
+                )
+                if context.hashing:
+                    current_ids = self.hash(data_container)
+                    data_container.set_current_ids(current_ids)
 
-            new_self = self[:index_start] + sub_pipeline
-            if index_start + len(sub_pipeline) < len(self):
-                new_self += self[index_start + len(sub_pipeline):]
+                new_self = self[:index_start] + sub_pipeline
+                if index_start + len(sub_pipeline) < len(self):
+                    new_self += self[index_start + len(sub_pipeline):]
 
-            self.steps_as_tuple = new_self.steps_as_tuple
-            index_start += len(sub_pipeline)
+                self.steps_as_tuple = new_self.steps_as_tuple
+                index_start += len(sub_pipeline)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return self, data_container
 
@@ -417,27 +731,32 @@ class MiniBatchSequentialPipeline(Pipeline):
         :param context: execution context
         :return: data container
         """
-        sub_pipelines = self._create_sub_pipelines()
-        index_start = 0
-
-        for sub_pipeline in sub_pipelines:
-            sub_pipeline.setup()
-
-            barrier = sub_pipeline[-1]
-            sub_pipeline, data_container = barrier.join_fit_transform(
-                step=sub_pipeline,
-                data_container=data_container,
-                context=context
-            )
+        profiling_token = context.start_profiling(self, data_container)
+        try:
+            sub_pipelines = self._create_sub_pipelines()
+            index_start = 0
+
+            for sub_pipeline in sub_pipelines:
+                sub_pipeline.setup()
+
+                barrier = sub_pipeline[-1]
+                sub_pipeline, data_container = barrier.join_fit_transform(
+                    step=sub_pipeline,
+                    data_container=data_container,
+                    context=context
+                )
 
-            data_container = self.hash_data_container(data_container)
+                if context.hashing:
+                    data_container = self.hash_data_container(data_container)
 
-            new_self = self[:index_start] + sub_pipeline
-            if index_start + len(sub_pipeline) < len(self):
-                new_self += self[index_start + len(sub_pipeline):]
+                new_self = self[:index_start] + sub_pipeline
+                if index_start + len(sub_pipeline) < len(self):
+                    new_self += self[index_start + len(sub_pipeline):]
 
-            self.steps_as_tuple = new_self.steps_as_tuple
-            index_start += len(sub_pipeline)
+                self.steps_as_tuple = new_self.steps_as_tuple
+                index_start += len(sub_pipeline)
+        finally:
+            context.stop_profiling(profiling_token, data_container)
 
         return self, data_container
 
@@ -510,6 +829,7 @@ class Barrier(NonFittableMixin, NonTransformableMixin, BaseStep, ABC):
 class Joiner(Barrier):
     """
     A Special Barrier step that joins the transformed mini batches together with list.extend method.
+    When the transformed mini batches are numpy arrays, they are joined with a single ``np.concatenate`` instead.
     """
 
     def __init__(self, batch_size):
@@ -535,13 +855,13 @@ class Joiner(Barrier):
             kernel_size=self.batch_size
         )
 
-        output_data_container = ListDataContainer.empty()
+        output_data_container_batches = []
         for data_container_batch in data_container_batches:
-            output_data_container.concat(
+            output_data_container_batches.append(
                 step._transform_data_container(data_container_batch, context)
             )
 
-        return output_data_container
+        return self._join(output_data_container_batches)
 
     def join_fit_transform(self, step: Pipeline, data_container: DataContainer, context: ExecutionContext) -> Tuple['Any', DataContainer]:
         """
@@ -562,11 +882,326 @@ class Joiner(Barrier):
             kernel_size=self.batch_size
         )
 
-        output_data_container = ListDataContainer.empty()
+        output_data_container_batches = []
         for data_container_batch in data_container_batches:
             step, data_container_batch = step._fit_transform_data_container(data_container_batch, context)
-            output_data_container.concat(
-                data_container_batch
-            )
+            output_data_container_batches.append(data_container_batch)
+
+        return step, self._join(output_data_container_batches)
+
+    def _join(self, data_container_batches: List[DataContainer]) -> DataContainer:
+        """
+        Join the transformed mini batches together.
+
+        :param data_container_batches: transformed mini batches, in order
+        :type data_container_batches: List[DataContainer]
+        :return: joined data container
+        :rtype: DataContainer
+        """
+        if len(data_container_batches) > 0 and _can_concatenate_batches(data_container_batches):
+            return NumpyDataContainer.concat(data_container_batches)
+
+        output_data_container = ListDataContainer.empty()
+        for data_container_batch in data_container_batches:
+            output_data_container.concat(data_container_batch)
+
+        return output_data_container
+
+
+def _can_concatenate_batches(data_container_batches: List[DataContainer]) -> bool:
+    """
+    Returns True if the batches can be joined with ``np.concatenate``: their data inputs are ndarrays,
+    and the data inputs, and the expected outputs that are ndarrays, have the same shape after the batch axis.
+    For example, variable length sequences outputs can't be concatenated.
+
+    :param data_container_batches: transformed mini batches
+    :return: if the batches can be concatenated
+    """
+    data_inputs = [batch.data_inputs for batch in data_container_batches]
+    if not all(isinstance(batch_data_inputs, np.ndarray) for batch_data_inputs in data_inputs):
+        return False
+
+    expected_outputs = [batch.expected_outputs for batch in data_container_batches]
+    if all(isinstance(batch_expected_outputs, np.ndarray) for batch_expected_outputs in expected_outputs):
+        return _have_same_shapes_after_batch_axis(data_inputs) and _have_same_shapes_after_batch_axis(expected_outputs)
+    return _have_same_shapes_after_batch_axis(data_inputs)
+
+
+def _have_same_shapes_after_batch_axis(arrays: List[np.ndarray]) -> bool:
+    return all(array.ndim > 0 and array.shape[1:] == arrays[0].shape[1:] for array in arrays)
+
+
+class ParallelJoiner(Joiner):
+    """
+    A Joiner that transforms the mini batches of its sub pipeline in parallel with ``joblib.Parallel``,
+    and joins them back together in order.
+
+    Only the transform is parallelized: fitting mutates the sub pipeline, so the mini batches are still fitted one after another.
+    With the threading backend, the same sub pipeline transforms several mini batches at once,
+    so the transform of its steps must not modify them.
+
+    .. code-block:: python
+
+        p = MiniBatchSequentialPipeline([
+            SomeStep(),
+            SomeStep(),
+            ParallelJoiner(batch_size=1000, n_jobs=4, backend='loky', max_in_flight=8)
+        ])
+
+    .. seealso::
+        :class:`Joiner`,
+        :class:`MiniBatchSequentialPipeline`
+    """
+
+    def __init__(self, batch_size, n_jobs: int = -1, backend: str = "threading", max_in_flight: int = None):
+        """
+        Create a parallel joiner.
+
+        :param batch_size: size of the mini batches
+        :param n_jobs: The number of jobs for the parallelized ``joblib.Parallel`` loop in transform. Defaults to -1, to use all the CPUs. With 1, the mini batches are transformed one after the other.
+        :param backend: The type of parallelization to do with ``joblib.Parallel``. Possible values: "loky", "multiprocessing", "threading", "dask" if you use dask, and more.
+        :param max_in_flight: The maximum number of calls dispatched to the workers at once (``pre_dispatch`` of ``joblib.Parallel``). Defaults to two calls per job. It bounds the inputs waiting for a worker, not the outputs: the outputs of all the mini batches are kept until they are joined.
+        """
+        Joiner.__init__(self, batch_size=batch_size)
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.max_in_flight = max_in_flight
+
+    def join_transform(self, step: Pipeline, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Transform the mini batches of self.batch_size in parallel, and concatenate the outputs in order.
+
+        With the threading backend, each call transforms one mini batch. With the other backends, the arguments
+        of each call are pickled: each job makes one call with the sub pipeline and its share of the mini batches,
+        so that the sub pipeline is sent once per job instead of once per mini batch.
+
+        :param step: pipeline to transform on
+        :type step: Pipeline
+        :param data_container: data container to transform
+        :type data_container: DataContainer
+        :param context: execution context
+        :return: transformed data container
+        :rtype: DataContainer
+        """
+        if self.n_jobs == 1:
+            return Joiner.join_transform(self, step, data_container, context)
+
+        from joblib import Parallel, delayed, effective_n_jobs
 
-        return step, output_data_container
+        context = context.push(step)
+        calls_size = self.batch_size
+        if self.backend != 'threading':
+            context = context.strip()
+            n_batches = -(-len(data_container) // self.batch_size)
+            calls_size = self.batch_size * -(-n_batches // effective_n_jobs(self.n_jobs))
+
+        pre_dispatch = self.max_in_flight if self.max_in_flight is not None else '2*n_jobs'
+        outputs_per_call = Parallel(backend=self.backend, n_jobs=self.n_jobs, pre_dispatch=pre_dispatch)(
+            delayed(_transform_mini_batches)(step, data_container_call, self.batch_size, context)
+            for data_container_call in data_container.convolved_1d(stride=calls_size, kernel_size=calls_size)
+        )
+
+        return self._join([batch for output_batches in outputs_per_call for batch in output_batches])
+
+
+def _transform_mini_batches(
+        step: BaseStep,
+        data_container: DataContainer,
+        batch_size: int,
+        context: ExecutionContext
+) -> List[DataContainer]:
+    """
+    Transform the mini batches of the given data container one after the other in a worker of a :class:`ParallelJoiner`.
+    It is a module function so that the sub pipeline is pickled with the arguments of the call only.
+
+    :param step: sub pipeline to transform with
+    :param data_container: data container to split in mini batches
+    :param batch_size: size of the mini batches
+    :param context: execution context
+    :return: transformed mini batches
+    """
+    return [
+        step._transform_data_container(data_container_batch, context)
+        for data_container_batch in data_container.convolved_1d(stride=batch_size, kernel_size=batch_size)
+    ]
+
+
+class StageStatistics:
+    """
+    Throughput counters of one stage of a :class:`QueuedJoiner`.
+    The stage with the lowest throughput is the bottleneck of the sub pipeline.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.n_batches: int = 0
+        self.n_data_inputs: int = 0
+        self.busy_seconds: float = 0.0
+
+    def add_batch(self, n_data_inputs: int, duration: float):
+        """
+        Count one processed batch.
+
+        :param n_data_inputs: number of data inputs in the batch
+        :param duration: time spent processing the batch, in seconds
+        :return:
+        """
+        self.n_batches += 1
+        self.n_data_inputs += n_data_inputs
+        self.busy_seconds += duration
+
+    def throughput(self) -> float:
+        """
+        Returns the number of data inputs processed per busy second of the stage.
+
+        :return: data inputs per second
+        :rtype: float
+        """
+        if self.busy_seconds == 0.0:
+            return float('inf')
+        return self.n_data_inputs / self.busy_seconds
+
+    def __repr__(self):
+        return '{0}(name={1}, n_batches={2}, n_data_inputs={3}, busy_seconds={4:.4f})'.format(
+            self.__class__.__name__, repr(self.name), self.n_batches, self.n_data_inputs, self.busy_seconds)
+
+
+_END_OF_STREAM = object()
+
+
+class QueuedJoiner(Joiner):
+    """
+    A Joiner that pipelines the steps of its sub pipeline : each step runs in its own worker thread,
+    and the mini batches flow from one step to the next through bounded queues.
+    A slow I/O bound step and a CPU bound step can then process different mini batches at the same time,
+    and a full queue blocks the previous step so that at most ``max_queue_size`` mini batches wait between two steps.
+
+    Only the transform is pipelined: fitting mutates the sub pipeline, so the mini batches are still fitted one after another.
+
+    .. code-block:: python
+
+        joiner = QueuedJoiner(batch_size=100, max_queue_size=2)
+        p = MiniBatchSequentialPipeline([
+            LoadImagesFromDisk(),
+            PreprocessImages(),
+            joiner
+        ])
+        outputs = p.transform(paths)
+
+        bottleneck = min(joiner.stage_statistics, key=lambda stage: stage.throughput())
+
+    .. seealso::
+        :class:`Joiner`,
+        :class:`StageStatistics`,
+        :class:`MiniBatchSequentialPipeline`
+    """
+
+    def __init__(self, batch_size, max_queue_size: int = 2):
+        Joiner.__init__(self, batch_size=batch_size)
+        self.max_queue_size = max_queue_size
+        self.stage_statistics: List[StageStatistics] = []
+
+    def join_transform(self, step: Pipeline, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Transform the mini batches of self.batch_size with one worker thread per step, and concatenate the outputs in order.
+
+        :param step: pipeline to transform on
+        :type step: Pipeline
+        :param data_container: data container to transform
+        :type data_container: DataContainer
+        :param context: execution context
+        :return: transformed data container
+        :rtype: DataContainer
+        """
+        context = context.push(step)
+
+        stages = self._create_stages(step)
+        self.stage_statistics = [StageStatistics(name=stage[0][0]) for stage in stages]
+        queues = [Queue(maxsize=self.max_queue_size) for _ in range(len(stages) + 1)]
+
+        workers = [Thread(target=self._feed, args=(data_container, queues[0]), daemon=True)]
+        for i, stage in enumerate(stages):
+            workers.append(Thread(
+                target=self._run_stage,
+                args=(stage, self.stage_statistics[i], queues[i], queues[i + 1], context),
+                daemon=True
+            ))
+
+        for worker in workers:
+            worker.start()
+
+        output_data_container_batches = []
+        error = None
+        while True:
+            item = queues[-1].get()
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, BaseException):
+                error = error or item
+            else:
+                output_data_container_batches.append(item)
+
+        for worker in workers:
+            worker.join()
+
+        if error is not None:
+            raise error
+
+        return self._join(output_data_container_batches)
+
+    def _create_stages(self, step: Pipeline) -> List[NamedTupleList]:
+        """
+        Create one stage per step of the sub pipeline. The barrier ending the sub pipeline runs in the last stage.
+
+        :param step: sub pipeline
+        :return: the steps of each stage
+        """
+        stages = [[(name, sub_step)] for name, sub_step in step.items()]
+        if len(stages) > 1:
+            stages[-2].extend(stages.pop())
+        return stages
+
+    def _feed(self, data_container: DataContainer, output_queue: Queue):
+        try:
+            for data_container_batch in data_container.convolved_1d(
+                    stride=self.batch_size,
+                    kernel_size=self.batch_size
+            ):
+                output_queue.put(data_container_batch)
+        except Exception as error:
+            output_queue.put(error)
+        output_queue.put(_END_OF_STREAM)
+
+    def _run_stage(
+            self,
+            stage: NamedTupleList,
+            statistics: StageStatistics,
+            input_queue: Queue,
+            output_queue: Queue,
+            context: ExecutionContext
+    ):
+        failed = False
+        while True:
+            data_container = input_queue.get()
+            if data_container is _END_OF_STREAM:
+                output_queue.put(_END_OF_STREAM)
+                return
+
+            if isinstance(data_container, BaseException):
+                failed = True
+                output_queue.put(data_container)
+                continue
+
+            if failed:
+                continue
+
+            try:
+                n_data_inputs = len(data_container)
+                start = time.perf_counter()
+                for _, sub_step in stage:
+                    data_container = sub_step.handle_transform(data_container, context)
+                statistics.add_batch(n_data_inputs, time.perf_counter() - start)
+                output_queue.put(data_container)
+            except Exception as error:
+                failed = True
+                output_queue.put(error)
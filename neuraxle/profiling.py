@@ -0,0 +1,436 @@
+"""
+Neuraxle's Profiling Classes
+====================================
+Classes to profile the execution of each step of a pipeline.
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+..
+    Thanks to Umaneo Technologies Inc. for their contributions to this Machine Learning
+    project, visit https://www.umaneo.com/ for more information on Umaneo Technologies Inc.
+
+"""
+import json
+import os
+import time
+import tracemalloc
+from collections import OrderedDict
+from threading import Lock, local
+from typing import Dict, List, Any
+
+import numpy as np
+
+from neuraxle.data_container import DataContainer
+
+_thread_time = getattr(time, 'thread_time', time.process_time)
+
+
+class StepProfile:
+    """
+    Accumulated measures of all of the calls to the handler methods of one step path.
+
+    .. seealso::
+        :class:`Profiler`
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self.calls: int = 0
+        self.wall_seconds: float = 0.0
+        self.cpu_seconds: float = 0.0
+        self.hashing_seconds: float = 0.0
+        self.rows_in: int = 0
+        self.rows_out: int = 0
+        self.peak_bytes: int = 0
+        self.retained_bytes: int = 0
+        self.output_bytes: int = 0
+
+    def user_seconds(self) -> float:
+        """
+        Returns the wall time that was not spent hashing the current ids, and the summary id.
+
+        :return: user code wall time in seconds
+        :rtype: float
+        """
+        return self.wall_seconds - self.hashing_seconds
+
+    def to_dict(self, include_memory: bool = False) -> Dict:
+        """
+        Returns the measures as a dict.
+
+        :param include_memory: also return the memory measures
+        :return: measures
+        :rtype: Dict
+        """
+        measures = OrderedDict([
+            ('calls', self.calls),
+            ('wall_seconds', self.wall_seconds),
+            ('cpu_seconds', self.cpu_seconds),
+            ('hashing_seconds', self.hashing_seconds),
+            ('user_seconds', self.user_seconds()),
+            ('rows_in', self.rows_in),
+            ('rows_out', self.rows_out)
+        ])
+        if include_memory:
+            measures['peak_bytes'] = self.peak_bytes
+            measures['retained_bytes'] = self.retained_bytes
+            measures['output_bytes'] = self.output_bytes
+        return measures
+
+    def __repr__(self):
+        return self.__class__.__name__ + '(path=' + repr(self.path) + ', ' + ', '.join(
+            '{0}={1}'.format(key, value) for key, value in self.to_dict().items()) + ')'
+
+
+class ProfilingToken:
+    """
+    Measures taken when a step handler method starts, returned by :func:`Profiler.start`.
+    """
+
+    def __init__(self, path: str, rows_in: int, memory_frame: 'MemoryFrame' = None):
+        self.path: str = path
+        self.rows_in: int = rows_in
+        self.memory_frame: MemoryFrame = memory_frame
+        self.wall_start: float = time.perf_counter()
+        self.cpu_start: float = _thread_time()
+
+
+class MemoryFrame:
+    """
+    Memory traced by ``tracemalloc`` when a step handler method starts, and the highest peak reached since.
+    """
+
+    def __init__(self, baseline_bytes: int):
+        self.baseline_bytes: int = baseline_bytes
+        self.peak_bytes: int = baseline_bytes
+
+
+class Profiler:
+    """
+    Opt-in profiler of a pipeline tree. The profiler is carried by the :class:`~neuraxle.base.ExecutionContext`,
+    and records for each step path of :func:`~neuraxle.base.ExecutionContext.get_path` the wall time,
+    the CPU time of the calling thread, the number of calls, the number of rows in and out,
+    and the time spent hashing in :func:`~neuraxle.base.BaseStep._did_process`.
+
+    .. code-block:: python
+
+        profiler = Profiler()
+        p = Pipeline([...])
+        p.set_profiler(profiler)
+        p.fit_transform(data_inputs, expected_outputs)
+
+        print(profiler.to_json())
+        profiler.save_collapsed_stacks('pipeline.folded')  # flamegraph.pl pipeline.folded > pipeline.svg
+
+    With ``trace_memory=True``, the profiler also records with ``tracemalloc`` the peak bytes allocated during each step
+    (relative to the memory traced when the step started), the bytes still traced after the step returns,
+    and the ``nbytes`` of the numpy arrays in the output :class:`~neuraxle.data_container.DataContainer`.
+    These memory measures are the largest of all of the calls to the step. ``tracemalloc`` is started if it isn't already,
+    and slows down the execution, so only enable it to find the step that balloons memory. When the profiler started
+    ``tracemalloc`` itself, it stops it once the outermost profiled step returns, or when it is detached with
+    :func:`~neuraxle.profiling.Profiler.stop_tracing_memory`.
+
+    .. code-block:: python
+
+        profiler = Profiler(trace_memory=True)
+        p.set_profiler(profiler)
+        p.fit_transform(data_inputs, expected_outputs)
+
+        biggest_step = max(profiler.profiles.values(), key=lambda profile: profile.peak_bytes)
+
+    The wall time and CPU time of a step include the time of its children steps, and so does the peak memory.
+    Steps running concurrently in other threads share the same traced memory, which blurs their memory measures.
+    Steps executed in another process (e.g.: with a ``loky`` backend) are profiled in a copy of the profiler, and aren't reported.
+
+    .. seealso::
+        :class:`StepProfile`,
+        :class:`~neuraxle.base.ExecutionContext`,
+        :func:`~neuraxle.pipeline.Pipeline.set_profiler`
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        # profiles are ordered by first call, so parents come before their children
+        self.profiles: Dict[str, StepProfile] = OrderedDict()
+        self.trace_memory: bool = trace_memory
+        self._lock = Lock()
+        self._memory_frames = local()
+        self._started_tracing: bool = False
+        self._active_memory_frames: int = 0
+
+    def start(self, path: str, data_container: DataContainer) -> ProfilingToken:
+        """
+        Start measuring a step handler method.
+
+        :param path: step path
+        :type path: str
+        :param data_container: data container received by the step
+        :type data_container: DataContainer
+        :return: profiling token to pass to :func:`~neuraxle.profiling.Profiler.stop`
+        :rtype: ProfilingToken
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            self._get_profile(path)
+
+        memory_frame = None
+        if self.trace_memory:
+            memory_frame = self._push_memory_frame()
+
+        return ProfilingToken(path=path, rows_in=_count_rows(data_container), memory_frame=memory_frame)
+
+    def stop(self, token: ProfilingToken, data_container: DataContainer = None):
+        """
+        Stop measuring a step handler method, and accumulate its measures.
+
+        :param token: profiling token returned by :func:`~neuraxle.profiling.Profiler.start`
+        :type token: ProfilingToken
+        :param data_container: data container returned by the step (None for fit)
+        :type data_container: DataContainer
+        :return:
+        """
+        wall_seconds = time.perf_counter() - token.wall_start
+        cpu_seconds = _thread_time() - token.cpu_start
+
+        if token.memory_frame is not None:
+            peak_bytes, retained_bytes = self._pop_memory_frame(token.memory_frame)
+
+        with self._lock:
+            profile = self._get_profile(token.path)
+            profile.calls += 1
+            profile.wall_seconds += wall_seconds
+            profile.cpu_seconds += cpu_seconds
+            profile.rows_in += token.rows_in
+            profile.rows_out += _count_rows(data_container)
+
+            if token.memory_frame is not None:
+                profile.peak_bytes = max(profile.peak_bytes, peak_bytes)
+                profile.retained_bytes = max(profile.retained_bytes, retained_bytes)
+                if data_container is not None:
+                    profile.output_bytes = max(
+                        profile.output_bytes,
+                        count_bytes(data_container.data_inputs) + count_bytes(data_container.expected_outputs)
+                    )
+
+    def _get_memory_frames(self) -> List[MemoryFrame]:
+        if not hasattr(self._memory_frames, 'frames'):
+            self._memory_frames.frames = []
+        return self._memory_frames.frames
+
+    def _push_memory_frame(self) -> MemoryFrame:
+        """
+        Start tracing the memory of a nested step. The peak reached so far is credited to the parent step,
+        and the tracemalloc peak is reset, so that the child peak can be measured alone.
+
+        :return: memory frame of the step
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._active_memory_frames += 1
+
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        frames = self._get_memory_frames()
+        if len(frames) > 0:
+            frames[-1].peak_bytes = max(frames[-1].peak_bytes, peak_bytes)
+        _reset_peak()
+
+        frame = MemoryFrame(baseline_bytes=current_bytes)
+        frames.append(frame)
+        return frame
+
+    def _pop_memory_frame(self, frame: MemoryFrame) -> (int, int):
+        """
+        Stop tracing the memory of a nested step, and credit its peak to its parent step.
+
+        :param frame: memory frame of the step
+        :return: peak bytes, retained bytes
+        """
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        frame.peak_bytes = max(frame.peak_bytes, peak_bytes)
+
+        frames = self._get_memory_frames()
+        if len(frames) > 0 and frames[-1] is frame:
+            frames.pop()
+        if len(frames) > 0:
+            frames[-1].peak_bytes = max(frames[-1].peak_bytes, frame.peak_bytes)
+        _reset_peak()
+
+        with self._lock:
+            self._active_memory_frames = max(0, self._active_memory_frames - 1)
+            if self._active_memory_frames == 0:
+                self._stop_tracing_if_started()
+
+        return frame.peak_bytes - frame.baseline_bytes, max(0, current_bytes - frame.baseline_bytes)
+
+    def stop_tracing_memory(self):
+        """
+        Stop ``tracemalloc`` if this profiler started it, and forget the memory frames of the steps still running.
+        This is called when the profiler is detached from a pipeline.
+
+        :return:
+        """
+        with self._lock:
+            self._active_memory_frames = 0
+            self._memory_frames = local()
+            self._stop_tracing_if_started()
+
+    def _stop_tracing_if_started(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def add_hashing_time(self, path: str, seconds: float):
+        """
+        Accumulate the time spent hashing the data container of a step.
+
+        :param path: step path
+        :type path: str
+        :param seconds: hashing duration
+        :type seconds: float
+        :return:
+        """
+        with self._lock:
+            self._get_profile(os.path.normpath(path)).hashing_seconds += seconds
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        del state['_memory_frames']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+        self._memory_frames = local()
+        self._started_tracing = False
+        self._active_memory_frames = 0
+
+    def _get_profile(self, path: str) -> StepProfile:
+        if path not in self.profiles:
+            self.profiles[path] = StepProfile(path)
+        return self.profiles[path]
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the profiles as a nested dict, where each step has its own measures, and the ones of its ``children``.
+
+        :return: nested report
+        :rtype: Dict
+        """
+        report = OrderedDict()
+        for path, profile in self.profiles.items():
+            node = report
+            for name in _split_path(path)[:-1]:
+                node = node.setdefault(name, OrderedDict([('children', OrderedDict())]))['children']
+
+            name = _split_path(path)[-1]
+            step_report = node.setdefault(name, OrderedDict([('children', OrderedDict())]))
+            children = step_report.pop('children')
+            step_report.update(profile.to_dict(include_memory=self.trace_memory))
+            step_report['children'] = children
+
+        return report
+
+    def to_json(self, path: str = None, indent: int = 4) -> str:
+        """
+        Returns the nested report of :func:`~neuraxle.profiling.Profiler.to_dict` as JSON, and saves it if a path is given.
+
+        :param path: optional file path to save the report to
+        :param indent: json indentation
+        :return: json report
+        :rtype: str
+        """
+        report = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, 'w') as file:
+                file.write(report)
+        return report
+
+    def to_collapsed_stacks(self) -> List[str]:
+        """
+        Returns flame graph compatible collapsed stacks: one ``parent;child;step microseconds`` line per step,
+        where the microseconds are the wall time spent in the step itself, excluding its profiled children.
+
+        :return: collapsed stack lines
+        :rtype: List[str]
+        """
+        self_seconds = OrderedDict((path, profile.wall_seconds) for path, profile in self.profiles.items())
+        for path, profile in self.profiles.items():
+            ancestor = self._find_profiled_ancestor(path)
+            if ancestor is not None:
+                self_seconds[ancestor] -= profile.wall_seconds
+
+        return [
+            '{0} {1}'.format(';'.join(_split_path(path)), max(0, int(round(seconds * 1e6))))
+            for path, seconds in self_seconds.items()
+        ]
+
+    def save_collapsed_stacks(self, path: str):
+        """
+        Save the collapsed stacks of :func:`~neuraxle.profiling.Profiler.to_collapsed_stacks` to a file,
+        that can be rendered with `flamegraph.pl <https://github.com/brendangregg/FlameGraph>`_, or speedscope.
+
+        :param path: file path
+        :return:
+        """
+        with open(path, 'w') as file:
+            file.write('\n'.join(self.to_collapsed_stacks()) + '\n')
+
+    def _find_profiled_ancestor(self, path: str):
+        ancestor = os.path.dirname(path)
+        while ancestor != '':
+            if ancestor in self.profiles:
+                return ancestor
+            if os.path.dirname(ancestor) == ancestor:
+                return None
+            ancestor = os.path.dirname(ancestor)
+        return None
+
+
+def _split_path(path: str) -> List[str]:
+    return [name for name in os.path.normpath(path).split(os.sep) if name != '']
+
+
+def _count_rows(data_container: DataContainer) -> int:
+    if data_container is None:
+        return 0
+    try:
+        return len(data_container.data_inputs)
+    except TypeError:
+        return 0
+
+
+def count_bytes(data: Any) -> int:
+    """
+    Count the bytes of the numpy arrays in the given data, including the arrays nested in lists, and tuples.
+    Other objects are not counted.
+
+    :param data: data inputs, or expected outputs
+    :return: number of bytes
+    :rtype: int
+    """
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, (list, tuple)):
+        return sum(count_bytes(item) for item in data)
+    return 0
+
+
+def _reset_peak():
+    # tracemalloc.reset_peak is only available in python 3.9+. Before, the peaks are the highest since tracing started.
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
@@ -27,16 +27,16 @@ import os
 import pickle
 import shutil
 from abc import abstractmethod, ABC
-from typing import Iterable, Any
+from typing import Iterable, Any, Callable
 
 from neuraxle.base import MetaStepMixin, BaseStep, NonFittableMixin, NonTransformableMixin, \
-    ExecutionContext
+    ExecutionContext, NeedsCurrentIdsMixin
 from neuraxle.data_container import DataContainer
 from neuraxle.pipeline import DEFAULT_CACHE_FOLDER
 from neuraxle.steps.misc import VALUE_CACHING
 
 
-class ValueCachingWrapper(MetaStepMixin, NonFittableMixin, NonTransformableMixin, BaseStep):
+class ValueCachingWrapper(MetaStepMixin, NonFittableMixin, NonTransformableMixin, NeedsCurrentIdsMixin, BaseStep):
     """
     Value caching wrapper wraps a step to cache the values.
     """
@@ -56,6 +56,15 @@ class ValueCachingWrapper(MetaStepMixin, NonFittableMixin, NonTransformableMixin
 
         self.cache_folder = cache_folder
 
+    def freeze(self) -> Callable:
+        """
+        The frozen callable transforms with the wrapped step directly, without reading or writing the cache.
+
+        :return: transform callable
+        :rtype: Callable
+        """
+        return self.wrapped.freeze()
+
     def _fit_transform_data_container(self, data_container: DataContainer, context: ExecutionContext) -> ('BaseStep', DataContainer):
         """
         Fit transform data container.
@@ -28,9 +28,8 @@ from typing import List, Tuple, Union
 
 import numpy as np
 
-from neuraxle.base import BaseStep, NonFittableMixin, MetaStepMixin
+from neuraxle.base import BaseStep, NonFittableMixin, MetaStepMixin, DataContainer, ExecutionContext
 from neuraxle.pipeline import Pipeline
-from neuraxle.steps.loop import ForEachDataInput
 from neuraxle.union import FeatureUnion
 
 ColumnSelectionType = Union[Tuple[int, BaseStep], Tuple[List[int], BaseStep], Tuple[slice, BaseStep]]
@@ -40,57 +39,64 @@ ColumnChooserTupleList = List[ColumnSelectionType]
 class ColumnSelector2D(NonFittableMixin, BaseStep):
     """
     A ColumnSelector2D selects column in a sequence.
+    The columns are selected on the last axis, with a view of the data inputs when the selected columns
+    are an int, a slice, a range, or a list of evenly spaced indices, and with a single fancy index otherwise.
     """
 
     def __init__(self, columns_selection: ColumnSelectionType):
         super().__init__()
         self.column_selection = columns_selection
+        self._indexer = _to_last_axis_indexer(columns_selection)
 
     def transform(self, data_inputs):
-        if isinstance(self.column_selection, range):
-            self.column_selection = slice(
-                self.column_selection.start,
-                self.column_selection.stop,
-                self.column_selection.step
-            )
+        if self.column_selection is None:
+            return data_inputs
 
-        if isinstance(self.column_selection, int):
-            return np.expand_dims(np.array(data_inputs)[:, self.column_selection], axis=-1)
+        return np.asarray(data_inputs)[..., self._indexer]
 
-        if isinstance(self.column_selection, slice):
-            return np.array(data_inputs)[:, self.column_selection]
 
-        if isinstance(self.column_selection, list):
-            columns = [
-                np.expand_dims(np.array(data_inputs)[:, i], axis=-1)
-                for i in self.column_selection
-            ]
-            return np.concatenate(columns, axis=-1)
+def _to_last_axis_indexer(column_selection: ColumnSelectionType) -> Union[slice, np.ndarray, None]:
+    """
+    Convert a column selection to an index of the last axis that keeps the last axis.
 
-        if self.column_selection is None:
-            return data_inputs
+    :param column_selection: an int, a slice, a range, a list of ints, or None
+    :return: a slice when possible, else an array of indices
+    """
+    if column_selection is None or isinstance(column_selection, slice):
+        return column_selection
 
-        raise ValueError(
-            'column selection type not supported : {0}\nSupported types'.format(
-                self.column_selection,
-                repr(ColumnSelectionType)
-            ))
+    if isinstance(column_selection, range):
+        return slice(column_selection.start, column_selection.stop, column_selection.step)
+
+    if isinstance(column_selection, (int, np.integer)):
+        return slice(column_selection, column_selection + 1 if column_selection != -1 else None)
+
+    if isinstance(column_selection, list):
+        if len(column_selection) > 1 and all(isinstance(i, (int, np.integer)) and i >= 0 for i in column_selection):
+            step = column_selection[1] - column_selection[0]
+            is_evenly_spaced = all(
+                b - a == step for a, b in zip(column_selection[:-1], column_selection[1:])
+            )
+            if is_evenly_spaced and step > 0:
+                return slice(column_selection[0], column_selection[-1] + 1, step)
+        return np.asarray(column_selection, dtype=int)
+
+    raise ValueError(
+        'column selection type not supported : {0}\nSupported types'.format(
+            column_selection,
+            repr(ColumnSelectionType)
+        ))
 
 
 class ColumnsSelectorND(MetaStepMixin, BaseStep):
     """
-    ColumnSelectorND wraps a ColumnSelector2D by as many ForEachDataInput step
-    as needed to select the last dimension.
+    ColumnSelectorND wraps a ColumnSelector2D to select the last dimension.
+    The ColumnSelector2D indexes the last axis directly, so the data inputs can have any number of dimensions.
     """
 
     def __init__(self, columns_selection, n_dimension=3):
         BaseStep.__init__(self)
-
-        col_selector = ColumnSelector2D(columns_selection=columns_selection)
-        for _ in range(min(0, n_dimension - 2)):
-            col_selector = ForEachDataInput(col_selector)
-
-        MetaStepMixin.__init__(self, col_selector)
+        MetaStepMixin.__init__(self, ColumnSelector2D(columns_selection=columns_selection))
         self.n_dimension = n_dimension
 
     def fit(self, data_inputs, expected_outputs=None) -> 'BaseStep':
@@ -125,7 +131,12 @@ class ColumnTransformer(FeatureUnion):
         :class:`FeatureUnion`,
     """
 
-    def __init__(self, column_chooser_steps_as_tuple: ColumnChooserTupleList, n_dimension: int = 3):
+    def __init__(
+            self,
+            column_chooser_steps_as_tuple: ColumnChooserTupleList,
+            n_dimension: int = 3,
+            share_common_prefixes: bool = False
+    ):
         # Make unique names from the indices in case we have many steps for transforming the same column(s).
         self.string_indices = [
             str(name) + "_" + str(step.__class__.__name__)
@@ -138,4 +149,18 @@ class ColumnTransformer(FeatureUnion):
                 step
             ]))
             for string_indices, (indices, step) in zip(self.string_indices, column_chooser_steps_as_tuple)
-        ])
+        ], share_common_prefixes=share_common_prefixes)
+
+    def _will_process(self, data_container: DataContainer, context: ExecutionContext) -> (
+            DataContainer, ExecutionContext):
+        """
+        Convert the data inputs to a numpy array once, so that each column selector only indexes it.
+        The array is set on a copy of the data container, so that the caller's data container is left as is.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: data container, execution context
+        """
+        data_container = data_container.copy()
+        data_container.set_data_inputs(np.asarray(data_container.data_inputs))
+        return FeatureUnion._will_process(self, data_container, context)
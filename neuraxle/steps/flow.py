@@ -24,12 +24,13 @@ Pipeline wrapper steps that only implement the handle methods, and don't apply a
 
 """
 from abc import abstractmethod
-from typing import Union
+from typing import Union, Callable, List
 
-from neuraxle.base import BaseStep, MetaStepMixin, DataContainer, ExecutionContext, TruncableSteps, ResumableStepMixin
+from neuraxle.base import BaseStep, MetaStepMixin, DataContainer, ExecutionContext, TruncableSteps, \
+    ResumableStepMixin, FrozenStep, ExecutionMode, NeedsCurrentIdsMixin
 from neuraxle.data_container import ExpandedDataContainer
 from neuraxle.hyperparams.space import HyperparameterSamples
-from neuraxle.union import FeatureUnion
+from neuraxle.union import FeatureUnion, FrozenFeatureUnion
 
 
 class ForceMustHandleMixin:
@@ -58,6 +59,9 @@ class ForceMustHandleMixin:
             'BaseStep', DataContainer):
         raise NotImplementedError('Must implement handle_fit_transform in {0}'.format(self.name))
 
+    def freeze(self) -> Callable:
+        return FrozenStep(self)
+
     def transform(self, data_inputs) -> 'ForceMustHandleMixin':
         raise Exception(
             'Transform method is not supported for {0}, because it inherits from ForceHandleMixin. Please use handle_transform instead.'.format(
@@ -292,6 +296,17 @@ class Optional(ForceMustHandleMixin, MetaStepMixin, BaseStep):
             expected_outputs=self.nullified_return_value
         )
 
+    def freeze(self) -> Callable:
+        """
+        Freeze the wrapped step directly when it is enabled.
+
+        :return: transform callable
+        :rtype: Callable
+        """
+        if self.hyperparams[OPTIONAL_ENABLED_HYPERPARAM]:
+            return self.wrapped.freeze()
+        return FrozenStep(self)
+
     def _nullify_hyperparams(self):
         """
         Nullify wrapped step hyperparams using hyperparams_space.nullify().
@@ -300,7 +315,127 @@ class Optional(ForceMustHandleMixin, MetaStepMixin, BaseStep):
         self.wrapped.set_hyperparams(hyperparams_space.nullify())
 
 
-class ChooseOneOrManyStepsOf(FeatureUnion):
+class BaseChooseStepsOf(FeatureUnion):
+    """
+    Base class of the feature unions of :class:`Optional` steps chosen with hyperparameters.
+    Only the enabled steps are called: the disabled steps are nullified without copying the data container for them,
+    and the joiner is skipped when a single step is enabled.
+
+    .. seealso::
+        :class:`ChooseOneOrManyStepsOf`,
+        :class:`ChooseOneStepOf`,
+        :class:`Optional`
+    """
+
+    def _fit_branches(self, data_container: DataContainer, context: ExecutionContext) -> BaseStep:
+        """
+        Fit the enabled steps, and nullify the disabled ones.
+        This is called by both the fit and the fit transform of the :class:`FeatureUnion`.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: self
+        """
+        enabled_steps_indexes = self._get_enabled_steps_indexes()
+        if len(enabled_steps_indexes) == 0:
+            return FeatureUnion._fit_branches(self, data_container, context)
+
+        fitted_steps = self._handle_enabled_steps(ExecutionMode.FIT, enabled_steps_indexes, data_container, context)
+
+        for i, fitted_step in zip(enabled_steps_indexes, fitted_steps):
+            self.steps_as_tuple[i] = (self.steps_as_tuple[i][0], fitted_step)
+        self._refresh_steps()
+
+        return self
+
+    def _transform_data_container(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Transform the data with the enabled steps, and nullify the disabled ones.
+        When a single step is enabled, its outputs are returned as is.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: transformed data container
+        """
+        enabled_steps_indexes = self._get_enabled_steps_indexes()
+        if len(enabled_steps_indexes) == 0:
+            return FeatureUnion._transform_data_container(self, data_container, context)
+
+        data_containers = self._handle_enabled_steps(
+            ExecutionMode.TRANSFORM, enabled_steps_indexes, data_container, context)
+
+        if len(data_containers) == 1:
+            return DataContainer(
+                summary_id=data_container.summary_id,
+                current_ids=data_container.current_ids,
+                data_inputs=data_containers[0].data_inputs,
+                expected_outputs=data_container.expected_outputs
+            )
+        return self._create_union_data_container(data_container, data_containers)
+
+    def _did_transform(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        if len(self._get_enabled_steps_indexes()) == 1:
+            return data_container
+        return FeatureUnion._did_transform(self, data_container, context)
+
+    def _did_fit_transform(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        if len(self._get_enabled_steps_indexes()) == 1:
+            return data_container
+        return FeatureUnion._did_fit_transform(self, data_container, context)
+
+    def freeze(self) -> Callable:
+        """
+        Freeze only the enabled steps. When a single step is enabled, it is frozen directly.
+
+        :return: transform callable
+        :rtype: Callable
+        """
+        enabled_steps_indexes = self._get_enabled_steps_indexes()
+        if len(enabled_steps_indexes) == 0:
+            return FeatureUnion.freeze(self)
+        if len(enabled_steps_indexes) == 1:
+            return self.steps_as_tuple[enabled_steps_indexes[0]][1].freeze()
+
+        return FrozenFeatureUnion(
+            [self.steps_as_tuple[i][1].freeze() for i in enabled_steps_indexes],
+            self.joiner.freeze()
+        )
+
+    def _get_enabled_steps_indexes(self) -> List[int]:
+        return [
+            i for i, (_, step) in enumerate(self.steps_as_tuple)
+            if step.hyperparams[OPTIONAL_ENABLED_HYPERPARAM]
+        ]
+
+    def _handle_enabled_steps(
+            self,
+            execution_mode: ExecutionMode,
+            enabled_steps_indexes: List[int],
+            data_container: DataContainer,
+            context: ExecutionContext
+    ) -> List:
+        """
+        Call the handler method of the enabled steps for the execution mode, in parallel if there is more than one,
+        and nullify the hyperparams of the disabled steps like :class:`Optional` does.
+
+        :param execution_mode: ``ExecutionMode.FIT``, or ``ExecutionMode.TRANSFORM``
+        :param enabled_steps_indexes: indexes of the enabled steps
+        :param data_container: data container
+        :param context: execution context
+        :return: results of the enabled steps
+        """
+        for i, (_, step) in enumerate(self.steps_as_tuple):
+            if i not in enabled_steps_indexes:
+                step._nullify_hyperparams()
+
+        handle_method_name = 'handle_fit' if execution_mode == ExecutionMode.FIT else 'handle_transform'
+        return self._handle_branches([
+            (name, getattr(step, handle_method_name), (data_container.copy(), context))
+            for name, step in (self.steps_as_tuple[i] for i in enabled_steps_indexes)
+        ], execution_mode)
+
+
+class ChooseOneOrManyStepsOf(BaseChooseStepsOf):
     """
     A pipeline to allow choosing many steps using an hyperparameter.
 
@@ -332,7 +467,7 @@ class ChooseOneOrManyStepsOf(FeatureUnion):
     """
 
     def __init__(self, steps, hyperparams=None):
-        FeatureUnion.__init__(self, steps)
+        BaseChooseStepsOf.__init__(self, steps)
 
         if hyperparams is None:
             self.set_hyperparams(HyperparameterSamples({}))
@@ -354,7 +489,7 @@ class ChooseOneOrManyStepsOf(FeatureUnion):
 CHOICE_HYPERPARAM = 'choice'
 
 
-class ChooseOneStepOf(FeatureUnion):
+class ChooseOneStepOf(BaseChooseStepsOf):
     """
     A pipeline to allow choosing one step using an hyperparameter.
 
@@ -385,7 +520,7 @@ class ChooseOneStepOf(FeatureUnion):
     """
 
     def __init__(self, steps, hyperparams=None):
-        FeatureUnion.__init__(self, steps)
+        BaseChooseStepsOf.__init__(self, steps)
 
         self._make_all_steps_optional()
 
@@ -434,6 +569,7 @@ class ChooseOneStepOf(FeatureUnion):
 
 class ExpandDim(
     ResumableStepMixin,
+    NeedsCurrentIdsMixin,
     MetaStepMixin,
     BaseStep
 ):
@@ -521,8 +657,9 @@ class ReversiblePreprocessingWrapper(ForceMustHandleMixin, TruncableSteps):
         self["postprocessing_step"] = \
             self["postprocessing_step"].handle_fit(data_container, context.push(self["postprocessing_step"]))
 
-        current_ids = self.hash(data_container)
-        data_container.set_current_ids(current_ids)
+        if context.hashing:
+            current_ids = self.hash(data_container)
+            data_container.set_current_ids(current_ids)
 
         return self
 
@@ -549,8 +686,9 @@ class ReversiblePreprocessingWrapper(ForceMustHandleMixin, TruncableSteps):
         data_container = self["preprocessing_step"].handle_inverse_transform(data_container,
                                                                              context.push(self["preprocessing_step"]))
 
-        current_ids = self.hash(data_container)
-        data_container.set_current_ids(current_ids)
+        if context.hashing:
+            current_ids = self.hash(data_container)
+            data_container.set_current_ids(current_ids)
 
         return data_container
 
@@ -581,7 +719,8 @@ class ReversiblePreprocessingWrapper(ForceMustHandleMixin, TruncableSteps):
         data_container = self["preprocessing_step"].handle_inverse_transform(data_container,
                                                                              context.push(self["preprocessing_step"]))
 
-        current_ids = self.hash(data_container)
-        data_container.set_current_ids(current_ids)
+        if context.hashing:
+            current_ids = self.hash(data_container)
+            data_container.set_current_ids(current_ids)
 
         return self, data_container
@@ -23,7 +23,11 @@ Pipeline Steps For Looping
 
 """
 import copy
-from typing import List, Any
+import io
+import pickle
+from typing import List, Any, Union, Callable
+
+import numpy as np
 
 from neuraxle.base import MetaStepMixin, BaseStep, DataContainer, ExecutionContext, ResumableStepMixin
 from neuraxle.data_container import ListDataContainer
@@ -33,14 +37,40 @@ from neuraxle.hyperparams.space import HyperparameterSamples, HyperparameterSpac
 class ForEachDataInput(ResumableStepMixin, MetaStepMixin, BaseStep):
     """
     Truncable step that fits/transforms each step for each of the data inputs, and expected outputs.
+
+    With ``n_jobs``, the data inputs are transformed in parallel with ``joblib.Parallel``, which sends them to the
+    workers by batches of ``batch_size`` data inputs, and returns the outputs in order. The wrapped step is shared
+    by the threads of the threading backend, so its transform must not modify it. The other backends pickle
+    the wrapped step with each batch: with ``batch_size="auto"``, each job gets a single batch of its share of the
+    data inputs, so that the wrapped step is sent once per job. Fitting stays sequential,
+    because each data input fits the wrapped step fitted on the previous ones.
+
+    .. code-block:: python
+
+        ForEachDataInput(Pipeline([...]), n_jobs=4, backend='loky', batch_size=64)
+
     """
 
     def __init__(
             self,
-            wrapped: BaseStep
+            wrapped: BaseStep,
+            n_jobs: int = 1,
+            backend: str = 'threading',
+            batch_size: Union[int, str] = 'auto'
     ):
+        """
+        Create a for each data input step.
+
+        :param wrapped: step to fit, and transform on each data input
+        :param n_jobs: The number of jobs to transform the data inputs in parallel. With 1, they are transformed one after the other.
+        :param backend: The type of parallelization of the ``joblib.Parallel`` loop in transform. Possible values: "loky", "multiprocessing", "threading", and more.
+        :param batch_size: The number of data inputs dispatched at once to each worker, or "auto" to let joblib adapt it with the threading backend, and to dispatch one batch per job with the other backends.
+        """
         MetaStepMixin.__init__(self, wrapped)
         BaseStep.__init__(self)
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.batch_size = batch_size
 
     def fit(self, data_inputs, expected_outputs=None):
         if expected_outputs is None:
@@ -77,6 +107,9 @@ class ForEachDataInput(ResumableStepMixin, MetaStepMixin, BaseStep):
         :type data_inputs: Iterable
         :return: outputs
         """
+        if self.n_jobs != 1:
+            return self._run_in_parallel(_transform_data_inputs, list(data_inputs))
+
         outputs = []
         for di in data_inputs:
             outputs.append(self.wrapped.transform(di))
@@ -95,6 +128,18 @@ class ForEachDataInput(ResumableStepMixin, MetaStepMixin, BaseStep):
         """
         output_data_container = ListDataContainer.empty()
 
+        if self.n_jobs != 1:
+            if self.backend != 'threading':
+                context = context.strip()
+            items = list(data_container)
+            outputs = self._run_in_parallel(
+                _handle_transform_data_inputs, [(di, eo) for _, di, eo in items], context)
+            for (current_id, _, _), (output_di, output_eo) in zip(items, outputs):
+                output_data_container.append(current_id, output_di, output_eo)
+            output_data_container.summary_id = data_container.summary_id
+
+            return output_data_container
+
         for current_id, di, eo in data_container:
             output = self.wrapped.handle_transform(
                 DataContainer(current_ids=None, data_inputs=di, expected_outputs=eo),
@@ -110,6 +155,35 @@ class ForEachDataInput(ResumableStepMixin, MetaStepMixin, BaseStep):
 
         return output_data_container
 
+    def _run_in_parallel(self, function: Callable, items: List, *args) -> List:
+        """
+        Call ``function(self.wrapped, items_batch, *args)`` on the batches of the items in parallel.
+        With the threading backend, each item is a call, and ``joblib.Parallel`` groups the calls by ``batch_size``.
+        With the other backends, the batches are made here, so that each call pickles the wrapped step only once.
+
+        :param function: module function transforming a list of items with the wrapped step
+        :param items: items to transform
+        :param args: other arguments of the function
+        :return: outputs of the items, in order
+        """
+        from joblib import Parallel, delayed, effective_n_jobs
+
+        if self.backend == 'threading':
+            items_per_call = 1
+            batch_size = self.batch_size
+        elif self.batch_size == 'auto':
+            items_per_call = max(1, -(-len(items) // effective_n_jobs(self.n_jobs)))
+            batch_size = 1
+        else:
+            items_per_call = self.batch_size
+            batch_size = 1
+
+        outputs_per_call = Parallel(n_jobs=self.n_jobs, backend=self.backend, batch_size=batch_size)(
+            delayed(function)(self.wrapped, items[i:i + items_per_call], *args)
+            for i in range(0, len(items), items_per_call)
+        )
+        return [output for outputs in outputs_per_call for output in outputs]
+
     def fit_transform(self, data_inputs, expected_outputs=None):
         """
         Fit transform each step for each data inputs, and expected outputs
@@ -174,13 +248,63 @@ class ForEachDataInput(ResumableStepMixin, MetaStepMixin, BaseStep):
         return False
 
 
+def _transform_data_inputs(step: BaseStep, data_inputs: List) -> List:
+    return [step.transform(di) for di in data_inputs]
+
+
+def _handle_transform_data_inputs(step: BaseStep, data_inputs_expected_outputs: List, context: ExecutionContext) -> List:
+    return [_handle_transform_data_input(step, di, eo, context) for di, eo in data_inputs_expected_outputs]
+
+
+def _handle_transform_data_input(step: BaseStep, data_input: Any, expected_output: Any, context: ExecutionContext):
+    output = step.handle_transform(
+        DataContainer(current_ids=None, data_inputs=data_input, expected_outputs=expected_output),
+        context
+    )
+    return output.data_inputs, output.expected_outputs
+
+
 class StepClonerForEachDataInput(MetaStepMixin, BaseStep):
-    def __init__(self, wrapped: BaseStep, copy_op=copy.deepcopy):
+    """
+    Fit a clone of the wrapped step for each data input, and transform each data input with its own clone.
+
+    The wrapped step is pickled once per fit, and each clone is unpickled from it right before its fit, instead of
+    deep copying the wrapped step for every data input up front. The read-only numpy arrays of the wrapped step
+    (e.g.: ``array.setflags(write=False)``) aren't copied: all the clones share them, and they are pickled only once
+    with the fitted clones. If the wrapped step can't be pickled, or if a ``copy_op`` is given, each clone is made
+    with ``copy_op`` instead.
+
+    With ``n_jobs``, the clones are fitted in parallel with ``joblib.Parallel``. Process workers send back
+    the fitted clones pickled without the shared arrays, so that they stay shared in the parent process.
+
+    .. code-block:: python
+
+        StepClonerForEachDataInput(Pipeline([...]), n_jobs=4, backend='loky')
+
+    """
+
+    def __init__(
+            self,
+            wrapped: BaseStep,
+            copy_op: Callable[[BaseStep], BaseStep] = None,
+            n_jobs: int = 1,
+            backend: str = 'loky'
+    ):
+        """
+        Create a step cloner for each data input.
+
+        :param wrapped: step to clone, and fit for each data input
+        :param copy_op: function to clone the wrapped step. By default, the wrapped step is pickled once, and unpickled for each clone.
+        :param n_jobs: The number of jobs to fit the clones in parallel. With 1, they are fitted one after the other.
+        :param backend: The type of parallelization of the ``joblib.Parallel`` loop in fit. Possible values: "loky", "multiprocessing", "threading", and more.
+        """
         BaseStep.__init__(self)
         MetaStepMixin.__init__(self, wrapped)
         self.set_step(wrapped)
         self.steps: List[BaseStep] = []
         self.copy_op = copy_op
+        self.n_jobs = n_jobs
+        self.backend = backend
 
     def set_hyperparams(self, hyperparams: HyperparameterSamples) -> BaseStep:
         MetaStepMixin.set_hyperparams(self, hyperparams)
@@ -211,32 +335,141 @@ class StepClonerForEachDataInput(MetaStepMixin, BaseStep):
         return self
 
     def fit_transform(self, data_inputs, expected_outputs=None) -> ('BaseStep', Any):
-        # One copy of step per data input:
-        self.steps = [self.copy_op(self.wrapped) for _ in range(len(data_inputs))]
-
-        if expected_outputs is None:
-            expected_outputs = [None] * len(data_inputs)
-
-        fit_transform_result = [self.steps[i].fit_transform(di, eo) for i, (di, eo) in
-                                enumerate(zip(data_inputs, expected_outputs))]
+        fit_transform_result = self._fit_clones(_fit_transform_clone, data_inputs, expected_outputs)
         self.steps = [step for step, di in fit_transform_result]
         data_inputs = [di for step, di in fit_transform_result]
 
         return self, data_inputs
 
     def fit(self, data_inputs: List, expected_outputs: List = None) -> 'StepClonerForEachDataInput':
-        # One copy of step per data input:
-        self.steps = [self.copy_op(self.wrapped) for _ in range(len(data_inputs))]
+        self.steps = self._fit_clones(_fit_clone, data_inputs, expected_outputs)
+        return self
+
+    def _fit_data_container(self, data_container: DataContainer, context: ExecutionContext) -> BaseStep:
+        self.steps = self._fit_clones(_fit_clone, data_container.data_inputs, data_container.expected_outputs)
+        return self
+
+    def _fit_transform_data_container(self, data_container: DataContainer, context: ExecutionContext) -> (
+            BaseStep, DataContainer):
+        new_self, outputs = self.fit_transform(data_container.data_inputs, data_container.expected_outputs)
+        data_container.set_data_inputs(outputs)
+        return new_self, data_container
+
+    def _transform_data_container(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        data_container.set_data_inputs(self.transform(data_container.data_inputs))
+        return data_container
+
+    def _fit_clones(self, fit_function: Callable, data_inputs: List, expected_outputs: List = None) -> List:
+        """
+        Clone the wrapped step for each data input right before fitting it, in parallel if ``n_jobs`` isn't 1.
 
-        # Fit them all.
+        :param fit_function: ``_fit_clone``, or ``_fit_transform_clone``
+        :param data_inputs: data inputs
+        :param expected_outputs: expected outputs
+        :return: results of the fit function for each data input
+        """
         if expected_outputs is None:
             expected_outputs = [None] * len(data_inputs)
-        self.steps = [self.steps[i].fit(di, eo) for i, (di, eo) in enumerate(zip(data_inputs, expected_outputs))]
 
-        return self
+        cloner = self._create_cloner()
+        send_pickled = self.n_jobs != 1 and self.backend != 'threading' and isinstance(cloner, _StepTemplate)
+
+        if self.n_jobs != 1:
+            from joblib import Parallel, delayed
+
+            results = Parallel(n_jobs=self.n_jobs, backend=self.backend)(
+                delayed(fit_function)(cloner, di, eo, send_pickled)
+                for di, eo in zip(data_inputs, expected_outputs)
+            )
+        else:
+            results = [
+                fit_function(cloner, di, eo, send_pickled)
+                for di, eo in zip(data_inputs, expected_outputs)
+            ]
+
+        if send_pickled:
+            results = [cloner.loads(result) for result in results]
+        return results
+
+    def _create_cloner(self) -> Union['_StepTemplate', '_StepCopier']:
+        if self.copy_op is None:
+            try:
+                return _StepTemplate(self.wrapped)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                pass
+        return _StepCopier(self.wrapped, self.copy_op or copy.deepcopy)
 
     def transform(self, data_inputs: List) -> List:
         return [self.steps[i].transform(di) for i, di in enumerate(data_inputs)]
 
     def inverse_transform(self, data_output):
         return [self.steps[i].inverse_transform(di) for i, di in enumerate(data_output)]
+
+
+class _StepTemplate:
+    """
+    Unfitted step pickled once to make its clones. The read-only numpy arrays are kept out of the pickle,
+    and shared by all the clones.
+    """
+
+    def __init__(self, step: BaseStep):
+        self.shared_arrays: List[np.ndarray] = []
+        self._is_collecting_shared_arrays = True
+        self.pickled_step = self.dumps(step)
+        self._is_collecting_shared_arrays = False
+
+    def clone(self) -> BaseStep:
+        return self.loads(self.pickled_step)
+
+    def dumps(self, obj: Any) -> bytes:
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self._persistent_id
+        pickler.dump(obj)
+        return buffer.getvalue()
+
+    def loads(self, pickled: bytes) -> Any:
+        unpickler = pickle.Unpickler(io.BytesIO(pickled))
+        unpickler.persistent_load = self.shared_arrays.__getitem__
+        return unpickler.load()
+
+    def _persistent_id(self, obj: Any):
+        if not isinstance(obj, np.ndarray):
+            return None
+
+        for i, shared_array in enumerate(self.shared_arrays):
+            if shared_array is obj:
+                return i
+
+        if self._is_collecting_shared_arrays and not obj.flags.writeable:
+            self.shared_arrays.append(obj)
+            return len(self.shared_arrays) - 1
+        return None
+
+
+class _StepCopier:
+    """
+    Unfitted step cloned with a copy function.
+    """
+
+    def __init__(self, step: BaseStep, copy_op: Callable[[BaseStep], BaseStep]):
+        self.step = step
+        self.copy_op = copy_op
+
+    def clone(self) -> BaseStep:
+        return self.copy_op(self.step)
+
+
+def _fit_clone(cloner: Union[_StepTemplate, _StepCopier], data_input: Any, expected_output: Any, send_pickled: bool):
+    step = cloner.clone().fit(data_input, expected_output)
+    return cloner.dumps(step) if send_pickled else step
+
+
+def _fit_transform_clone(
+        cloner: Union[_StepTemplate, _StepCopier],
+        data_input: Any,
+        expected_output: Any,
+        send_pickled: bool
+):
+    step, output = cloner.clone().fit_transform(data_input, expected_output)
+    return cloner.dumps((step, output)) if send_pickled else (step, output)
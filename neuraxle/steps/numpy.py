@@ -24,9 +24,12 @@ Those steps works with NumPy (np) arrays.
 
 """
 
+from abc import abstractmethod
+from typing import List, Callable
+
 import numpy as np
 
-from neuraxle.base import NonFittableMixin, BaseStep, DataContainer
+from neuraxle.base import NonFittableMixin, BaseStep, DataContainer, TruncableSteps, NamedTupleList
 from neuraxle.hyperparams.space import HyperparameterSamples
 
 
@@ -72,6 +75,15 @@ class NumpyConcatenateOnCustomAxis(NonFittableMixin, BaseStep):
 
         return data_container
 
+    def freeze(self) -> Callable:
+        """
+        Freeze the joiner into its transform method, which joins the list of the outputs of the branches.
+
+        :return: transform callable
+        :rtype: Callable
+        """
+        return self.transform
+
     def transform(self, data_inputs):
         """
         Apply the concatenation transformation along the specified axis.
@@ -134,6 +146,16 @@ class NumpyTranspose(NonFittableMixin, BaseStep):
 
         return data_container
 
+    def freeze(self) -> Callable:
+        """
+        Freeze the step into its transform method, which transposes the outputs of the branches
+        stacked in a numpy array.
+
+        :return: transform callable
+        :rtype: Callable
+        """
+        return self.transform
+
     def transform(self, data_inputs):
         return self._transpose(data_inputs)
 
@@ -166,7 +188,54 @@ class NumpyShapePrinter(NonFittableMixin, BaseStep):
         print(self.__class__.__name__ + " (one):", data_input.shape, self.custom_message)
 
 
-class MultiplyByN(NonFittableMixin, BaseStep):
+class ElementwiseMixin:
+    """
+    A non fittable step whose transform, and inverse transform are elementwise numpy operations.
+    The operations write their result in the ``out`` array when it is given (like a numpy ufunc),
+    so that a chain of elementwise steps can be fused by :func:`fuse_elementwise_steps` into one
+    :class:`FusedElementwiseSteps` that evaluates the chain in a single output buffer.
+
+    .. seealso::
+        :class:`MultiplyByN`,
+        :class:`AddN`
+    """
+
+    @abstractmethod
+    def _transform_into(self, data_inputs: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Transform the data inputs elementwise.
+
+        :param data_inputs: data inputs
+        :param out: array to write the outputs in, or None to allocate a new array
+        :return: outputs
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _inverse_transform_into(self, processed_outputs: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Inverse transform the processed outputs elementwise.
+
+        :param processed_outputs: processed outputs
+        :param out: array to write the data inputs in, or None to allocate a new array
+        :return: data inputs
+        """
+        raise NotImplementedError()
+
+    def transform(self, data_inputs):
+        if not isinstance(data_inputs, np.ndarray):
+            data_inputs = np.array(data_inputs)
+
+        return self._transform_into(data_inputs)
+
+    def inverse_transform(self, processed_outputs):
+        if not isinstance(processed_outputs, np.ndarray):
+            processed_outputs = np.array(processed_outputs)
+
+        return self._inverse_transform_into(processed_outputs)
+
+
+class MultiplyByN(ElementwiseMixin, NonFittableMixin, BaseStep):
     """
     Step to multiply a numpy array.
     Accepts an integer for the number to multiply by.
@@ -182,6 +251,7 @@ class MultiplyByN(NonFittableMixin, BaseStep):
         # outputs => np.array([3])
 
     .. seealso::
+        :class:`ElementwiseMixin`,
         :class:`NonFittableMixin`,
         :class:`BaseStep`
     """
@@ -194,20 +264,14 @@ class MultiplyByN(NonFittableMixin, BaseStep):
             })
         )
 
-    def transform(self, data_inputs):
-        if not isinstance(data_inputs, np.ndarray):
-            data_inputs = np.array(data_inputs)
+    def _transform_into(self, data_inputs, out=None):
+        return np.multiply(data_inputs, self.hyperparams['multiply_by'], out=out)
 
-        return data_inputs * self.hyperparams['multiply_by']
-
-    def inverse_transform(self, data_inputs):
-        if not isinstance(data_inputs, np.ndarray):
-            data_inputs = np.array(data_inputs)
+    def _inverse_transform_into(self, processed_outputs, out=None):
+        return np.true_divide(processed_outputs, self.hyperparams['multiply_by'], out=out)
 
-        return data_inputs / self.hyperparams['multiply_by']
 
-
-class AddN(NonFittableMixin, BaseStep):
+class AddN(ElementwiseMixin, NonFittableMixin, BaseStep):
     """
     Step to add a scalar to a numpy array.
     Accepts an integer for the number to add to every data inputs.
@@ -223,6 +287,7 @@ class AddN(NonFittableMixin, BaseStep):
         # outputs => np.array([2])
 
     .. seealso::
+        :class:`ElementwiseMixin`,
         :class:`NonFittableMixin`,
         :class:`BaseStep`
     """
@@ -235,17 +300,134 @@ class AddN(NonFittableMixin, BaseStep):
             })
         )
 
+    def _transform_into(self, data_inputs, out=None):
+        return np.add(data_inputs, self.hyperparams['add'], out=out)
+
+    def _inverse_transform_into(self, processed_outputs, out=None):
+        return np.subtract(processed_outputs, self.hyperparams['add'], out=out)
+
+
+class FusedElementwiseSteps(NonFittableMixin, TruncableSteps):
+    """
+    Chain of :class:`ElementwiseMixin` steps evaluated in a single output buffer:
+    the output array is allocated once (or the data inputs are reused, when they were just converted to an array),
+    and every step of the chain writes its result in it, in place.
+
+    The steps are kept as sub steps, so their hyperparameters can still be read, and set.
+    The fused steps are usually created by :func:`fuse_elementwise_steps`.
+
+    .. code-block:: python
+
+        fused = FusedElementwiseSteps([MultiplyByN(2), AddN(1), MultiplyByN(3)])
+        outputs = fused.transform(np.array([1, 2]))  # ((x * 2) + 1) * 3
+        data_inputs = fused.inverse_transform(outputs)
+
+    .. seealso::
+        :func:`fuse_elementwise_steps`,
+        :class:`ElementwiseMixin`
+    """
+
+    def __init__(self, steps_as_tuple: NamedTupleList):
+        NonFittableMixin.__init__(self)
+        TruncableSteps.__init__(self, steps_as_tuple=steps_as_tuple)
+
     def transform(self, data_inputs):
-        if not isinstance(data_inputs, np.ndarray):
-            data_inputs = np.array(data_inputs)
+        elementwise_steps = list(self.values())
+        return self._evaluate_chain(
+            data_inputs,
+            [step._transform_into for step in elementwise_steps]
+        )
 
-        return data_inputs + self.hyperparams['add']
+    def inverse_transform(self, processed_outputs):
+        elementwise_steps = list(reversed(self.values()))
+        return self._evaluate_chain(
+            processed_outputs,
+            [step._inverse_transform_into for step in elementwise_steps]
+        )
 
-    def inverse_transform(self, data_inputs):
-        if not isinstance(data_inputs, np.ndarray):
+    def _evaluate_chain(self, data_inputs, operations: List) -> np.ndarray:
+        """
+        Apply the elementwise operations one after the other in a single output buffer.
+        The dtype of the buffer is the dtype of the result of the whole chain,
+        which is found by applying the chain on an empty array.
+
+        :param data_inputs: data inputs
+        :param operations: ``_transform_into``, or ``_inverse_transform_into`` methods of the steps
+        :return: outputs
+        """
+        is_converted = not isinstance(data_inputs, np.ndarray)
+        if is_converted:
             data_inputs = np.array(data_inputs)
 
-        return data_inputs - self.hyperparams['add']
+        outputs_dtype = data_inputs.dtype
+        for operation in operations:
+            outputs_dtype = operation(np.empty(0, dtype=outputs_dtype)).dtype
+
+        if is_converted and data_inputs.dtype == outputs_dtype:
+            outputs = data_inputs
+        else:
+            outputs = np.empty(data_inputs.shape, dtype=outputs_dtype)
+
+        for operation in operations:
+            operation(data_inputs, out=outputs)
+            data_inputs = outputs
+
+        return outputs
+
+
+def fuse_elementwise_steps(steps: TruncableSteps) -> TruncableSteps:
+    """
+    Optimization pass that replaces each run of two or more consecutive :class:`ElementwiseMixin` steps
+    of a pipeline by one :class:`FusedElementwiseSteps`. Nested pipelines are fused too.
+    The pipeline is modified in place, and returned.
+
+    .. code-block:: python
+
+        p = Pipeline([MultiplyByN(2), AddN(1), NumpyTranspose(), AddN(2), MultiplyByN(3)])
+        p = fuse_elementwise_steps(p)
+        # Pipeline([FusedElementwiseSteps([MultiplyByN, AddN]), NumpyTranspose, FusedElementwiseSteps1([AddN, MultiplyByN])])
+
+    The hyperparameters of the fused steps are nested under the name of their :class:`FusedElementwiseSteps`.
+
+    :param steps: pipeline to optimize
+    :type steps: TruncableSteps
+    :return: the optimized pipeline
+    :rtype: TruncableSteps
+    """
+    from neuraxle.pipeline import BasePipeline
+
+    fused_steps_as_tuple = []
+    elementwise_run = []
+    names_yet = set(steps.keys())
+
+    def _flush_elementwise_run():
+        if len(elementwise_run) > 1:
+            fused_name = steps._rename_step(
+                step_name=FusedElementwiseSteps.__name__,
+                class_name=FusedElementwiseSteps.__name__,
+                names_yet=names_yet
+            )
+            names_yet.add(fused_name)
+            fused = FusedElementwiseSteps(list(elementwise_run))
+            fused.set_name(fused_name)
+            fused_steps_as_tuple.append((fused_name, fused))
+        else:
+            fused_steps_as_tuple.extend(elementwise_run)
+        elementwise_run.clear()
+
+    for step_name, step in steps.items():
+        if isinstance(step, ElementwiseMixin):
+            elementwise_run.append((step_name, step))
+            continue
+
+        _flush_elementwise_run()
+        if isinstance(step, BasePipeline):
+            step = fuse_elementwise_steps(step)
+        fused_steps_as_tuple.append((step_name, step))
+    _flush_elementwise_run()
+
+    steps.set_steps(fused_steps_as_tuple)
+    return steps
 
 
 class OneHotEncoder(NonFittableMixin, BaseStep):
@@ -126,8 +126,9 @@ class OutputTransformerWrapper(MetaStepMixin, BaseStep):
 
         data_container.set_expected_outputs(new_expected_outputs_data_container.data_inputs)
 
-        current_ids = self.hash(data_container)
-        data_container.set_current_ids(current_ids)
+        if context.hashing:
+            current_ids = self.hash(data_container)
+            data_container.set_current_ids(current_ids)
 
         return data_container
 
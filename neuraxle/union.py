@@ -24,10 +24,22 @@ This module contains steps to perform various feature unions and model stacking,
 
 """
 
-from joblib import Parallel, delayed
+import copy
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, List, Any, Tuple, Iterable, Dict
+
+import numpy as np
 
 from neuraxle.base import BaseStep, TruncableSteps, NonFittableMixin, NamedTupleList, Identity, ExecutionContext, \
-    DataContainer
+    DataContainer, ExecutionMode
+from neuraxle.data_container import NumpyDataContainer, LazyCurrentIds
 from neuraxle.steps.numpy import NumpyConcatenateInnerFeatures
 
 
@@ -39,20 +51,202 @@ class FeatureUnion(TruncableSteps):
             steps_as_tuple: NamedTupleList,
             joiner: NonFittableMixin = NumpyConcatenateInnerFeatures(),
             n_jobs: int = None,
-            backend: str = "threading"
+            backend: str = "threading",
+            share_common_prefixes: bool = False,
+            preallocate_join: bool = False
     ):
         """
         Create a feature union.
 
+        When ``share_common_prefixes`` is True, the steps at the start of the branches that are identical
+        (same class, same hyperparams, and same state) are only fitted, and transformed once,
+        and their outputs are sent to every branch sharing them. A branch is split in steps if it is a
+        :class:`~neuraxle.pipeline.Pipeline`, otherwise the branch is a single step.
+
+        .. code-block:: python
+
+            FeatureUnion([
+                Pipeline([StandardScaler(), PCA(n_components=10), Ridge()]),
+                Pipeline([StandardScaler(), PCA(n_components=10), SVR()]),  # the scaler, and the pca are shared
+                Pipeline([StandardScaler(), KMeans()]),  # the scaler is shared
+            ], share_common_prefixes=True)
+
         :param steps_as_tuple: the NamedTupleList of steps to process in parallel and to join.
         :param joiner: What will be used to join the features. For example, ``NumpyConcatenateInnerFeatures()``.
         :param n_jobs: The number of jobs for the parallelized ``joblib.Parallel`` loop in fit and in transform.
         :param backend: The type of parallelization to do with ``joblib.Parallel``. Possible values: "loky", "multiprocessing", "threading", "dask" if you use dask, and more.
+        :param share_common_prefixes: compute the identical steps at the start of the branches only once.
+        :param preallocate_join: join the branches outputs in a single preallocated array instead of concatenating
+            them at the end. Only available with the ``NumpyConcatenateInnerFeatures`` joiner.
         """
+        if preallocate_join and not isinstance(joiner, NumpyConcatenateInnerFeatures):
+            raise ValueError('preallocate_join is only available with the NumpyConcatenateInnerFeatures joiner.')
+
         TruncableSteps.__init__(self, steps_as_tuple)
         self.joiner = joiner  # TODO: add "other" types of step(s) to TuncableSteps or to another intermediate class. For example, to get their hyperparameters.
         self.n_jobs = n_jobs
         self.backend = backend
+        self.share_common_prefixes = share_common_prefixes
+        self.preallocate_join = preallocate_join
+        self._join_widths = None
+        self._join_dtypes = None
+        self._branches_durations = {}
+        self._parallel = None
+        self._parallel_lock = Lock()
+        self._states_fingerprints = {}
+
+    def _run_in_parallel(self, delayed_calls, lazy: bool = False) -> Iterable:
+        """
+        Run the delayed calls with the worker pool of the union.
+        The pool is started on the first call, and reused by the next fits and transforms until
+        :func:`~FeatureUnion.teardown`, so that a union fitted or transformed on every mini batch doesn't pay for
+        the pool startup each time. The garbage collection of the union only guards against leaking the pool. The copies of the union start their own pool.
+
+        The threading backend uses a ``concurrent.futures.ThreadPoolExecutor``, which returns the results
+        as soon as they are ready, instead of polling for them like ``joblib.Parallel`` does.
+        The other backends use a ``joblib.Parallel`` kept open. If another thread is already using it,
+        the calls are run with a new ``joblib.Parallel``.
+
+        :param delayed_calls: iterable of ``joblib.delayed`` calls
+        :param lazy: with the threading backend, return an iterator yielding the results in order as they are ready
+        :return: results of the calls
+        """
+        from joblib import Parallel, effective_n_jobs
+
+        if not self._parallel_lock.acquire(blocking=False):
+            return Parallel(backend=self.backend, n_jobs=self.n_jobs)(delayed_calls)
+
+        try:
+            if self._parallel is not None and self._parallel_config != (self.backend, self.n_jobs):
+                self._release_parallel()
+
+            if self._parallel is None:
+                if self.backend == 'threading':
+                    self._parallel = ThreadPoolExecutor(max_workers=effective_n_jobs(self.n_jobs))
+                else:
+                    self._parallel = Parallel(backend=self.backend, n_jobs=self.n_jobs)
+                    self._parallel.__enter__()
+                self._parallel_config = (self.backend, self.n_jobs)
+
+            if isinstance(self._parallel, ThreadPoolExecutor):
+                results = self._parallel.map(_call_delayed, delayed_calls)
+                return results if lazy else list(results)
+            return self._parallel(delayed_calls)
+        finally:
+            self._parallel_lock.release()
+
+    def _handle_branches(
+            self,
+            branches_calls: List[Tuple[str, Callable, tuple]],
+            execution_mode: ExecutionMode,
+            lazy: bool = False
+    ) -> Iterable:
+        """
+        Call the function of each branch, and record how long each branch took.
+        In parallel, the branches are dispatched longest first according to their durations in the previous call
+        for the same execution mode (branches never timed go first), so that a slow branch doesn't start last
+        when there are fewer workers than branches. The results are returned in the order of the branches.
+
+        :param branches_calls: the branch name, the function, and the arguments of each branch
+        :param execution_mode: execution mode of the durations to use, and to record
+        :param lazy: return an iterator yielding the results in order as they are ready
+        :return: results of the branches
+        """
+        if self.n_jobs != 1 and len(branches_calls) > 1:
+            from joblib import delayed
+
+            order = self._get_longest_first_order([name for name, _, _ in branches_calls], execution_mode)
+            timed_results = self._run_in_parallel(
+                (delayed(_call_timed)(branches_calls[i][1], *branches_calls[i][2]) for i in order),
+                lazy=True
+            )
+        else:
+            order = range(len(branches_calls))
+            timed_results = (_call_timed(function, *args) for _, function, args in branches_calls)
+
+        results = self._record_branches_durations(branches_calls, order, timed_results, execution_mode)
+        return results if lazy else list(results)
+
+    def _get_longest_first_order(self, branches_names: List[str], execution_mode: ExecutionMode) -> List[int]:
+        durations = self._branches_durations.get(execution_mode, {})
+        return sorted(
+            range(len(branches_names)),
+            key=lambda i: -durations.get(branches_names[i], float('inf'))
+        )
+
+    def _record_branches_durations(
+            self,
+            branches_calls: List[Tuple[str, Callable, tuple]],
+            order: Iterable[int],
+            timed_results: Iterable[Tuple[Any, float]],
+            execution_mode: ExecutionMode
+    ) -> Iterable:
+        durations = self._branches_durations.setdefault(execution_mode, {})
+        results_to_yield = {}
+        next_index = 0
+        for i, (result, seconds) in zip(order, timed_results):
+            durations[branches_calls[i][0]] = seconds
+            results_to_yield[i] = result
+            while next_index in results_to_yield:
+                yield results_to_yield.pop(next_index)
+                next_index += 1
+
+    def get_branches_durations(self, execution_mode: ExecutionMode = ExecutionMode.TRANSFORM) -> Dict[str, float]:
+        """
+        Get the duration in seconds of each branch in the last call for the given execution mode.
+        They are used to dispatch the longest branches first.
+
+        :param execution_mode: ``ExecutionMode.FIT``, ``ExecutionMode.TRANSFORM``, or ``ExecutionMode.FIT_TRANSFORM``
+        :return: dict of the branch names to their durations in seconds
+        :rtype: Dict[str, float]
+        """
+        return dict(self._branches_durations.get(execution_mode, {}))
+
+    def _release_parallel(self):
+        if isinstance(self._parallel, ThreadPoolExecutor):
+            self._parallel.shutdown()
+        elif self._parallel is not None:
+            self._parallel.__exit__(None, None, None)
+        self._parallel = None
+
+    def _release_parallel_when_unused(self):
+        with self._parallel_lock:
+            self._release_parallel()
+
+    def teardown(self) -> 'BaseStep':
+        """
+        Release the worker pool of the union, and teardown the sub steps.
+
+        :return: self
+        :rtype: BaseStep
+        """
+        self._release_parallel_when_unused()
+        return TruncableSteps.teardown(self)
+
+    def __del__(self):
+        parallel = getattr(self, '_parallel', None)
+        if isinstance(parallel, ThreadPoolExecutor):
+            parallel.shutdown(wait=False)
+        elif parallel is not None:
+            parallel.__exit__(None, None, None)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_parallel'] = None
+        state['_states_fingerprints'] = {}
+        del state['_parallel_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._parallel = None
+        self._parallel_lock = Lock()
+        self._states_fingerprints = {}
+
+    def _refresh_steps(self):
+        TruncableSteps._refresh_steps(self)
+        # The steps may have been fitted: their states are fingerprinted again by the next transform.
+        self._states_fingerprints = {}
 
     def _fit_data_container(self, data_container, context):
         """
@@ -62,17 +256,21 @@ class FeatureUnion(TruncableSteps):
         :param context: execution context
         :return: self
         """
+        return self._fit_branches(data_container, context)
+
+    def _fit_branches(self, data_container, context):
+        if self.share_common_prefixes:
+            self._handle_sharing_common_prefixes(data_container, context, ExecutionMode.FIT)
+            return self
+
         # Actually fit:
-        if self.n_jobs != 1:
-            fitted_steps = Parallel(backend=self.backend, n_jobs=self.n_jobs)(
-                delayed(step.handle_fit)(data_container.copy(), context)
-                for _, step in self.steps_as_tuple
-            )
+        if self._should_share_memory(data_container):
+            fitted_steps = self._handle_in_shared_memory(data_container, context, _handle_fit_in_shared_memory)
         else:
-            fitted_steps = [
-                step.handle_fit(data_container.copy(), context)
-                for _, step in self.steps_as_tuple
-            ]
+            fitted_steps = self._handle_branches([
+                (name, step.handle_fit, (data_container.copy(), context))
+                for name, step in self.steps_as_tuple
+            ], ExecutionMode.FIT)
 
         # Save fitted steps
         for i, fitted_step in enumerate(fitted_steps):
@@ -89,25 +287,144 @@ class FeatureUnion(TruncableSteps):
         :param context: execution context
         :return: the transformed data_inputs.
         """
-        if self.n_jobs != 1:
-            data_containers = Parallel(backend=self.backend, n_jobs=self.n_jobs)(
-                delayed(step.handle_transform)(data_container.copy(), context)
-                for _, step in self.steps_as_tuple
-            )
+        if self.share_common_prefixes:
+            data_containers = self._handle_sharing_common_prefixes(data_container, context, ExecutionMode.TRANSFORM)
+        elif self._should_share_memory(data_container):
+            data_containers = self._handle_in_shared_memory(
+                data_container, context, _handle_transform_in_shared_memory)
         else:
-            data_containers = [
-                step.handle_transform(data_container.copy(), context)
-                for _, step in self.steps_as_tuple
+            data_containers = self._handle_branches([
+                (name, step.handle_transform, (data_container.copy(), context))
+                for name, step in self.steps_as_tuple
+            ], ExecutionMode.TRANSFORM, lazy=self.preallocate_join)
+
+        return self._create_union_data_container(data_container, data_containers)
+
+    def _should_share_memory(self, data_container: DataContainer) -> bool:
+        """
+        Returns True if the data inputs should be sent to the worker processes through shared memory:
+        the backend starts processes, and the data inputs are a large ndarray.
+
+        :param data_container: data container
+        :return: if the data container should be shared in memory
+        """
+        return self.n_jobs != 1 and \
+            self.backend in SHARED_MEMORY_BACKENDS and \
+            isinstance(data_container.data_inputs, np.ndarray) and \
+            data_container.data_inputs.nbytes >= SHARED_MEMORY_MIN_NBYTES
+
+    def _handle_in_shared_memory(
+            self,
+            data_container: DataContainer,
+            context: ExecutionContext,
+            handle_function: Callable
+    ) -> List:
+        """
+        Save the ndarrays of the data container once in ``.npy`` files of a shared memory folder,
+        and send only their paths to each branch. The workers memory-map the files (copy-on-write),
+        and send their ndarray outputs back the same way. The folder is removed when all branches are done.
+
+        The shared memory folder is only used if it has enough free space for the inputs, and for outputs of the same
+        size from each branch. Otherwise, or if saving the inputs there fails, the default temporary folder is used.
+        A worker that can't save its outputs sends them back pickled instead.
+
+        :param data_container: data container
+        :param context: execution context
+        :param handle_function: ``_handle_fit_in_shared_memory``, or ``_handle_transform_in_shared_memory``
+        :return: results of the branches
+        """
+        execution_mode = ExecutionMode.FIT if handle_function is _handle_fit_in_shared_memory else ExecutionMode.TRANSFORM
+        required_nbytes = _count_nbytes(data_container) * (len(self.steps_as_tuple) + 1)
+        root = _get_shared_memory_root(required_nbytes)
+        folder = tempfile.mkdtemp(prefix='neuraxle_union_', dir=root)
+        try:
+            try:
+                shared_data_container = _SharedMemoryDataContainer.dump(data_container, folder)
+            except OSError:
+                if root == tempfile.gettempdir():
+                    raise
+                shutil.rmtree(folder, ignore_errors=True)
+                folder = tempfile.mkdtemp(prefix='neuraxle_union_', dir=tempfile.gettempdir())
+                shared_data_container = _SharedMemoryDataContainer.dump(data_container, folder)
+
+            results = self._handle_branches([
+                (name, handle_function, (step, shared_data_container, context))
+                for name, step in self.steps_as_tuple
+            ], execution_mode)
+            return [
+                result.load() if isinstance(result, _SharedMemoryDataContainer) else result
+                for result in results
             ]
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    def _create_union_data_container(
+            self,
+            data_container: DataContainer,
+            data_containers: Iterable[DataContainer]
+    ) -> DataContainer:
+        if self.preallocate_join:
+            data_inputs = self._join_in_preallocated_array(
+                branch_data_container.data_inputs for branch_data_container in data_containers
+            )
+        else:
+            data_inputs = list(data_containers)
 
         return DataContainer(
             summary_id=data_container.summary_id,
             current_ids=data_container.current_ids,
-            data_inputs=data_containers,
+            data_inputs=data_inputs,
             expected_outputs=data_container.expected_outputs
         )
 
+    def _join_in_preallocated_array(self, branches_outputs: Iterable) -> np.ndarray:
+        """
+        Join the outputs of the branches on their last axis, like ``NumpyConcatenateInnerFeatures`` does.
+        The width, and the dtype of the output of each branch are recorded on the first call. On the next calls,
+        the joined array is allocated once when the first branch output arrives, and each branch output is copied in
+        its own column slice as soon as it is ready, so that the branch outputs can be freed before the others finish.
+
+        If a branch output doesn't have the recorded width or dtype, the outputs are concatenated instead,
+        and the widths, and dtypes are recorded again.
+
+        :param branches_outputs: the outputs of each branch, in order
+        :return: joined outputs
+        """
+        widths = self._join_widths
+        dtypes = self._join_dtypes
+        joined = None
+        start = 0
+        outputs = []
+        for i, branch_outputs in enumerate(branches_outputs):
+            branch_outputs = np.asarray(branch_outputs)
+            fits_in_joined = widths is not None and i < len(widths) and branch_outputs.ndim > 0 and \
+                branch_outputs.shape[-1] == widths[i] and branch_outputs.dtype == dtypes[i] and \
+                (joined is None or branch_outputs.shape[:-1] == joined.shape[:-1])
+
+            if fits_in_joined and joined is None and i == 0:
+                joined = np.empty(branch_outputs.shape[:-1] + (sum(widths),), dtype=np.result_type(*dtypes))
+
+            if fits_in_joined and joined is not None:
+                joined[..., start:start + widths[i]] = branch_outputs
+                outputs.append(joined[..., start:start + widths[i]])
+                start += widths[i]
+            else:
+                joined = None
+                widths = None
+                outputs.append(branch_outputs)
+
+        if joined is not None and len(outputs) == len(self._join_widths):
+            return joined
+
+        self._join_widths = [branch_outputs.shape[-1] for branch_outputs in outputs]
+        self._join_dtypes = [branch_outputs.dtype for branch_outputs in outputs]
+        return np.concatenate(outputs, axis=-1)
+
     def _did_transform(self, data_container, context):
+        if self.preallocate_join:
+            # The outputs of the branches were already joined, only the joiner hooks remain.
+            return self.joiner._did_process(data_container, context.push(self.joiner))
+
         data_container = self.joiner.handle_transform(data_container, context)
         return data_container
 
@@ -119,11 +436,213 @@ class FeatureUnion(TruncableSteps):
         :param context: execution context
         :return: the transformed data_inputs.
         """
-        new_self = self._fit_data_container(data_container, context)
+        if self.share_common_prefixes:
+            data_containers = self._handle_sharing_common_prefixes(
+                data_container, context, ExecutionMode.FIT_TRANSFORM)
+            return self, self._create_union_data_container(data_container, data_containers)
+
+        new_self = self._fit_branches(data_container, context)
         data_container = self._transform_data_container(data_container, context)
         return new_self, data_container
 
+    def _handle_sharing_common_prefixes(
+            self,
+            data_container: DataContainer,
+            context: ExecutionContext,
+            execution_mode: ExecutionMode
+    ) -> List[DataContainer]:
+        """
+        Fit, fit transform, or transform the branches, computing the steps shared at the start of many branches only once.
+        The branches are inserted in a prefix trie of the fingerprints of their steps: each node of the trie shared
+        by many branches is computed once, then the remaining steps of each branch are computed in parallel.
+
+        Hashing the state of large fitted steps can cost more than transforming a few rows, so the state
+        fingerprints are computed by the first transform after a fit, and reused by the next transforms.
+        Only the hyperparams are hashed again on each call. A branch step fitted directly, without fitting the union,
+        isn't fingerprinted again.
+
+        :param data_container: data container
+        :param context: execution context
+        :param execution_mode: ``ExecutionMode.FIT``, ``ExecutionMode.FIT_TRANSFORM``, or ``ExecutionMode.TRANSFORM``
+        :return: the data container of each branch (None when fitting)
+        """
+        from neuraxle.pipeline import Pipeline
+
+        branches = [branch for _, branch in self.steps_as_tuple]
+        are_pipelines = [type(branch) is Pipeline for branch in branches]
+        branches_steps = [
+            list(branch.steps_as_tuple) if is_pipeline else [(branch_name, branch)]
+            for (branch_name, branch), is_pipeline in zip(self.steps_as_tuple, are_pipelines)
+        ]
+
+        branches_contexts = [
+            self._will_handle_branch(branch, data_container, context, execution_mode) if is_pipeline else context
+            for branch, is_pipeline in zip(branches, are_pipelines)
+        ]
+
+        new_branches_steps = [list(branch_steps) for branch_steps in branches_steps]
+        outputs: List[DataContainer] = [None] * len(branches)
+        branches_suffixes: List[Tuple[int, int, DataContainer]] = []
+        states_fingerprints = self._states_fingerprints if execution_mode == ExecutionMode.TRANSFORM else {}
+        self._handle_prefix_trie_node(
+            _PrefixTrieNode.from_branches_steps(branches_steps, states_fingerprints),
+            depth=0,
+            data_container=data_container,
+            branches_steps=branches_steps,
+            branches_contexts=branches_contexts,
+            execution_mode=execution_mode,
+            new_branches_steps=new_branches_steps,
+            outputs=outputs,
+            branches_suffixes=branches_suffixes
+        )
+
+        suffixes_args = [
+            (branches_steps[branch_index][depth:], branch_data_container, branches_contexts[branch_index])
+            for branch_index, depth, branch_data_container in branches_suffixes
+        ]
+        if self.n_jobs != 1 and len(suffixes_args) > 1:
+            from joblib import delayed
+
+            suffixes_results = self._run_in_parallel(
+                delayed(_handle_branch_steps)(steps, branch_data_container, branch_context, execution_mode)
+                for steps, branch_data_container, branch_context in suffixes_args
+            )
+        else:
+            suffixes_results = [
+                _handle_branch_steps(steps, branch_data_container, branch_context, execution_mode)
+                for steps, branch_data_container, branch_context in suffixes_args
+            ]
+
+        for (branch_index, depth, _), (new_steps, branch_data_container) in zip(branches_suffixes, suffixes_results):
+            new_branches_steps[branch_index][depth:] = new_steps
+            outputs[branch_index] = branch_data_container
+
+        for branch_index, (branch, is_pipeline) in enumerate(zip(branches, are_pipelines)):
+            if execution_mode != ExecutionMode.TRANSFORM:
+                if is_pipeline:
+                    branch.steps_as_tuple = new_branches_steps[branch_index]
+                    branch._refresh_steps()
+                else:
+                    branch_name, fitted_branch = new_branches_steps[branch_index][0]
+                    self.steps_as_tuple[branch_index] = (branch_name, fitted_branch)
+
+            if is_pipeline and execution_mode != ExecutionMode.FIT:
+                outputs[branch_index] = self._did_handle_branch(
+                    branch, outputs[branch_index], branches_contexts[branch_index], execution_mode)
+
+        if execution_mode != ExecutionMode.TRANSFORM:
+            self._refresh_steps()
+
+        return outputs
+
+    def _handle_prefix_trie_node(
+            self,
+            node: '_PrefixTrieNode',
+            depth: int,
+            data_container: DataContainer,
+            branches_steps: List[NamedTupleList],
+            branches_contexts: List[ExecutionContext],
+            execution_mode: ExecutionMode,
+            new_branches_steps: List[NamedTupleList],
+            outputs: List[DataContainer],
+            branches_suffixes: List[Tuple[int, int, DataContainer]]
+    ):
+        """
+        Compute the shared step of each child node that has many branches, and recurse in it.
+        The steps of the child nodes that have a single branch are appended to the branches suffixes to compute.
+        """
+        for branch_index in node.ended_branch_indices:
+            outputs[branch_index] = data_container.copy()
+
+        for child in node.children.values():
+            first_branch_index = child.branch_indices[0]
+            if len(child.branch_indices) == 1:
+                branches_suffixes.append((first_branch_index, depth, data_container.copy()))
+                continue
+
+            shared_step_mode = ExecutionMode.TRANSFORM if execution_mode == ExecutionMode.TRANSFORM \
+                else ExecutionMode.FIT_TRANSFORM
+            [(_, shared_step)], child_data_container = _handle_branch_steps(
+                [branches_steps[first_branch_index][depth]],
+                data_container.copy(),
+                branches_contexts[first_branch_index],
+                shared_step_mode
+            )
+
+            if execution_mode != ExecutionMode.TRANSFORM:
+                for i, branch_index in enumerate(child.branch_indices):
+                    step_name = branches_steps[branch_index][depth][0]
+                    step = shared_step if i == 0 else copy.deepcopy(shared_step)
+                    new_branches_steps[branch_index][depth] = (step_name, step)
+
+            self._handle_prefix_trie_node(
+                child,
+                depth=depth + 1,
+                data_container=child_data_container,
+                branches_steps=branches_steps,
+                branches_contexts=branches_contexts,
+                execution_mode=execution_mode,
+                new_branches_steps=new_branches_steps,
+                outputs=outputs,
+                branches_suffixes=branches_suffixes
+            )
+
+    def _will_handle_branch(
+            self,
+            branch: BaseStep,
+            data_container: DataContainer,
+            context: ExecutionContext,
+            execution_mode: ExecutionMode
+    ) -> ExecutionContext:
+        """
+        Apply the side effects of the pipeline branch before its steps are handled, and return the context of its steps.
+        """
+        _, branch_context = branch._will_process(data_container, context)
+        if execution_mode == ExecutionMode.TRANSFORM:
+            _, branch_context = branch._will_transform_data_container(data_container, branch_context)
+            return branch_context
+
+        if execution_mode == ExecutionMode.FIT:
+            _, branch_context = branch._will_fit(data_container, branch_context)
+        else:
+            _, branch_context = branch._will_fit_transform(data_container, branch_context)
+        branch.setup()
+        return branch_context
+
+    def _did_handle_branch(
+            self,
+            branch: BaseStep,
+            data_container: DataContainer,
+            context: ExecutionContext,
+            execution_mode: ExecutionMode
+    ) -> DataContainer:
+        """
+        Apply the side effects of the pipeline branch after its steps are handled.
+        """
+        if execution_mode == ExecutionMode.TRANSFORM:
+            data_container = branch._did_transform(data_container, context)
+        else:
+            data_container = branch._did_fit_transform(data_container, context)
+        return branch._did_process(data_container, context)
+
+    def freeze(self) -> 'FrozenFeatureUnion':
+        """
+        Compile the fitted union into a :class:`FrozenFeatureUnion` of the frozen steps, and of the joiner.
+        The frozen steps are transformed one after the other, because the frozen union is meant for low latency inference.
+
+        :return: frozen feature union
+        :rtype: FrozenFeatureUnion
+        """
+        return FrozenFeatureUnion(
+            [step.freeze() for _, step in self.steps_as_tuple],
+            self.joiner.freeze()
+        )
+
     def _did_fit_transform(self, data_container, context):
+        if self.preallocate_join:
+            # The outputs of the branches were already joined, only the joiner hooks remain.
+            return self.joiner._did_process(data_container, context.push(self.joiner))
+
         self.joiner, data_container = self.joiner.handle_fit_transform(data_container, context)
         return data_container
 
@@ -136,16 +655,10 @@ class FeatureUnion(TruncableSteps):
         :return: self
         """
         # Actually fit:
-        if self.n_jobs != 1:
-            fitted = Parallel(backend=self.backend, n_jobs=self.n_jobs)(
-                delayed(bro.fit)(data_inputs, expected_outputs)
-                for _, bro in self.steps_as_tuple
-            )
-        else:
-            fitted = [
-                bro.fit(data_inputs, expected_outputs)
-                for _, bro in self.steps_as_tuple
-            ]
+        fitted = self._handle_branches([
+            (name, bro.fit, (data_inputs, expected_outputs))
+            for name, bro in self.steps_as_tuple
+        ], ExecutionMode.FIT)
 
         # Save fitted steps
         for i, f in enumerate(fitted):
@@ -161,19 +674,307 @@ class FeatureUnion(TruncableSteps):
         :param data_inputs: The input data to fit onto
         :return: the transformed data_inputs.
         """
-        if self.n_jobs != 1:
-            results = Parallel(backend=self.backend, n_jobs=self.n_jobs)(
-                delayed(bro.transform)(data_inputs)
-                for _, bro in self.steps_as_tuple
-            )
+        results = self._handle_branches([
+            (name, bro.transform, (data_inputs,))
+            for name, bro in self.steps_as_tuple
+        ], ExecutionMode.TRANSFORM, lazy=self.preallocate_join)
+
+        if self.preallocate_join:
+            return self._join_in_preallocated_array(results)
+
+        results = self.joiner.transform(list(results))
+        return results
+
+
+class _PrefixTrieNode:
+    """
+    Node of the prefix trie of the steps of the branches of a :class:`FeatureUnion`.
+    The children are indexed by the fingerprint of their step.
+    """
+
+    def __init__(self):
+        self.children: OrderedDict = OrderedDict()
+        self.branch_indices: List[int] = []
+        self.ended_branch_indices: List[int] = []
+
+    @staticmethod
+    def from_branches_steps(branches_steps: List[NamedTupleList], states_fingerprints: Dict) -> '_PrefixTrieNode':
+        root = _PrefixTrieNode()
+        for branch_index, branch_steps in enumerate(branches_steps):
+            node = root
+            for _, step in branch_steps:
+                fingerprint = _fingerprint(step, states_fingerprints)
+                if fingerprint not in node.children:
+                    node.children[fingerprint] = _PrefixTrieNode()
+                node = node.children[fingerprint]
+                node.branch_indices.append(branch_index)
+            node.ended_branch_indices.append(branch_index)
+        return root
+
+
+_FINGERPRINT_EXCLUDED_ATTRIBUTES = ('name', 'is_initialized', 'is_invalidated')
+
+
+def _fingerprint(step: BaseStep, states_fingerprints: Dict = None) -> str:
+    """
+    Fingerprint of a step: its class, its hyperparams, and a ``joblib.hash`` of its state (excluding its name).
+    The steps that can't be hashed get a unique fingerprint, so that they are never shared.
+
+    :param step: step
+    :param states_fingerprints: cache of the state hashes by step id, holding the steps too so that their ids stay unique
+    :return: fingerprint
+    """
+    from joblib import hash as joblib_hash
+
+    step_class = step.__class__
+    try:
+        if states_fingerprints is not None and id(step) in states_fingerprints:
+            _, state_fingerprint = states_fingerprints[id(step)]
         else:
-            results = [
-                bro.transform(data_inputs)
-                for _, bro in self.steps_as_tuple
+            state_fingerprint = joblib_hash({
+                key: value for key, value in vars(step).items()
+                if key not in _FINGERPRINT_EXCLUDED_ATTRIBUTES
+            })
+            if states_fingerprints is not None:
+                states_fingerprints[id(step)] = (step, state_fingerprint)
+
+        return '{0}.{1}:{2}:{3}'.format(
+            step_class.__module__,
+            step_class.__qualname__,
+            joblib_hash(step.get_hyperparams().to_flat_as_dict_primitive()),
+            state_fingerprint
+        )
+    except Exception:
+        return 'unhashable:{0}'.format(id(step))
+
+
+SHARED_MEMORY_BACKENDS = ('loky', 'multiprocessing')
+SHARED_MEMORY_MIN_NBYTES = 1024 ** 2
+_SHARED_MEMORY_ROOT = '/dev/shm'
+
+
+def _get_shared_memory_root(required_nbytes: int) -> str:
+    """
+    Folder of the shared memory files: ``/dev/shm`` if it exists, and has at least ``required_nbytes`` free
+    (e.g.: docker limits it to 64MB by default), otherwise the default temporary folder.
+
+    :param required_nbytes: number of bytes that will be saved in the folder
+    :return: folder path
+    """
+    if os.path.isdir(_SHARED_MEMORY_ROOT) and os.access(_SHARED_MEMORY_ROOT, os.W_OK):
+        try:
+            stats = os.statvfs(_SHARED_MEMORY_ROOT)
+        except (OSError, AttributeError):
+            return tempfile.gettempdir()
+        if stats.f_frsize * stats.f_bavail >= required_nbytes:
+            return _SHARED_MEMORY_ROOT
+    return tempfile.gettempdir()
+
+
+def _count_nbytes(data_container: DataContainer) -> int:
+    return sum(
+        value.nbytes for value in (data_container.data_inputs, data_container.expected_outputs)
+        if isinstance(value, np.ndarray)
+    )
+
+
+class _NpyFile:
+    """
+    Path of an ndarray saved in a ``.npy`` file of the shared memory folder.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> np.ndarray:
+        # copy-on-write: the steps can modify their inputs without changing the shared file.
+        # The results are read in memory on Windows, where an open memory map prevents removing the folder.
+        return np.load(self.path, mmap_mode='c' if os.name != 'nt' else None)
+
+
+class _SharedMemoryDataContainer:
+    """
+    Picklable handle of a data container whose ndarrays are saved in ``.npy`` files of a shared memory folder,
+    so that only the paths of the arrays are sent to, or from the worker processes.
+    """
+
+    def __init__(self, folder: str, summary_id, current_ids, data_inputs, expected_outputs):
+        self.folder = folder
+        self.summary_id = summary_id
+        self.current_ids = current_ids
+        self.data_inputs = data_inputs
+        self.expected_outputs = expected_outputs
+
+    @staticmethod
+    def dump(
+            data_container: DataContainer,
+            folder: str,
+            shared_data_container: '_SharedMemoryDataContainer' = None,
+            loaded_data_container: DataContainer = None
+    ) -> '_SharedMemoryDataContainer':
+        """
+        Save the ndarrays of the data container in the folder.
+        The arrays that are still the ones loaded from another shared data container keep their files.
+        """
+        already_shared = []
+        if shared_data_container is not None:
+            already_shared = [
+                (loaded_data_container.data_inputs, shared_data_container.data_inputs),
+                (loaded_data_container.expected_outputs, shared_data_container.expected_outputs)
             ]
 
-        results = self.joiner.transform(results)
-        return results
+        def _dump_value(value):
+            for loaded_value, shared_value in already_shared:
+                if value is loaded_value and isinstance(shared_value, _NpyFile):
+                    return shared_value
+            if not isinstance(value, np.ndarray):
+                return value
+            path = os.path.join(folder, '{0}.npy'.format(uuid.uuid4().hex))
+            np.save(path, value)
+            return _NpyFile(path)
+
+        return _SharedMemoryDataContainer(
+            folder=folder,
+            summary_id=data_container.summary_id,
+            current_ids=data_container.current_ids,
+            data_inputs=_dump_value(data_container.data_inputs),
+            expected_outputs=_dump_value(data_container.expected_outputs)
+        )
+
+    def load(self) -> DataContainer:
+        def _load_value(value):
+            return value.load() if isinstance(value, _NpyFile) else value
+
+        return DataContainer(
+            summary_id=self.summary_id,
+            current_ids=self.current_ids,
+            data_inputs=_load_value(self.data_inputs),
+            expected_outputs=_load_value(self.expected_outputs)
+        )
+
+
+def _handle_fit_in_shared_memory(
+        step: BaseStep,
+        shared_data_container: _SharedMemoryDataContainer,
+        context: ExecutionContext
+) -> BaseStep:
+    return step.handle_fit(shared_data_container.load(), context)
+
+
+def _handle_transform_in_shared_memory(
+        step: BaseStep,
+        shared_data_container: _SharedMemoryDataContainer,
+        context: ExecutionContext
+) -> _SharedMemoryDataContainer:
+    data_container = shared_data_container.load()
+    loaded_data_container = data_container.copy()
+    data_container = step.handle_transform(data_container, context)
+    try:
+        return _SharedMemoryDataContainer.dump(
+            data_container,
+            shared_data_container.folder,
+            shared_data_container=shared_data_container,
+            loaded_data_container=loaded_data_container
+        )
+    except OSError:
+        # e.g.: the shared memory folder is full. The outputs are pickled back to the parent process instead.
+        return data_container
+
+
+def _split_folds(data_container: DataContainer, n_folds: int) -> List[DataContainer]:
+    """
+    Split the data container in contiguous folds of about the same size, keeping the order of the data inputs.
+
+    :param data_container: data container to split
+    :param n_folds: number of folds
+    :return: folds
+    """
+    fold_size = len(data_container.data_inputs) / float(n_folds)
+    return [
+        data_container[int(fold_size * i):int(fold_size * (i + 1))]
+        for i in range(n_folds)
+    ]
+
+
+def _fit_transform_out_of_fold(
+        step: BaseStep,
+        train_data_container: DataContainer,
+        validation_data_container: DataContainer,
+        context: ExecutionContext
+) -> DataContainer:
+    step = copy.deepcopy(step)
+    step = step.handle_fit(train_data_container.copy(), context)
+    return step.handle_transform(validation_data_container.copy(), context)
+
+
+def _call_timed(function: Callable, *args) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def _call_delayed(delayed_call: Tuple[Callable, tuple, dict]) -> Any:
+    function, args, kwargs = delayed_call
+    return function(*args, **kwargs)
+
+
+def _handle_branch_steps(
+        steps: NamedTupleList,
+        data_container: DataContainer,
+        context: ExecutionContext,
+        execution_mode: ExecutionMode
+) -> Tuple[NamedTupleList, DataContainer]:
+    """
+    Handle the steps of a branch one after the other, like a :class:`~neuraxle.pipeline.Pipeline` does:
+    when fitting, the last step is only fitted.
+
+    :return: the new steps, and the data container
+    """
+    new_steps = []
+    for index, (step_name, step) in enumerate(steps):
+        if execution_mode == ExecutionMode.TRANSFORM:
+            data_container = step.handle_transform(data_container, context)
+        elif execution_mode == ExecutionMode.FIT and index == len(steps) - 1:
+            step.setup()
+            step = step.handle_fit(data_container, context)
+        else:
+            step.setup()
+            step, data_container = step.handle_fit_transform(data_container, context)
+        new_steps.append((step_name, step))
+    return new_steps, data_container
+
+
+class FrozenFeatureUnion:
+    """
+    Read-only transform callable compiled from a fitted :class:`FeatureUnion` with :func:`~FeatureUnion.freeze`.
+    It transforms the data inputs with each frozen step, and joins the results with the frozen joiner.
+
+    .. seealso::
+        :func:`~neuraxle.base.BaseStep.freeze`,
+        :class:`~neuraxle.pipeline.FrozenPipeline`
+    """
+
+    __slots__ = ('steps', 'joiner')
+
+    def __init__(self, steps: List[Callable], joiner: Callable):
+        object.__setattr__(self, 'steps', tuple(steps))
+        object.__setattr__(self, 'joiner', joiner)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{0} is read-only: freeze the union again instead.'.format(self.__class__.__name__))
+
+    def __call__(self, data_inputs: Any) -> Any:
+        return self.joiner([transform(data_inputs) for transform in self.steps])
+
+    def transform(self, data_inputs: Any) -> Any:
+        return self(data_inputs)
+
+    def __getstate__(self):
+        return {'steps': self.steps, 'joiner': self.joiner}
+
+    def __setstate__(self, state):
+        object.__setattr__(self, 'steps', state['steps'])
+        object.__setattr__(self, 'joiner', state['joiner'])
 
 
 class AddFeatures(FeatureUnion):
@@ -191,12 +992,29 @@ class AddFeatures(FeatureUnion):
 
 
 class ModelStacking(FeatureUnion):
-    """Performs a ``FeatureUnion`` of steps, and then send the joined result to the above judge step."""
+    """
+    Performs a ``FeatureUnion`` of steps, and then send the joined result to the above judge step.
+
+    Each base step is fitted only once, and its predictions are reused to fit the judge. With ``n_folds``,
+    the judge is rather fitted on the out-of-fold predictions of the base steps: for each fold, a copy of each
+    base step is fitted on the other folds, and predicts the fold. The base steps are then fitted on all the data.
+    The folds are contiguous slices of the data inputs, in their order: they are not shuffled,
+    so shuffle sorted or grouped data inputs before the model stacking.
+
+    .. code-block:: python
+
+        ModelStacking([
+            SKLearnWrapper(GradientBoostingRegressor()),
+            SKLearnWrapper(KMeans()),
+        ], judge=SKLearnWrapper(Ridge()), n_folds=5)
+
+    """
 
     def __init__(
             self,
             steps_as_tuple: NamedTupleList,
             judge: BaseStep,
+            n_folds: int = None,
             **kwargs
     ):
         """
@@ -205,22 +1023,30 @@ class ModelStacking(FeatureUnion):
 
         :param steps_as_tuple: the NamedTupleList of steps to process in parallel and to join.
         :param judge: a BaseStep that will learn to judge the best answer and who to trust out of every parallel steps.
+        :param n_folds: number of contiguous, unshuffled folds of the out-of-fold predictions to fit the judge on. If None, the judge is fitted on the predictions of the base steps on their own training data.
         :param kwargs: Other arguments to send to ``FeatureUnion``.
         """
+        if n_folds is not None and n_folds < 2:
+            raise ValueError('n_folds must be at least 2 to compute out-of-fold predictions, got {0}.'.format(n_folds))
+
         FeatureUnion.__init__(self, steps_as_tuple, **kwargs)
         self.judge: BaseStep = judge  # TODO: add "other" types of step(s) to TuncableSteps or to another intermediate class. For example, to get their hyperparameters.
+        self.n_folds = n_folds
 
     def handle_fit_transform(self, data_container: DataContainer, context: ExecutionContext) -> (BaseStep, DataContainer):
-        new_self, _ = FeatureUnion.handle_fit_transform(self, data_container, context)
+        expected_outputs = data_container.expected_outputs
+        new_self, data_container = self._fit_base_steps(data_container, context)
 
-        new_self = new_self.fit(data_container.data_inputs, data_container.expected_outputs)
+        new_self.judge, results = new_self.judge.fit_transform(data_container.data_inputs, expected_outputs)
+        data_container.set_data_inputs(results)
 
-        return new_self, new_self.handle_transform(data_container, context)
+        return new_self, data_container
 
     def handle_fit(self, data_container: DataContainer, context: ExecutionContext) -> BaseStep:
-        new_self = FeatureUnion.handle_fit(self, data_container, context)
+        expected_outputs = data_container.expected_outputs
+        new_self, data_container = self._fit_base_steps(data_container, context)
 
-        new_self = new_self.fit(data_container.data_inputs, data_container.expected_outputs)
+        new_self.judge = new_self.judge.fit(data_container.data_inputs, expected_outputs)
 
         return new_self
 
@@ -231,20 +1057,109 @@ class ModelStacking(FeatureUnion):
 
         return data_container
 
+    def _fit_base_steps(self, data_container: DataContainer, context: ExecutionContext) -> ('ModelStacking', DataContainer):
+        """
+        Fit the base steps once, and return the joined predictions to fit the judge on.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: self, and the joined predictions of the base steps (out-of-fold predictions if ``n_folds`` is set)
+        """
+        if self.n_folds is None:
+            return FeatureUnion.handle_fit_transform(self, data_container, context)
+
+        out_of_fold_data_container = self._transform_out_of_fold(data_container, context.push(self))
+        new_self = FeatureUnion.handle_fit(self, data_container, context)
+        return new_self, out_of_fold_data_container
+
+    def _transform_out_of_fold(self, data_container: DataContainer, context: ExecutionContext) -> DataContainer:
+        """
+        Predict each fold with copies of the base steps fitted on the other folds, all in parallel,
+        and join the predictions of the base steps.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: joined out-of-fold predictions of the base steps
+        """
+        folds = _split_folds(data_container, self.n_folds)
+        fits = [
+            (step, NumpyDataContainer.concat(folds[:i] + folds[i + 1:]), fold)
+            for _, step in self.steps_as_tuple
+            for i, fold in enumerate(folds)
+        ]
+
+        if self.n_jobs != 1:
+            from joblib import delayed
+
+            predictions = self._run_in_parallel(
+                delayed(_fit_transform_out_of_fold)(step, train_data_container, fold, context)
+                for step, train_data_container, fold in fits
+            )
+        else:
+            predictions = [
+                _fit_transform_out_of_fold(step, train_data_container, fold, context)
+                for step, train_data_container, fold in fits
+            ]
+
+        data_containers = [
+            NumpyDataContainer.concat(predictions[i:i + len(folds)])
+            for i in range(0, len(predictions), len(folds))
+        ]
+        return self._did_transform(self._create_union_data_container(data_container, data_containers), context)
+
+    def _fit_transform_data_container(self, data_container, context):
+        """
+        Fit transform each base step in a single pass, in parallel.
+
+        :param data_container: data container
+        :param context: execution context
+        :return: self, and the data container of each base step
+        """
+        if self.share_common_prefixes or self._should_share_memory(data_container):
+            return FeatureUnion._fit_transform_data_container(self, data_container, context)
+
+        results = self._handle_branches([
+            (name, step.handle_fit_transform, (data_container.copy(), context))
+            for name, step in self.steps_as_tuple
+        ], ExecutionMode.FIT_TRANSFORM)
+
+        for i, (fitted_step, _) in enumerate(results):
+            self.steps_as_tuple[i] = (self.steps_as_tuple[i][0], fitted_step)
+        self._refresh_steps()
+
+        return self, self._create_union_data_container(data_container, (dc for _, dc in results))
+
+    def freeze(self) -> Callable:
+        """
+        Compile the fitted model stacking into a :class:`~neuraxle.pipeline.FrozenPipeline`
+        of the frozen union, and of the frozen judge.
+
+        :return: frozen model stacking
+        :rtype: FrozenPipeline
+        """
+        from neuraxle.pipeline import FrozenPipeline
+        judge = self.judge.freeze() if isinstance(self.judge, BaseStep) else self.judge.transform
+        return FrozenPipeline([
+            ('union', FeatureUnion.freeze(self)),
+            ('judge', judge)
+        ])
+
     def fit(self, data_inputs, expected_outputs=None) -> 'ModelStacking':
         """
         Fit the parallel steps on the data. It will make use of some parallel processing.
-        Also, fit the judge on the result of the parallel steps.
+        Also, fit the judge on the result of the parallel steps, or on their out-of-fold predictions with ``n_folds``.
+        This goes through :func:`~ModelStacking.handle_fit`, so that each base step is only fitted once.
 
         :param data_inputs: The input data to fit onto
         :param expected_outputs: The output that should be obtained when fitting.
         :return: self
         """
-        FeatureUnion.fit(self, data_inputs, expected_outputs)
-        results = FeatureUnion.transform(self, data_inputs)
+        data_container = DataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=expected_outputs)
+        if isinstance(data_inputs, Iterable):
+            data_container.set_current_ids(LazyCurrentIds(range(len(data_inputs))))
 
-        self.judge = self.judge.fit(results, expected_outputs)
-        return self
+        context = ExecutionContext(execution_mode=ExecutionMode.FIT, hashing=False)
+        return self.handle_fit(data_container, context)
 
     def transform(self, data_inputs):
         """
@@ -6,6 +6,7 @@ from neuraxle.hyperparams.space import HyperparameterSpace
 from neuraxle.pipeline import Pipeline
 from neuraxle.steps.flow import ChooseOneOrManyStepsOf, ChooseOneStepOf
 from neuraxle.steps.misc import TransformCallbackStep, TapeCallbackFunction, FitTransformCallbackStep
+from neuraxle.steps.numpy import MultiplyByN, AddN
 from testing.steps.neuraxle_test_case import NeuraxleTestCase
 
 DATA_INPUTS = np.array(range(10))
@@ -421,3 +422,78 @@ def test_choose_one_step_of_fit_should_choose_step(test_case: NeuraxleTestCase):
     p = p.transform(DATA_INPUTS)
 
     assert_callback_data_is_as_expected(test_case)
+
+
+def test_choose_one_step_of_should_return_the_chosen_step_outputs_as_is():
+    data_inputs = np.arange(12.).reshape(6, 2)
+    p = Pipeline([
+        ChooseOneStepOf([
+            ('a', MultiplyByN(2)),
+            ('b', AddN(1))
+        ])
+    ])
+    p.set_hyperparams({'ChooseOneStepOf__choice': 'b'})
+
+    p, outputs = p.fit_transform(data_inputs, data_inputs)
+
+    assert np.array_equal(outputs, data_inputs + 1)
+    assert np.array_equal(p.freeze()(data_inputs), data_inputs + 1)
+
+
+def test_choose_one_or_many_steps_of_should_join_only_the_enabled_steps():
+    data_inputs = np.arange(12.).reshape(6, 2)
+    p = Pipeline([
+        ChooseOneOrManyStepsOf([
+            ('a', MultiplyByN(2)),
+            ('b', AddN(1)),
+            ('c', AddN(2))
+        ])
+    ])
+    p.set_hyperparams({
+        'ChooseOneOrManyStepsOf__a__enabled': True,
+        'ChooseOneOrManyStepsOf__b__enabled': False,
+        'ChooseOneOrManyStepsOf__c__enabled': True
+    })
+
+    outputs = p.transform(data_inputs)
+
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2, data_inputs + 2], axis=-1))
+    assert np.array_equal(p.freeze()(data_inputs), outputs)
+
+
+def _spy_on_branches_handlers(choose_steps_of, handled_branches):
+    for name, step in choose_steps_of.steps_as_tuple:
+        for execution_mode, handle_method_name in [('fit', 'handle_fit'), ('transform', 'handle_transform')]:
+            def spied_handle_method(data_container, context, name=name, execution_mode=execution_mode,
+                                    handle_method=getattr(step, handle_method_name)):
+                handled_branches[execution_mode].append(name)
+                return handle_method(data_container, context)
+
+            setattr(step, handle_method_name, spied_handle_method)
+
+
+@pytest.mark.parametrize('choose_steps_of_class, hyperparams', [
+    (ChooseOneStepOf, {'ChooseOneStepOf__choice': 'b'}),
+    (ChooseOneOrManyStepsOf, {
+        'ChooseOneOrManyStepsOf__a__enabled': False,
+        'ChooseOneOrManyStepsOf__b__enabled': True,
+        'ChooseOneOrManyStepsOf__c__enabled': False
+    })
+])
+def test_choose_steps_of_fit_transform_should_only_dispatch_the_enabled_steps(choose_steps_of_class, hyperparams):
+    data_inputs = np.arange(12.).reshape(6, 2)
+    choose_steps_of = choose_steps_of_class([
+        ('a', MultiplyByN(2)),
+        ('b', AddN(1)),
+        ('c', AddN(2))
+    ])
+    p = Pipeline([choose_steps_of])
+    p.set_hyperparams(hyperparams)
+    handled_branches = {'fit': [], 'transform': []}
+    _spy_on_branches_handlers(choose_steps_of, handled_branches)
+
+    p, outputs = p.fit_transform(data_inputs, data_inputs)
+
+    assert handled_branches == {'fit': ['b'], 'transform': ['b']}
+    assert np.array_equal(outputs, data_inputs + 1)
+    assert choose_steps_of._parallel is None
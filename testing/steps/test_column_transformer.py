@@ -3,8 +3,8 @@ from typing import Any
 
 import numpy as np
 import pytest
-from neuraxle.base import BaseStep
-from neuraxle.steps.column_transformer import ColumnTransformer
+from neuraxle.base import BaseStep, DataContainer, ExecutionContext
+from neuraxle.steps.column_transformer import ColumnTransformer, ColumnsSelectorND, ColumnSelector2D
 
 
 class MultiplyBy2(BaseStep):
@@ -413,6 +413,44 @@ def test_column_transformer_transform_should_support_multiple_tuples():
     assert np.array_equal(test_case.expected_processed_outputs, outputs)
 
 
+@pytest.mark.parametrize('column_selection,expected_columns', [
+    (1, [1]),
+    (-1, [3]),
+    (range(1, 3), [1, 2]),
+    ([0, 2], [0, 2]),
+    ([3, 0], [3, 0]),
+])
+def test_column_selector_should_select_the_last_axis_of_nd_arrays(column_selection, expected_columns):
+    data_inputs = np.arange(24).reshape(2, 3, 4)
+
+    outputs = ColumnsSelectorND(column_selection, n_dimension=3).transform(data_inputs)
+
+    assert np.array_equal(outputs, data_inputs[:, :, expected_columns])
+
+
+def test_column_selector_should_return_a_view_of_evenly_spaced_columns():
+    data_inputs = np.arange(24).reshape(4, 6)
+
+    outputs = ColumnSelector2D([1, 3, 5]).transform(data_inputs)
+
+    assert np.shares_memory(outputs, data_inputs)
+    assert np.array_equal(outputs, data_inputs[:, [1, 3, 5]])
+
+
+def test_column_transformer_should_not_mutate_the_data_container_it_receives():
+    data_inputs = [[0, 1, 2], [3, 4, 5]]
+    data_container = DataContainer(current_ids=None, data_inputs=data_inputs)
+    step = ColumnTransformer([
+        (0, MultiplyBy2()),
+        (2, MultiplyBy2())
+    ])
+
+    outputs = step.handle_transform(data_container, ExecutionContext())
+
+    assert data_container.data_inputs is data_inputs
+    assert np.array_equal(outputs.data_inputs, np.array([[0, 4], [6, 10]]))
+
+
 def assert_data_fitted_properly(actual_fitted_data, expected_fitted_data):
     for actual_fitted, expected_fitted in zip(actual_fitted_data, expected_fitted_data):
         assert np.array_equal(actual_fitted[0], expected_fitted[0])
@@ -1,7 +1,11 @@
+import numpy as np
+import pytest
+
 from neuraxle.pipeline import Pipeline
 from neuraxle.steps.loop import ForEachDataInput
 from neuraxle.steps.misc import TransformCallbackStep, TapeCallbackFunction, FitCallbackStep, \
     FitTransformCallbackStep
+from neuraxle.steps.numpy import MultiplyByN, AddN
 
 
 def test_fit_for_each_should_fit_all_steps_for_each_data_inputs_expected_outputs():
@@ -54,3 +58,39 @@ def test_transform_should_transform_all_steps_for_each_data_inputs_expected_outp
     outputs = p.transform(data_inputs)
 
     assert tape.get_name_tape() == ["1", "2", "1", "2"]
+
+
+@pytest.mark.parametrize('backend', ['threading', 'loky'])
+def test_transform_should_transform_data_inputs_in_parallel_in_order(backend):
+    p = Pipeline([
+        ForEachDataInput(Pipeline([MultiplyByN(2), AddN(1)]), n_jobs=2, backend=backend, batch_size=3)
+    ])
+    data_inputs = [np.arange(i, i + 3) for i in range(10)]
+
+    outputs = p.transform(data_inputs)
+
+    assert len(outputs) == 10
+    for output, data_input in zip(outputs, data_inputs):
+        assert np.array_equal(output, data_input * 2 + 1)
+
+
+class PickleCountingMultiplyByN(MultiplyByN):
+    n_pickles = 0
+
+    def __getstate__(self):
+        PickleCountingMultiplyByN.n_pickles += 1
+        return self.__dict__
+
+
+def test_transform_should_send_the_wrapped_step_once_per_job_with_process_backends():
+    PickleCountingMultiplyByN.n_pickles = 0
+    p = Pipeline([
+        ForEachDataInput(Pipeline([PickleCountingMultiplyByN(2)]), n_jobs=2, backend='loky')
+    ])
+    data_inputs = [np.arange(i, i + 3) for i in range(10)]
+
+    outputs = p.transform(data_inputs)
+
+    assert PickleCountingMultiplyByN.n_pickles == 2
+    for output, data_input in zip(outputs, data_inputs):
+        assert np.array_equal(output, data_input * 2)
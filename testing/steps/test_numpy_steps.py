@@ -19,6 +19,8 @@ Tests for NumPy Steps
 
 """
 
+from neuraxle.base import Identity
+from neuraxle.pipeline import Pipeline
 from neuraxle.steps.numpy import *
 
 
@@ -58,3 +60,49 @@ def test_numpy_transpose():
 def test_numpy_shape_printer():
     pr = NumpyShapePrinter()
     pr.fit_transform(np.ones((10, 11)))
+
+
+def test_fuse_elementwise_steps_should_fuse_consecutive_elementwise_steps():
+    p = Pipeline([
+        ('multiply', MultiplyByN(2)),
+        ('add', AddN(1)),
+        Identity(),
+        ('nested', Pipeline([
+            ('add_half', AddN(0.5)),
+            ('multiply_by_3', MultiplyByN(3))
+        ]))
+    ])
+    data_inputs = np.arange(6).reshape(2, 3)
+    expected_outputs = p.transform(data_inputs)
+
+    p = fuse_elementwise_steps(p)
+
+    assert list(p.keys()) == ['FusedElementwiseSteps', 'Identity', 'nested']
+    assert list(p['nested'].keys()) == ['FusedElementwiseSteps']
+    assert np.array_equal(p.transform(data_inputs), expected_outputs)
+    assert np.array_equal(data_inputs, np.arange(6).reshape(2, 3))
+
+
+def test_fused_elementwise_steps_should_inverse_transform():
+    fused = FusedElementwiseSteps([
+        ('multiply', MultiplyByN(2)),
+        ('add', AddN(1)),
+        ('multiply_by_3', MultiplyByN(3))
+    ])
+
+    outputs = fused.transform([1, 2])
+
+    assert np.array_equal(outputs, np.array([9, 15]))
+    assert outputs.dtype == np.array([1, 2]).dtype
+    assert np.array_equal(fused.inverse_transform(outputs), np.array([1., 2.]))
+
+
+def test_fused_elementwise_steps_should_use_the_hyperparams_of_the_fused_steps():
+    fused = FusedElementwiseSteps([
+        ('multiply', MultiplyByN(2)),
+        ('add', AddN(1))
+    ])
+
+    fused.set_hyperparams({'multiply__multiply_by': 0.5})
+
+    assert np.array_equal(fused.transform(np.array([2, 4])), np.array([2., 3.]))
@@ -1,5 +1,12 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from neuraxle.base import BaseStep
 from neuraxle.hyperparams.distributions import Boolean
 from neuraxle.hyperparams.space import HyperparameterSpace, HyperparameterSamples
+from neuraxle.pipeline import Pipeline
 from neuraxle.steps.loop import StepClonerForEachDataInput
 from testing.test_pipeline import SomeStep
 
@@ -39,3 +46,68 @@ def test_should_inverse_transform():
     processed_outputs = step_cloner.inverse_transform(processed_outputs)
 
     assert processed_outputs == ['inverse_transform']
+
+
+class LookupTableStep(BaseStep):
+    def __init__(self, table: np.ndarray):
+        BaseStep.__init__(self)
+        self.table = table
+        self.offset = None
+
+    def fit(self, data_inputs, expected_outputs=None):
+        self.offset = np.mean(data_inputs)
+        return self
+
+    def transform(self, data_inputs):
+        return self.table[data_inputs] + self.offset
+
+
+def _create_read_only_table() -> np.ndarray:
+    table = np.arange(100000, dtype=np.float64)
+    table.setflags(write=False)
+    return table
+
+
+@pytest.mark.parametrize('n_jobs,backend', [(1, 'loky'), (2, 'threading'), (2, 'loky')])
+def test_should_fit_clones_sharing_read_only_arrays(n_jobs, backend):
+    table = _create_read_only_table()
+    step_cloner = StepClonerForEachDataInput(LookupTableStep(table), n_jobs=n_jobs, backend=backend)
+    data_inputs = [np.array([0, 1]), np.array([2, 3]), np.array([4, 5])]
+
+    step_cloner = step_cloner.fit(data_inputs)
+    outputs = step_cloner.transform(data_inputs)
+
+    assert [step.offset for step in step_cloner.steps] == [0.5, 2.5, 4.5]
+    assert all(step.table is step_cloner.steps[0].table for step in step_cloner.steps)
+    assert len(pickle.dumps(step_cloner)) < 2 * table.nbytes
+    for output, data_input in zip(outputs, data_inputs):
+        assert np.array_equal(output, table[data_input] + np.mean(data_input))
+
+
+def test_should_clone_with_copy_op_when_wrapped_step_cannot_be_pickled():
+    step = SomeStepInverseTransform()
+    step.callback = lambda x: x
+    step_cloner = StepClonerForEachDataInput(step)
+
+    step_cloner, processed_outputs = step_cloner.fit_transform([0, 1])
+
+    assert len(step_cloner.steps) == 2
+    assert step_cloner.steps[0] is not step_cloner.steps[1]
+    assert processed_outputs == ['fit_transform', 'fit_transform']
+
+
+def test_should_fit_clones_inside_pipeline():
+    table = _create_read_only_table()
+    p = Pipeline([StepClonerForEachDataInput(LookupTableStep(table))])
+    data_inputs = [np.array([0, 1]), np.array([2, 3])]
+
+    p = p.fit(data_inputs)
+    p, fit_transform_outputs = p.fit_transform(data_inputs)
+    outputs = p.transform(data_inputs)
+
+    step_cloner = p['StepClonerForEachDataInput']
+    assert [step.offset for step in step_cloner.steps] == [0.5, 2.5]
+    assert step_cloner.wrapped.offset is None
+    for output, fit_transform_output, data_input in zip(outputs, fit_transform_outputs, data_inputs):
+        assert np.array_equal(output, table[data_input] + np.mean(data_input))
+        assert np.array_equal(fit_transform_output, output)
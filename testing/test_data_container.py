@@ -0,0 +1,143 @@
+"""
+Tests for Data Containers
+========================================
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from neuraxle.base import ExecutionContext
+from neuraxle.data_container import DataContainer, NumpyDataContainer, LazyCurrentIds, MemmapDataContainer
+from neuraxle.pipeline import MiniBatchSequentialPipeline, Joiner
+from neuraxle.steps.numpy import MultiplyByN
+
+
+def test_data_container_convolved_1d_should_slice_numpy_data_inputs():
+    data_inputs = np.arange(25)
+    data_container = DataContainer(current_ids=[str(i) for i in range(25)], data_inputs=data_inputs)
+
+    batches = list(data_container.convolved_1d(stride=10, kernel_size=10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert all(np.shares_memory(batch.data_inputs, data_inputs) for batch in batches)
+    assert batches[2].current_ids == ['20', '21', '22', '23', '24']
+    assert batches[2].expected_outputs == [None] * 5
+
+
+def test_data_container_convolved_1d_should_not_truncate_on_none_data_inputs():
+    data_container = DataContainer(current_ids=[str(i) for i in range(5)], data_inputs=[0, None, 2, 3, 4])
+
+    batches = list(data_container.convolved_1d(stride=2, kernel_size=2))
+
+    assert [batch.data_inputs for batch in batches] == [[0, None], [2, 3], [4]]
+    assert [batch.current_ids for batch in batches] == [['0', '1'], ['2', '3'], ['4']]
+
+
+@pytest.mark.parametrize('stride, kernel_size, n_data_inputs', [
+    (1, 3, 5),
+    (2, 3, 5),
+    (2, 5, 4),
+    (3, 3, 7),
+    (4, 2, 9)
+])
+def test_data_container_convolved_1d_should_batch_numpy_and_list_data_inputs_the_same(
+        stride, kernel_size, n_data_inputs):
+    ids = [str(i) for i in range(n_data_inputs)]
+    list_data_container = DataContainer(
+        current_ids=ids, data_inputs=list(range(n_data_inputs)), expected_outputs=list(range(n_data_inputs)))
+    numpy_data_container = DataContainer(
+        current_ids=ids, data_inputs=np.arange(n_data_inputs), expected_outputs=np.arange(n_data_inputs))
+
+    list_batches = list(list_data_container.convolved_1d(stride=stride, kernel_size=kernel_size))
+    numpy_batches = list(numpy_data_container.convolved_1d(stride=stride, kernel_size=kernel_size))
+
+    assert [list(batch.data_inputs) for batch in numpy_batches] == [batch.data_inputs for batch in list_batches]
+    assert [list(batch.current_ids) for batch in numpy_batches] == [batch.current_ids for batch in list_batches]
+
+
+def test_data_container_convolved_1d_should_keep_the_trailing_overlapping_batches():
+    data_container = DataContainer(current_ids=None, data_inputs=np.arange(5))
+
+    batches = list(data_container.convolved_1d(stride=1, kernel_size=3))
+
+    assert [list(batch.data_inputs) for batch in batches] == [[0, 1, 2], [1, 2, 3], [2, 3, 4], [3, 4]]
+
+
+def test_numpy_data_container_convolved_1d_should_return_views():
+    data_inputs = np.arange(25).reshape(25, 1)
+    expected_outputs = np.arange(25)
+    data_container = NumpyDataContainer(
+        current_ids=LazyCurrentIds(range(25)),
+        data_inputs=data_inputs,
+        expected_outputs=expected_outputs
+    )
+
+    batches = list(data_container.convolved_1d(stride=10, kernel_size=10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert all(np.shares_memory(batch.data_inputs, data_inputs) for batch in batches)
+    assert np.array_equal(batches[2].expected_outputs, np.arange(20, 25))
+    assert list(batches[2].current_ids) == ['20', '21', '22', '23', '24']
+
+
+def test_numpy_data_container_concat_should_join_batches():
+    data_container = NumpyDataContainer(
+        current_ids=LazyCurrentIds(range(25)).rehash('digest'),
+        data_inputs=np.arange(25).reshape(25, 1)
+    )
+    batches = list(data_container.convolved_1d(stride=10, kernel_size=10))
+
+    joined = NumpyDataContainer.concat(batches)
+
+    assert np.array_equal(joined.data_inputs, data_container.data_inputs)
+    assert joined.expected_outputs is None
+    assert isinstance(joined.current_ids, LazyCurrentIds)
+    assert joined.current_ids == data_container.current_ids
+
+
+def test_memmap_data_container_should_batch_memory_mapped_slices(tmpdir):
+    data_inputs_path = os.path.join(str(tmpdir), 'data_inputs.npy')
+    expected_outputs_path = os.path.join(str(tmpdir), 'expected_outputs.npy')
+    np.save(data_inputs_path, np.arange(25, dtype=np.float32).reshape(25, 1))
+    np.save(expected_outputs_path, np.arange(25, dtype=np.float32))
+
+    data_container = MemmapDataContainer.from_npy(data_inputs_path, expected_outputs_path)
+    batches = list(data_container.convolved_1d(stride=10, kernel_size=10))
+
+    assert isinstance(data_container.data_inputs, np.memmap)
+    assert all(isinstance(batch.data_inputs, np.memmap) for batch in batches)
+    assert all(isinstance(batch.expected_outputs, np.memmap) for batch in batches)
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+
+def test_memmap_data_container_should_fit_transform_in_minibatch_pipeline(tmpdir):
+    data_inputs_path = os.path.join(str(tmpdir), 'data_inputs.npy')
+    np.save(data_inputs_path, np.arange(25, dtype=np.float32).reshape(25, 1))
+    data_container = MemmapDataContainer.from_npy(data_inputs_path)
+    p = MiniBatchSequentialPipeline([
+        MultiplyByN(2),
+        Joiner(batch_size=10)
+    ])
+
+    p, data_container = p.handle_fit_transform(data_container, ExecutionContext())
+
+    assert not isinstance(data_container.data_inputs, np.memmap)
+    assert np.array_equal(data_container.data_inputs, np.arange(25).reshape(25, 1) * 2)
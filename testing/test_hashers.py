@@ -0,0 +1,142 @@
+"""
+Tests for Hashers
+========================================
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+
+import hashlib
+
+import numpy as np
+
+from neuraxle.base import NumpySplitMix64Hasher, ExecutionContext, HashlibMd5Hasher
+from neuraxle.data_container import DataContainer, LazyCurrentIds
+from neuraxle.hyperparams.space import HyperparameterSamples
+from neuraxle.pipeline import Pipeline
+from neuraxle.steps.numpy import MultiplyByN, AddN
+
+
+def test_numpy_splitmix64_hasher_should_create_ids_when_current_ids_are_none():
+    hasher = NumpySplitMix64Hasher()
+
+    current_ids = hasher.hash(None, HyperparameterSamples(), np.array(range(10)))
+
+    assert current_ids.dtype == np.uint64
+    assert np.array_equal(current_ids, np.arange(10, dtype=np.uint64))
+
+
+def test_numpy_splitmix64_hasher_should_be_deterministic_and_unique():
+    hasher = NumpySplitMix64Hasher()
+    hyperparams = HyperparameterSamples({'learning_rate': 0.1})
+
+    current_ids = hasher.hash(None, hyperparams, np.array(range(1000)))
+    rehashed_ids = NumpySplitMix64Hasher().hash(None, hyperparams, np.array(range(1000)))
+
+    assert np.array_equal(current_ids, rehashed_ids)
+    assert len(set(current_ids.tolist())) == 1000
+
+
+def test_numpy_splitmix64_hasher_should_depend_on_hyperparams():
+    hasher = NumpySplitMix64Hasher()
+    current_ids = np.arange(100, dtype=np.uint64)
+
+    ids_a = hasher.hash(current_ids, HyperparameterSamples({'learning_rate': 0.1}), None)
+    ids_b = hasher.hash(current_ids, HyperparameterSamples({'learning_rate': 0.2}), None)
+
+    assert not np.any(ids_a == ids_b)
+    assert np.array_equal(current_ids, np.arange(100, dtype=np.uint64))
+
+
+def test_numpy_splitmix64_hasher_should_accept_string_ids():
+    hasher = NumpySplitMix64Hasher()
+    hyperparams = HyperparameterSamples({'learning_rate': 0.1})
+
+    current_ids = hasher.hash(['a', 'b', 'a'], hyperparams, None)
+
+    assert current_ids[0] == current_ids[2]
+    assert current_ids[0] != current_ids[1]
+    assert isinstance(hasher.single_hash('a', hyperparams), str)
+
+
+def test_pipeline_should_rehash_ids_with_numpy_splitmix64_hasher():
+    p = Pipeline([
+        MultiplyByN(2),
+        AddN(1)
+    ])
+    p.apply('set_hashers', [NumpySplitMix64Hasher()])
+    data_container = DataContainer(current_ids=None, data_inputs=np.array(range(10)))
+
+    data_container = p.handle_transform(data_container, ExecutionContext())
+
+    assert np.array_equal(data_container.data_inputs, np.array(range(10)) * 2 + 1)
+    assert data_container.current_ids.dtype == np.uint64
+    assert len(data_container.current_ids) == 10
+
+
+def _eager_md5_hash(current_ids, hyperparams):
+    hyperparams_hash = hashlib.md5(str.encode(str(hyperparams.to_flat_as_dict_primitive()))).hexdigest()
+    new_current_ids = []
+    for current_id in current_ids:
+        m = hashlib.md5()
+        m.update(str.encode(current_id))
+        m.update(str.encode(hyperparams_hash))
+        new_current_ids.append(m.hexdigest())
+    return new_current_ids
+
+
+def test_md5_hasher_should_return_lazy_ids_equal_to_eager_ids():
+    hasher = HashlibMd5Hasher()
+    hyperparams_a = HyperparameterSamples({'learning_rate': 0.1})
+    hyperparams_b = HyperparameterSamples({'epochs': 10})
+
+    current_ids = hasher.hash(None, hyperparams_a, list(range(10)))
+    current_ids = hasher.hash(current_ids, hyperparams_b, list(range(10)))
+
+    expected_ids = _eager_md5_hash([str(i) for i in range(10)], hyperparams_a)
+    expected_ids = _eager_md5_hash(expected_ids, hyperparams_b)
+    assert isinstance(current_ids, LazyCurrentIds)
+    assert not current_ids.is_materialized()
+    assert current_ids[3] == expected_ids[3]
+    assert current_ids[2:5] == expected_ids[2:5]
+    assert list(current_ids) == expected_ids
+    assert current_ids.is_materialized()
+
+
+def test_lazy_ids_summary_should_match_eager_ids_summary():
+    p = Pipeline([
+        MultiplyByN(2),
+        AddN(1)
+    ])
+    data_container = DataContainer(current_ids=None, data_inputs=np.array(range(10)))
+
+    data_container = p.handle_transform(data_container, ExecutionContext())
+
+    eager_data_container = DataContainer(current_ids=list(data_container.current_ids), data_inputs=[])
+    assert data_container.hash_summary() == eager_data_container.hash_summary()
+
+
+def test_lazy_ids_summary_should_match_eager_ids_summary_without_materializing_them():
+    hasher = HashlibMd5Hasher()
+    current_ids = hasher.hash(None, HyperparameterSamples({'learning_rate': 0.1}), list(range(10)))
+    eager_current_ids = _eager_md5_hash([str(i) for i in range(10)], HyperparameterSamples({'learning_rate': 0.1}))
+
+    summary_id = DataContainer(current_ids=current_ids, data_inputs=[]).hash_summary()
+
+    assert not current_ids.is_materialized()
+    assert summary_id == DataContainer(current_ids=eager_current_ids, data_inputs=[]).hash_summary()
+    assert current_ids == eager_current_ids
+    assert hash(current_ids) == hash(LazyCurrentIds(eager_current_ids))
@@ -0,0 +1,66 @@
+"""
+Tests for Import Time
+========================================
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+
+import os
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+import neuraxle
+
+HEAVY_OPTIONAL_DEPENDENCIES = ('joblib', 'sklearn', 'scipy', 'conv')
+
+
+def imported_modules(statement: str) -> List[str]:
+    """
+    Import modules in a fresh interpreter, and list the modules it loaded in ``sys.modules``.
+
+    :param statement: import statement to run
+    :return: names of the imported modules
+    """
+    repository_root = os.path.dirname(os.path.dirname(os.path.abspath(neuraxle.__file__)))
+    process = subprocess.run(
+        [sys.executable, '-c', statement + '\nimport sys\nprint("\\n".join(sys.modules))'],
+        cwd=repository_root,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    return process.stdout.splitlines()
+
+
+@pytest.mark.parametrize('statement', [
+    'import neuraxle.pipeline',
+    'import neuraxle.union',
+    'import neuraxle.steps.numpy',
+    'import neuraxle.hyperparams.distributions',
+    'import neuraxle.metaopt.random',
+])
+def test_import_should_not_load_heavy_optional_dependencies(statement):
+    modules = imported_modules(statement)
+
+    imported_heavy_modules = [
+        module for module in modules
+        if module.split('.')[0] in HEAVY_OPTIONAL_DEPENDENCIES
+    ]
+    assert imported_heavy_modules == []
@@ -1,7 +1,12 @@
+import time
+
 import numpy as np
+import pytest
 
-from neuraxle.pipeline import MiniBatchSequentialPipeline, Joiner
+from neuraxle.base import BaseStep, NonFittableMixin
+from neuraxle.pipeline import MiniBatchSequentialPipeline, Joiner, ParallelJoiner, QueuedJoiner
 from neuraxle.steps.misc import TransformCallbackStep, TapeCallbackFunction, FitTransformCallbackStep
+from neuraxle.steps.numpy import MultiplyByN, AddN
 
 
 class MultiplyBy2TransformCallbackStep(TransformCallbackStep):
@@ -96,3 +101,187 @@ def test_mini_batch_sequential_pipeline_should_fit_transform_steps_sequentially_
     assert tape4_fit.data == [([0, 8, 16, 24, 32, 40, 48, 56, 64, 72], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
                               ([80, 88, 96, 104, 112, 120, 128, 136, 144, 152], [10, 11, 12, 13, 14, 15, 16, 17, 18, 19])]
     assert tape4.name_tape == ["4", "4"]
+
+
+def test_mini_batch_sequential_pipeline_should_keep_numpy_arrays_between_barriers():
+    # Given
+    p = MiniBatchSequentialPipeline([
+        MultiplyByN(2),
+        Joiner(batch_size=10),
+        AddN(1),
+        Joiner(batch_size=10)
+    ])
+
+    # When
+    outputs = p.transform(np.arange(25).reshape(25, 1))
+
+    # Then
+    assert isinstance(outputs, np.ndarray)
+    assert np.array_equal(outputs, np.arange(25).reshape(25, 1) * 2 + 1)
+
+
+class PadToBatchLengthStep(NonFittableMixin, BaseStep):
+    def transform(self, data_inputs):
+        return np.zeros((len(data_inputs), len(data_inputs)))
+
+
+def test_joiner_should_join_numpy_batches_of_different_shapes_as_a_list():
+    # Given
+    p = MiniBatchSequentialPipeline([
+        PadToBatchLengthStep(),
+        Joiner(batch_size=10)
+    ])
+
+    # When
+    outputs = p.transform(np.arange(15))
+
+    # Then
+    assert isinstance(outputs, list)
+    assert len(outputs) == 15
+    assert [len(output) for output in outputs] == [10] * 10 + [5] * 5
+
+
+def test_parallel_joiner_should_transform_batches_in_parallel_and_keep_order():
+    # Given
+    tape = TapeCallbackFunction()
+    p = MiniBatchSequentialPipeline([
+        MultiplyBy2TransformCallbackStep(tape, ["1"]),
+        ParallelJoiner(batch_size=10, n_jobs=2, max_in_flight=2)
+    ])
+
+    # When
+    outputs = p.transform(list(range(95)))
+
+    # Then
+    assert outputs == [i * 2 for i in range(95)]
+    assert len(tape.data) == 10
+
+
+class PickleCountingMultiplyByN(MultiplyByN):
+    n_pickles = 0
+
+    def __getstate__(self):
+        PickleCountingMultiplyByN.n_pickles += 1
+        return self.__dict__
+
+
+def test_parallel_joiner_should_send_the_sub_pipeline_once_per_job_with_process_backends():
+    # Given
+    PickleCountingMultiplyByN.n_pickles = 0
+    p = MiniBatchSequentialPipeline([
+        PickleCountingMultiplyByN(2),
+        ParallelJoiner(batch_size=10, n_jobs=2, backend='loky')
+    ])
+    data_inputs = np.arange(95)
+
+    # When
+    outputs = p.transform(data_inputs)
+
+    # Then
+    assert np.array_equal(outputs, data_inputs * 2)
+    assert PickleCountingMultiplyByN.n_pickles == 2
+
+
+def test_parallel_joiner_should_fit_transform_batches_sequentially():
+    # Given
+    tape = TapeCallbackFunction()
+    tape_fit = TapeCallbackFunction()
+    p = MiniBatchSequentialPipeline([
+        MultiplyBy2FitTransformCallbackStep(tape, tape_fit, ["1"]),
+        ParallelJoiner(batch_size=10, n_jobs=2)
+    ])
+
+    # When
+    p, outputs = p.fit_transform(list(range(20)), list(range(20)))
+
+    # Then
+    assert outputs == [i * 2 for i in range(20)]
+    assert tape.data == [list(range(10)), list(range(10, 20))]
+
+
+def test_mini_batch_sequential_pipeline_transform_stream_should_split_each_batch_with_joiners():
+    # Given
+    tape = TapeCallbackFunction()
+    p = MiniBatchSequentialPipeline([
+        MultiplyBy2TransformCallbackStep(tape, ["1"]),
+        Joiner(batch_size=10)
+    ])
+
+    # When
+    outputs = list(p.transform_stream(iter([list(range(15)), list(range(15, 20))])))
+
+    # Then
+    assert outputs == [[i * 2 for i in range(15)], [i * 2 for i in range(15, 20)]]
+    assert tape.data == [list(range(10)), list(range(10, 15)), list(range(15, 20))]
+
+
+class SleepStep(NonFittableMixin, BaseStep):
+    def __init__(self, seconds, intervals=None):
+        BaseStep.__init__(self)
+        NonFittableMixin.__init__(self)
+        self.seconds = seconds
+        self.intervals = intervals if intervals is not None else []
+
+    def transform(self, data_inputs):
+        start = time.perf_counter()
+        time.sleep(self.seconds)
+        self.intervals.append((start, time.perf_counter()))
+        return data_inputs
+
+
+class FailingStep(NonFittableMixin, BaseStep):
+    def transform(self, data_inputs):
+        raise ValueError('failing step')
+
+
+def test_queued_joiner_should_transform_steps_in_order_and_count_each_stage():
+    # Given
+    joiner = QueuedJoiner(batch_size=10, max_queue_size=1)
+    p = MiniBatchSequentialPipeline([
+        MultiplyByN(2),
+        AddN(1),
+        joiner
+    ])
+
+    # When
+    outputs = p.transform(np.arange(95).reshape(95, 1))
+
+    # Then
+    assert np.array_equal(outputs, np.arange(95).reshape(95, 1) * 2 + 1)
+    assert [stage.n_batches for stage in joiner.stage_statistics] == [10, 10]
+    assert [stage.n_data_inputs for stage in joiner.stage_statistics] == [95, 95]
+
+
+def test_queued_joiner_should_overlap_stages():
+    # Given
+    intervals_1 = []
+    intervals_2 = []
+    p = MiniBatchSequentialPipeline([
+        ('sleep_1', SleepStep(0.01, intervals_1)),
+        ('sleep_2', SleepStep(0.01, intervals_2)),
+        QueuedJoiner(batch_size=1)
+    ])
+
+    # When
+    outputs = p.transform(list(range(10)))
+
+    # Then
+    assert outputs == list(range(10))
+    assert len(intervals_1) == 10
+    assert len(intervals_2) == 10
+    assert any(
+        start_1 < end_2 and start_2 < end_1
+        for start_1, end_1 in intervals_1
+        for start_2, end_2 in intervals_2
+    )
+
+
+def test_queued_joiner_should_raise_errors_of_a_stage():
+    p = MiniBatchSequentialPipeline([
+        MultiplyByN(2),
+        FailingStep(),
+        QueuedJoiner(batch_size=10)
+    ])
+
+    with pytest.raises(ValueError):
+        p.transform(np.arange(95).reshape(95, 1))
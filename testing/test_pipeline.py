@@ -22,13 +22,18 @@ Tests for Pipelines
 import numpy as np
 import pytest
 
+import neuraxle.pipeline
+from neuraxle.base import HashlibMd5Hasher, BaseStep, FrozenStep, NonFittableMixin
+from neuraxle.checkpoints import DefaultCheckpoint
 from neuraxle.hyperparams.distributions import RandInt, LogUniform
 from neuraxle.hyperparams.space import nested_dict_to_flat, HyperparameterSpace
-from neuraxle.pipeline import Pipeline
+from neuraxle.pipeline import Pipeline, FrozenPipeline
+from neuraxle.steps.flow import TrainOnlyWrapper, ExpandDim
+from neuraxle.steps.loop import ForEachDataInput
 from neuraxle.steps.misc import TransformCallbackStep, TapeCallbackFunction
-from neuraxle.steps.numpy import NumpyTranspose
+from neuraxle.steps.numpy import NumpyTranspose, MultiplyByN, AddN
 from neuraxle.steps.sklearn import SKLearnWrapper
-from neuraxle.union import Identity, AddFeatures, ModelStacking
+from neuraxle.union import Identity, AddFeatures, ModelStacking, FeatureUnion
 from testing.mocks.step_mocks import SomeStep, AN_INPUT, AN_EXPECTED_OUTPUT
 
 steps_lists = [
@@ -438,3 +443,203 @@ def test_hyperparam_space():
     assert 'ModelStacking__SomeStep1__n_estimators' in hyperparams.keys()
     assert 'ModelStacking__SomeStep2__max_depth' in hyperparams.keys()
     assert 'ModelStacking__SomeStep3__max_depth' in hyperparams.keys()
+
+
+class CountingHasher(HashlibMd5Hasher):
+    def __init__(self):
+        self.calls = 0
+
+    def hash(self, current_ids, hyperparameters, data_inputs=None):
+        self.calls += 1
+        return HashlibMd5Hasher.hash(self, current_ids, hyperparameters, data_inputs)
+
+
+def test_pipeline_should_not_hash_when_no_step_reads_the_current_ids():
+    hasher = CountingHasher()
+    p = Pipeline([
+        MultiplyByN(2),
+        AddN(1)
+    ])
+    p.apply('set_hashers', [hasher])
+
+    outputs = p.transform(np.array(range(10)))
+
+    assert not p.is_hashing_enabled()
+    assert hasher.calls == 0
+    assert np.array_equal(outputs, np.array(range(10)) * 2 + 1)
+
+
+def test_pipeline_should_hash_when_hashing_is_forced():
+    hasher = CountingHasher()
+    p = Pipeline([
+        MultiplyByN(2),
+        AddN(1)
+    ], hashing=True)
+    p.apply('set_hashers', [hasher])
+
+    outputs = p.transform(np.array(range(10)))
+
+    assert hasher.calls > 0
+    assert np.array_equal(outputs, np.array(range(10)) * 2 + 1)
+
+
+def test_pipeline_should_enable_hashing_when_a_nested_step_is_resumable():
+    p = Pipeline([
+        MultiplyByN(2),
+        Pipeline([
+            DefaultCheckpoint(),
+            AddN(1)
+        ])
+    ])
+
+    assert p.is_hashing_enabled()
+
+
+def test_pipeline_should_not_enable_hashing_for_steps_that_dont_read_the_current_ids():
+    p = Pipeline([
+        ForEachDataInput(AddN(1))
+    ])
+
+    assert not p.is_hashing_enabled()
+
+
+def test_pipeline_should_enable_hashing_when_a_step_reads_the_summary_id():
+    p = Pipeline([
+        ExpandDim(AddN(1))
+    ])
+
+    assert p.is_hashing_enabled()
+
+
+def test_pipeline_should_respect_the_hashing_mode_of_nested_pipelines():
+    forced_p = Pipeline([
+        Pipeline([AddN(1)], hashing=True)
+    ])
+    disabled_p = Pipeline([
+        Pipeline([DefaultCheckpoint(), AddN(1)], hashing=False)
+    ])
+
+    assert forced_p.is_hashing_enabled()
+    assert not disabled_p.is_hashing_enabled()
+
+
+def test_pipeline_should_only_search_the_steps_reading_the_current_ids_when_they_change(monkeypatch):
+    p = Pipeline([
+        MultiplyByN(2),
+        AddN(1)
+    ])
+
+    def fail(step):
+        raise AssertionError('the steps should not be searched on each call')
+
+    monkeypatch.setattr(neuraxle.pipeline, '_needs_current_ids', fail)
+    outputs = p.transform(np.array(range(10)))
+    monkeypatch.undo()
+    p.set_steps([DefaultCheckpoint(), AddN(1)])
+
+    assert np.array_equal(outputs, np.array(range(10)) * 2 + 1)
+    assert p.is_hashing_enabled()
+
+
+def test_pipeline_transform_stream_should_transform_batches_lazily():
+    pulled_batches = []
+
+    def batches():
+        for i in range(3):
+            pulled_batches.append(i)
+            yield np.array(range(i * 10, (i + 1) * 10))
+
+    p = Pipeline([
+        MultiplyByN(2),
+        AddN(1)
+    ])
+
+    outputs_stream = p.transform_stream(batches())
+    first_outputs = next(outputs_stream)
+
+    assert pulled_batches == [0]
+    assert np.array_equal(first_outputs, np.array(range(10)) * 2 + 1)
+    assert np.array_equal(np.concatenate([first_outputs] + list(outputs_stream)), np.array(range(30)) * 2 + 1)
+    assert pulled_batches == [0, 1, 2]
+
+
+class CurrentIdsSpyStep(Identity):
+    def __init__(self):
+        Identity.__init__(self)
+        self.current_ids = []
+
+    def _transform_data_container(self, data_container, context):
+        self.current_ids.extend(data_container.current_ids)
+        return data_container
+
+
+def test_pipeline_transform_stream_should_offset_current_ids_of_each_batch():
+    streamed_spy = CurrentIdsSpyStep()
+    spy = CurrentIdsSpyStep()
+
+    list(Pipeline([streamed_spy], hashing=True).transform_stream([[0, 1], [2, 3]]))
+    Pipeline([spy], hashing=True).transform([0, 1, 2, 3])
+
+    assert len(streamed_spy.current_ids) == 4
+    assert streamed_spy.current_ids == spy.current_ids
+
+
+def test_pipeline_freeze_should_flatten_nested_pipelines_and_remove_identities(tmpdir):
+    p = Pipeline([
+        MultiplyByN(2),
+        Pipeline([
+            DefaultCheckpoint(),
+            AddN(1),
+            Identity()
+        ]),
+        FeatureUnion([MultiplyByN(3), AddN(2)], n_jobs=1)
+    ], cache_folder=tmpdir)
+    data_inputs = np.array([[0, 1], [2, 3]])
+    p = p.fit(data_inputs, data_inputs)
+
+    frozen = p.freeze()
+
+    assert isinstance(frozen, FrozenPipeline)
+    assert frozen.keys() == ['MultiplyByN', 'Pipeline__AddN', 'FeatureUnion']
+    assert np.array_equal(frozen(data_inputs), p.transform(data_inputs))
+
+
+def test_frozen_pipeline_should_not_hash():
+    hasher = CountingHasher()
+    p = Pipeline([
+        MultiplyByN(2),
+        TrainOnlyWrapper(AddN(1))
+    ], hashing=True)
+    p.apply('set_hashers', [hasher])
+
+    outputs = p.freeze()(np.array(range(10)))
+
+    assert hasher.calls == 0
+    assert np.array_equal(outputs, np.array(range(10)) * 2 + 1)
+
+
+def test_frozen_pipeline_should_be_read_only():
+    frozen = Pipeline([MultiplyByN(2)]).freeze()
+
+    with pytest.raises(AttributeError):
+        frozen.steps = ()
+
+
+class HandlerOnlyMultiplyBy2(NonFittableMixin, BaseStep):
+    def _transform_data_container(self, data_container, context):
+        data_container.set_data_inputs(np.array(data_container.data_inputs) * 2)
+        return data_container
+
+    def transform(self, data_inputs):
+        raise NotImplementedError('use handle_transform')
+
+
+def test_pipeline_freeze_should_transform_with_handlers_of_steps_overriding_them():
+    p = Pipeline([HandlerOnlyMultiplyBy2(), AddN(1)])
+    data_inputs = np.array([[0, 1], [2, 3]])
+    p = p.fit(data_inputs, data_inputs)
+
+    frozen = p.freeze()
+
+    assert isinstance(frozen.steps[0][1], FrozenStep)
+    assert np.array_equal(frozen(data_inputs), p.transform(data_inputs))
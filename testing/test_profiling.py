@@ -0,0 +1,206 @@
+"""
+Tests for Profiling
+========================================
+
+..
+    Copyright 2019, Neuraxio Inc.
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+"""
+import json
+import os
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from neuraxle.base import BaseStep, NonFittableMixin
+from neuraxle.pipeline import Pipeline
+from neuraxle.profiling import Profiler
+from neuraxle.steps.numpy import MultiplyByN, AddN
+from neuraxle.union import FeatureUnion
+
+
+def create_profiled_pipeline(profiler, hashing=None, cache_folder='cache'):
+    p = Pipeline([
+        ('multiply', MultiplyByN(2)),
+        ('nested', Pipeline([
+            ('add', AddN(1))
+        ]))
+    ], cache_folder=cache_folder, hashing=hashing)
+    p.set_profiler(profiler)
+    return p
+
+
+def test_profiler_should_record_each_step_path():
+    profiler = Profiler()
+    p = create_profiled_pipeline(profiler)
+
+    p.transform(np.ones((10, 2)))
+    p.transform(np.ones((5, 2)))
+
+    paths = list(profiler.profiles.keys())
+    assert paths == [
+        'Pipeline',
+        os.path.join('Pipeline', 'multiply'),
+        os.path.join('Pipeline', 'nested'),
+        os.path.join('Pipeline', 'nested', 'add')
+    ]
+    add_profile = profiler.profiles[os.path.join('Pipeline', 'nested', 'add')]
+    assert add_profile.calls == 2
+    assert add_profile.rows_in == 15
+    assert add_profile.rows_out == 15
+    assert add_profile.wall_seconds > 0
+    assert add_profile.hashing_seconds == 0
+
+
+def test_profiler_should_not_prefix_step_paths_with_cache_folder(tmpdir):
+    profiler = Profiler()
+    p = create_profiled_pipeline(profiler, cache_folder=os.path.abspath(str(tmpdir)))
+
+    p.transform(np.ones((10, 2)))
+
+    assert list(profiler.profiles.keys())[0] == 'Pipeline'
+    assert profiler.to_collapsed_stacks()[0].startswith('Pipeline ')
+
+
+def test_profiler_should_record_hashing_time():
+    profiler = Profiler()
+    p = create_profiled_pipeline(profiler, hashing=True)
+
+    p.fit_transform(np.ones((10, 2)), np.ones((10, 2)))
+
+    multiply_profile = profiler.profiles[os.path.join('Pipeline', 'multiply')]
+    assert multiply_profile.hashing_seconds > 0
+    assert multiply_profile.user_seconds() == multiply_profile.wall_seconds - multiply_profile.hashing_seconds
+
+
+def test_profiler_should_export_nested_json_report():
+    profiler = Profiler()
+    p = create_profiled_pipeline(profiler)
+
+    p.transform(np.ones((10, 2)))
+
+    report = json.loads(profiler.to_json())
+    pipeline_report = report['Pipeline']
+    assert pipeline_report['calls'] == 1
+    assert pipeline_report['children']['nested']['children']['add']['rows_out'] == 10
+
+
+def test_profiler_should_export_collapsed_stacks(tmpdir):
+    profiler = Profiler()
+    p = create_profiled_pipeline(profiler)
+    p.transform(np.ones((10, 2)))
+    path = os.path.join(str(tmpdir), 'pipeline.folded')
+
+    profiler.save_collapsed_stacks(path)
+
+    with open(path) as file:
+        lines = file.read().splitlines()
+    stacks = [line.rsplit(' ', 1)[0] for line in lines]
+    assert stacks == ['Pipeline', 'Pipeline;multiply', 'Pipeline;nested', 'Pipeline;nested;add']
+    assert all(int(line.rsplit(' ', 1)[1]) >= 0 for line in lines)
+
+
+class AllocatingStep(NonFittableMixin, BaseStep):
+    def __init__(self, temporary_bytes, retained_bytes):
+        BaseStep.__init__(self)
+        NonFittableMixin.__init__(self)
+        self.temporary_bytes = temporary_bytes
+        self.retained_bytes = retained_bytes
+        self.retained = []
+
+    def transform(self, data_inputs):
+        temporary = np.ones(self.temporary_bytes, dtype=np.uint8)
+        self.retained.append(np.ones(self.retained_bytes, dtype=np.uint8))
+        del temporary
+        return np.ones((len(data_inputs), 1000), dtype=np.float64)
+
+
+def test_profiler_should_trace_memory_of_each_step():
+    profiler = Profiler(trace_memory=True)
+    p = Pipeline([
+        ('small', AllocatingStep(temporary_bytes=10 ** 5, retained_bytes=0)),
+        ('union', FeatureUnion([
+            ('big', AllocatingStep(temporary_bytes=10 ** 7, retained_bytes=10 ** 6))
+        ], n_jobs=1))
+    ])
+    p.set_profiler(profiler)
+
+    p.transform(np.ones((10, 2)))
+
+    assert not tracemalloc.is_tracing()
+
+    small_profile = profiler.profiles[os.path.join('Pipeline', 'small')]
+    big_profile = profiler.profiles[os.path.join('Pipeline', 'union', 'big')]
+    union_profile = profiler.profiles[os.path.join('Pipeline', 'union')]
+    assert 10 ** 5 <= small_profile.peak_bytes < 10 ** 7
+    assert big_profile.peak_bytes >= 10 ** 7
+    assert big_profile.retained_bytes >= 10 ** 6
+    assert union_profile.peak_bytes >= big_profile.peak_bytes
+    assert big_profile.output_bytes == 10 * 1000 * 8
+    assert 'peak_bytes' in json.loads(profiler.to_json())['Pipeline']
+
+
+def test_profiler_should_stop_the_memory_tracing_it_started_when_detached():
+    profiler = Profiler(trace_memory=True)
+    p = Pipeline([('small', AllocatingStep(temporary_bytes=10 ** 5, retained_bytes=0))])
+    p.set_profiler(profiler)
+    profiler.start('Pipeline', None)
+    assert tracemalloc.is_tracing()
+
+    p.set_profiler(None)
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiler_should_not_stop_the_memory_tracing_it_did_not_start():
+    profiler = Profiler(trace_memory=True)
+    p = Pipeline([('small', AllocatingStep(temporary_bytes=10 ** 5, retained_bytes=0))])
+    p.set_profiler(profiler)
+
+    tracemalloc.start()
+    try:
+        p.transform(np.ones((10, 2)))
+        p.set_profiler(None)
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+class RaisingStep(NonFittableMixin, BaseStep):
+    def __init__(self):
+        BaseStep.__init__(self)
+        NonFittableMixin.__init__(self)
+
+    def transform(self, data_inputs):
+        raise ValueError('failed')
+
+
+def test_profiler_should_pop_the_memory_frames_of_the_steps_that_raise():
+    profiler = Profiler(trace_memory=True)
+    p = Pipeline([
+        ('nested', Pipeline([
+            ('raising', RaisingStep())
+        ]))
+    ])
+    p.set_profiler(profiler)
+
+    with pytest.raises(ValueError):
+        p.transform(np.ones((10, 2)))
+
+    assert profiler._get_memory_frames() == []
+    assert not tracemalloc.is_tracing()
+    assert profiler.profiles[os.path.join('Pipeline', 'nested', 'raising')].calls == 1
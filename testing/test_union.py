@@ -1,9 +1,22 @@
+import copy
+import gc
+import os
+import pickle
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import pytest
+from sklearn.linear_model import Ridge
 
-from neuraxle.base import Identity
-from neuraxle.pipeline import Pipeline
-from neuraxle.steps.numpy import NumpyTranspose, NumpyConcatenateInnerFeatures
-from neuraxle.union import FeatureUnion
+import neuraxle.union
+from neuraxle.base import Identity, BaseStep, ExecutionContext, DataContainer, NonFittableMixin, ExecutionMode
+from neuraxle.pipeline import Pipeline, MiniBatchSequentialPipeline, Joiner
+from neuraxle.steps.numpy import NumpyTranspose, NumpyConcatenateInnerFeatures, MultiplyByN, AddN
+from neuraxle.steps.sklearn import SKLearnWrapper
+from neuraxle.union import FeatureUnion, ModelStacking, FrozenFeatureUnion, _SharedMemoryDataContainer, \
+    _handle_transform_in_shared_memory, _get_shared_memory_root
 
 
 def test_feature_union_should_transform_with_concatenate_inner_features():
@@ -62,3 +75,389 @@ def test_feature_union_should_fit_transform_with_numpy_transpose():
     p, outputs = p.fit_transform(data_inputs, expected_outputs)
 
     assert np.array_equal(outputs, np.array([data_inputs, data_inputs]).transpose())
+
+
+def test_model_stacking_freeze_should_transform_like_model_stacking():
+    p = Pipeline([
+        ModelStacking([
+            MultiplyByN(2),
+            AddN(1),
+        ], judge=SKLearnWrapper(Ridge()), joiner=NumpyConcatenateInnerFeatures(), n_jobs=1)
+    ])
+    data_inputs = np.array([[0., 1.], [2., 3.], [4., 5.]])
+    p = p.fit(data_inputs, data_inputs)
+
+    frozen = p.freeze()
+
+    assert isinstance(frozen.steps[0][1], FrozenFeatureUnion)
+    assert np.allclose(frozen(data_inputs), p.transform(data_inputs))
+
+
+class FitCountingStep(BaseStep):
+    def __init__(self, fits: list):
+        BaseStep.__init__(self)
+        self.fits = fits
+        self.mean = None
+
+    def fit(self, data_inputs, expected_outputs=None):
+        self.fits.append(1)
+        self.mean = np.mean(data_inputs)
+        return self
+
+    def transform(self, data_inputs):
+        return np.asarray(data_inputs) - self.mean
+
+
+def test_model_stacking_should_fit_each_base_step_once():
+    fits = []
+    p = Pipeline([
+        ModelStacking([FitCountingStep(fits), FitCountingStep(fits)], judge=Identity(), n_jobs=1)
+    ])
+    data_inputs = np.arange(6.).reshape(6, 1)
+
+    p, outputs = p.fit_transform(data_inputs, data_inputs)
+
+    assert len(fits) == 2
+    assert np.array_equal(outputs, np.concatenate([data_inputs - 2.5, data_inputs - 2.5], axis=-1))
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_model_stacking_should_fit_judge_on_out_of_fold_predictions(n_jobs):
+    p = Pipeline([
+        ModelStacking([FitCountingStep([]), AddN(1)], judge=Identity(), n_folds=3, n_jobs=n_jobs)
+    ])
+    data_inputs = np.arange(6.).reshape(6, 1)
+    train_means = np.array([3.5, 3.5, 2.5, 2.5, 1.5, 1.5]).reshape(6, 1)
+
+    p, outputs = p.fit_transform(data_inputs, data_inputs)
+    p.teardown()
+
+    assert np.array_equal(outputs, np.concatenate([data_inputs - train_means, data_inputs + 1], axis=-1))
+    assert np.array_equal(p.transform(data_inputs), np.concatenate([data_inputs - 2.5, data_inputs + 1], axis=-1))
+
+
+class FitRecordingJudge(NonFittableMixin, BaseStep):
+    def __init__(self):
+        BaseStep.__init__(self)
+        NonFittableMixin.__init__(self)
+        self.fitted_data_inputs = None
+
+    def fit(self, data_inputs, expected_outputs=None):
+        self.fitted_data_inputs = data_inputs
+        return self
+
+    def transform(self, data_inputs):
+        return data_inputs
+
+
+def test_model_stacking_fit_should_fit_judge_on_out_of_fold_predictions_and_base_steps_once():
+    fits = []
+    model_stacking = ModelStacking(
+        [FitCountingStep(fits), AddN(1)], judge=FitRecordingJudge(), n_folds=3, n_jobs=1)
+    data_inputs = np.arange(6.).reshape(6, 1)
+    train_means = np.array([3.5, 3.5, 2.5, 2.5, 1.5, 1.5]).reshape(6, 1)
+
+    model_stacking = model_stacking.fit(data_inputs, data_inputs)
+
+    assert np.array_equal(
+        model_stacking.judge.fitted_data_inputs,
+        np.concatenate([data_inputs - train_means, data_inputs + 1], axis=-1)
+    )
+    assert len(fits) == 1
+
+
+def test_model_stacking_should_need_at_least_2_folds():
+    with pytest.raises(ValueError):
+        ModelStacking([AddN(1)], judge=Identity(), n_folds=1)
+
+
+def _create_union_with_common_prefixes(fits: list, share_common_prefixes: bool) -> Pipeline:
+    return Pipeline([
+        FeatureUnion([
+            Pipeline([FitCountingStep(fits), MultiplyByN(2)]),
+            Pipeline([FitCountingStep(fits), MultiplyByN(2), AddN(1)]),
+            Pipeline([FitCountingStep(fits), AddN(3)]),
+            FitCountingStep(fits),
+        ], n_jobs=1, share_common_prefixes=share_common_prefixes)
+    ], hashing=True)
+
+
+def test_feature_union_should_fit_common_prefixes_once():
+    data_inputs = np.arange(12.).reshape(6, 2)
+    fits = []
+    shared_fits = []
+
+    p, outputs = _create_union_with_common_prefixes(fits, False).fit_transform(data_inputs, data_inputs)
+    shared_p, shared_outputs = _create_union_with_common_prefixes(shared_fits, True).fit_transform(
+        data_inputs, data_inputs)
+
+    assert len(fits) == 4
+    assert len(shared_fits) == 1
+    assert np.array_equal(shared_outputs, outputs)
+    assert np.array_equal(shared_p.transform(data_inputs), p.transform(data_inputs))
+
+
+def test_feature_union_should_not_share_steps_with_different_hyperparams():
+    data_inputs = np.arange(12.).reshape(6, 2)
+    p = Pipeline([
+        FeatureUnion([
+            Pipeline([MultiplyByN(2), AddN(1)]),
+            Pipeline([MultiplyByN(3), AddN(1)]),
+        ], n_jobs=1, share_common_prefixes=True)
+    ])
+
+    outputs = p.transform(data_inputs)
+
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2 + 1, data_inputs * 3 + 1], axis=-1))
+
+
+def test_feature_union_should_only_hash_the_states_of_the_steps_again_after_a_fit(monkeypatch):
+    import joblib
+    joblib_hash = joblib.hash
+    hashed_values = []
+
+    def counting_hash(value, *args, **kwargs):
+        hashed_values.append(value)
+        return joblib_hash(value, *args, **kwargs)
+
+    monkeypatch.setattr(joblib, 'hash', counting_hash)
+    data_inputs = np.arange(12.).reshape(6, 2)
+    p = Pipeline([
+        FeatureUnion([
+            Pipeline([MultiplyByN(2), AddN(1)]),
+            Pipeline([MultiplyByN(2), AddN(2)]),
+        ], n_jobs=1, share_common_prefixes=True)
+    ])
+
+    p.transform(data_inputs)
+    first_transform_hashes = len(hashed_values)
+    del hashed_values[:]
+    outputs = p.transform(data_inputs)
+    second_transform_hashes = len(hashed_values)
+    p = p.fit(data_inputs, data_inputs)
+    del hashed_values[:]
+    p.transform(data_inputs)
+
+    assert second_transform_hashes == first_transform_hashes // 2
+    assert len(hashed_values) == first_transform_hashes
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2 + 1, data_inputs * 2 + 2], axis=-1))
+
+
+def test_feature_union_should_reuse_its_worker_pool_until_teardown():
+    union = FeatureUnion([
+        Pipeline([MultiplyByN(2)]),
+        Pipeline([AddN(1)]),
+    ], n_jobs=2, backend='threading')
+    p = Pipeline([union])
+    data_inputs = np.arange(12.).reshape(6, 2)
+
+    outputs = p.transform(data_inputs)
+    pool = union._parallel
+    p.transform(data_inputs)
+
+    assert pool is not None
+    assert union._parallel is pool
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2, data_inputs + 1], axis=-1))
+
+    p.teardown()
+
+    assert union._parallel is None
+
+
+def test_feature_union_should_not_pickle_its_worker_pool():
+    union = FeatureUnion([MultiplyByN(2), AddN(1)], n_jobs=2, backend='threading')
+    data_inputs = np.arange(12.).reshape(6, 2)
+    union.transform(data_inputs)
+
+    unpickled_union = pickle.loads(pickle.dumps(union))
+
+    assert unpickled_union._parallel is None
+    assert np.array_equal(unpickled_union.transform(data_inputs), union.transform(data_inputs))
+    union.teardown()
+
+
+def test_feature_union_should_start_its_worker_pool_once_for_every_mini_batch_fit_transform(monkeypatch):
+    started_pools = []
+
+    class RecordingThreadPoolExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            ThreadPoolExecutor.__init__(self, *args, **kwargs)
+            started_pools.append(self)
+
+    monkeypatch.setattr(neuraxle.union, 'ThreadPoolExecutor', RecordingThreadPoolExecutor)
+    union = FeatureUnion([MultiplyByN(2), AddN(1)], n_jobs=2, backend='threading')
+    p = MiniBatchSequentialPipeline([union, Joiner(batch_size=2)])
+    data_inputs = np.arange(12.).reshape(6, 2)
+
+    p, outputs = p.fit_transform(data_inputs, data_inputs)
+    p.fit(data_inputs, data_inputs)
+
+    assert len(started_pools) == 1
+    assert union._parallel is started_pools[0]
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2, data_inputs + 1], axis=-1))
+
+    p.teardown()
+
+    assert union._parallel is None
+
+
+def test_feature_union_should_not_leak_worker_pools_across_deep_copies():
+    union = FeatureUnion([MultiplyByN(2), AddN(1)], n_jobs=2, backend='threading')
+    data_inputs = np.arange(12.).reshape(6, 2)
+    union.transform(data_inputs)
+    pool = union._parallel
+
+    union_copy = copy.deepcopy(union)
+    assert union_copy._parallel is None
+    union_copy.transform(data_inputs)
+    copy_pool = union_copy._parallel
+    del union_copy
+    gc.collect()
+
+    assert copy_pool is not pool
+    with pytest.raises(RuntimeError):
+        copy_pool.submit(int)
+    assert union._parallel is pool
+    union.teardown()
+
+
+def test_feature_union_should_send_large_inputs_to_processes_through_shared_memory(monkeypatch, tmpdir):
+    monkeypatch.setattr(neuraxle.union, 'SHARED_MEMORY_MIN_NBYTES', 0)
+    monkeypatch.setattr(neuraxle.union, '_SHARED_MEMORY_ROOT', str(tmpdir))
+    union = FeatureUnion([
+        Pipeline([MultiplyByN(2)]),
+        Pipeline([AddN(1)]),
+    ], n_jobs=2, backend='loky')
+    p = Pipeline([union])
+    data_inputs = np.arange(12.).reshape(6, 2)
+
+    p = p.fit(data_inputs, data_inputs)
+    outputs = p.transform(data_inputs)
+    p.teardown()
+
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2, data_inputs + 1], axis=-1))
+    assert os.listdir(str(tmpdir)) == []
+
+
+class _FullFolderStats:
+    f_frsize = 4096
+    f_bavail = 16
+
+
+def test_shared_memory_root_should_fall_back_to_the_temporary_folder_when_full(monkeypatch, tmpdir):
+    monkeypatch.setattr(neuraxle.union, '_SHARED_MEMORY_ROOT', str(tmpdir))
+    monkeypatch.setattr(os, 'statvfs', lambda path: _FullFolderStats())
+
+    assert _get_shared_memory_root(4096 * 16) == str(tmpdir)
+    assert _get_shared_memory_root(4096 * 16 + 1) == tempfile.gettempdir()
+
+
+def test_feature_union_should_fall_back_to_the_temporary_folder_when_shared_memory_write_fails(monkeypatch, tmpdir):
+    monkeypatch.setattr(neuraxle.union, 'SHARED_MEMORY_MIN_NBYTES', 0)
+    monkeypatch.setattr(neuraxle.union, '_SHARED_MEMORY_ROOT', str(tmpdir))
+    dump = _SharedMemoryDataContainer.dump
+    dump_folders = []
+
+    def dump_or_fail_in_shared_memory(data_container, folder, *args, **kwargs):
+        dump_folders.append(folder)
+        if folder.startswith(str(tmpdir)):
+            raise OSError(28, 'No space left on device')
+        return dump(data_container, folder, *args, **kwargs)
+
+    monkeypatch.setattr(_SharedMemoryDataContainer, 'dump', staticmethod(dump_or_fail_in_shared_memory))
+    union = FeatureUnion([MultiplyByN(2), AddN(1)], n_jobs=2, backend='loky')
+    data_inputs = np.arange(12.).reshape(6, 2)
+
+    data_container = union.handle_transform(DataContainer(current_ids=None, data_inputs=data_inputs), ExecutionContext())
+    union.teardown()
+
+    assert np.array_equal(data_container.data_inputs, np.concatenate([data_inputs * 2, data_inputs + 1], axis=-1))
+    assert dump_folders[0].startswith(str(tmpdir))
+    assert os.path.dirname(dump_folders[1]) == tempfile.gettempdir()
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_shared_memory_data_container_should_only_save_new_arrays(tmpdir):
+    data_inputs = np.arange(12.).reshape(6, 2)
+    shared_data_container = _SharedMemoryDataContainer.dump(
+        DataContainer(current_ids=None, data_inputs=data_inputs, expected_outputs=data_inputs),
+        str(tmpdir)
+    )
+
+    result = _handle_transform_in_shared_memory(MultiplyByN(2), shared_data_container, ExecutionContext())
+    loaded_result = result.load()
+
+    assert result.expected_outputs is shared_data_container.expected_outputs
+    assert result.data_inputs is not shared_data_container.data_inputs
+    assert len(os.listdir(str(tmpdir))) == 3
+    assert np.array_equal(loaded_result.data_inputs, data_inputs * 2)
+    assert np.array_equal(loaded_result.expected_outputs, data_inputs)
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_feature_union_should_join_in_preallocated_array(n_jobs):
+    union = FeatureUnion([
+        Pipeline([MultiplyByN(2)]),
+        Pipeline([AddN(1)]),
+    ], n_jobs=n_jobs, preallocate_join=True)
+    data_inputs = np.arange(12.).reshape(6, 2)
+
+    union, first_outputs = union.fit_transform(data_inputs)
+    outputs = union.transform(data_inputs[:3])
+    union.teardown()
+
+    assert union._join_widths == [2, 2]
+    assert np.array_equal(first_outputs, np.concatenate([data_inputs * 2, data_inputs + 1], axis=-1))
+    assert np.array_equal(outputs, np.concatenate([data_inputs[:3] * 2, data_inputs[:3] + 1], axis=-1))
+
+
+def test_feature_union_preallocated_join_should_record_new_widths_when_they_change():
+    union = FeatureUnion([MultiplyByN(2), AddN(1)], n_jobs=1, preallocate_join=True)
+
+    union.transform(np.arange(12.).reshape(6, 2))
+    data_inputs = np.arange(18).reshape(6, 3)
+    outputs = union.transform(data_inputs)
+
+    assert union._join_widths == [3, 3]
+    assert union._join_dtypes == [data_inputs.dtype, data_inputs.dtype]
+    assert np.array_equal(outputs, np.concatenate([data_inputs * 2, data_inputs + 1], axis=-1))
+
+
+def test_feature_union_preallocated_join_should_only_accept_inner_features_concatenation():
+    with pytest.raises(ValueError):
+        FeatureUnion([MultiplyByN(2), AddN(1)], joiner=NumpyTranspose(), preallocate_join=True)
+
+
+class SleepStep(NonFittableMixin, BaseStep):
+    def __init__(self, seconds: float, calls: list):
+        BaseStep.__init__(self)
+        self.seconds = seconds
+        self.calls = calls
+
+    def transform(self, data_inputs):
+        self.calls.append(self.name)
+        time.sleep(self.seconds)
+        return data_inputs
+
+
+def test_feature_union_should_dispatch_longest_branches_first():
+    calls = []
+    union = FeatureUnion([
+        ('fast', SleepStep(0.0, calls)),
+        ('slow', SleepStep(0.05, calls)),
+        ('medium', SleepStep(0.02, calls)),
+    ], n_jobs=1)
+    data_inputs = np.arange(6.).reshape(6, 1)
+    union.transform(data_inputs)
+    durations = union.get_branches_durations(ExecutionMode.TRANSFORM)
+
+    union.n_jobs = 2
+    del calls[:]
+    outputs = union.transform(data_inputs)
+    union.teardown()
+
+    assert list(durations.keys()) == ['fast', 'slow', 'medium']
+    assert durations['slow'] > durations['medium'] > durations['fast']
+    assert calls[-1] == 'fast'
+    assert np.array_equal(outputs, np.concatenate([data_inputs] * 3, axis=-1))
+    assert union._get_longest_first_order(['fast', 'slow', 'medium', 'new'], ExecutionMode.TRANSFORM) == [3, 1, 2, 0]